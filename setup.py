@@ -15,6 +15,7 @@ requires = [
     'zope.sqlalchemy',
     'waitress',
     'pyramid_beaker',
+    'numpy',
     'scipy',
     ]
 
@@ -42,5 +43,6 @@ setup(name='VexingArcanix',
       main = vexingarcanix:main
       [console_scripts]
       populate_VexingArcanix = vexingarcanix.scripts.populate:main
+      benchmark_find_cards = vexingarcanix.scripts.benchmark_find_cards:main
       """,
       )
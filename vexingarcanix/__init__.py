@@ -20,6 +20,7 @@ from pyramid.config import Configurator
 
 from sqlalchemy import engine_from_config
 from .models import DBSession
+from .lib import question_service, shared_tables
 
 def main(global_config, **settings):
     """ This function returns a Pyramid WSGI application.
@@ -29,6 +30,12 @@ def main(global_config, **settings):
     session_factory = session_factory_from_settings(settings)
     config = Configurator(settings=settings)
     config.set_session_factory(session_factory)
+    # Background question generation: see lib/question_service.py.
+    question_service.configure(int(settings.get('vexingarcanix.question_workers', 0)))
+    # Probability tables shared between server processes: see
+    # lib/shared_tables.py.
+    shared_tables.configure(settings.get('vexingarcanix.shared_tables', None),
+                            int(settings.get('vexingarcanix.shared_tables_size', 64 * 1024 * 1024)))
     # config = Configurator(session_factory=my_session_factory, settings=settings)
     config.add_static_view('static', 'static', cache_max_age=3600)
 
@@ -36,6 +43,8 @@ def main(global_config, **settings):
     config.add_route('give_deck', '/')
     # "Did I parse your deck list correctly?"
     config.add_route('check_deck', '/check')
+    # "Yes, that card's name was a typo for this one."
+    config.add_route('rename_card', '/rename')
     # "Okay, I'm asking you questions about your deck."
     config.add_route('show_question', '/ask')
     # "This is my answer to the question."
@@ -7,17 +7,50 @@
     game-specific data structures and questions.
 """
 
-import copy, operator, random, re
-from scipy.stats import hypergeom, mode
-from numpy import median
+import collections, copy, functools, hashlib, math, operator, random, re, threading, time
+import numpy
+from vexingarcanix.lib import cache, canonical, combinatorics, probability, shared_tables, simulation
+
+# The biggest deck we'll build tables for - each one is (copies + 1) by
+# (deck size + 1), and a "deck" of thousands of cards is a paste gone wrong.
+MAX_DECK_SIZE = 1000
+
+def hypergeometric_table(population, copies):
+    """ Builds a NumPy array `table` such that table[at_least, draws] is the
+        chance that at least `at_least` of `copies` copies of a card are among
+        the top `draws` cards of a `population`-card deck. One vectorized call
+        fills the whole thing, so after that every "how likely is it" question
+        about a card with that many copies is an index lookup.
+    """
+    if population > MAX_DECK_SIZE:
+        raise ValueError("{} cards is more than the {} we build tables for.".format(population, MAX_DECK_SIZE))
+    copies = min(copies, population)
+    at_least = numpy.arange(copies + 1)[:, None]
+    draws = numpy.arange(population + 1)[None, :]
+    # sf(k) is P(X > k), so "at least k" is sf(k - 1).
+    return numpy.nan_to_num(combinatorics.hypergeometric_sf(at_least - 1, population, copies, draws))
 
 class Deck(object):
     """ A Deck object represents the set of cards that the application is
         currently thinking about. Feed Deck objects to instances of Question to
         give the Question instance the information it needs to generate a question
         about that deck.
+
+        Anything expensive that we work out about a deck - probability
+        tables, joint distributions and so on - goes in `structures`, not on
+        the Deck: decks live in the session, which gets pickled on every
+        request, and the structures are the same for everyone with the same
+        cards anyway. See structure().
     """
 
+    # (Deck class, fingerprint, layout or None, name) -> structure, for
+    # recently seen decks.
+    structures = cache.LRUCache(2000)
+
+    # (population, copies) -> hypergeometric_table(), for every deck: the
+    # tables don't depend on anything else about the deck.
+    tables = cache.LRUCache(1000)
+
     def __init__(self, decklist):
         """ To initialize, caller needs to pass a list of Card objects. The
             deck should also know what game it's for. That information belongs
@@ -37,18 +70,130 @@ class Deck(object):
 
     game_name = None
 
+    def __getstate__(self):
+        # What's memoized on the deck itself (the fingerprint, the compact
+        # form) is cheap to rebuild, so it stays out of the session.
+        return dict((key, value) for key, value in self.__dict__.items() if not key.startswith('_'))
+
+    def structure(self, name, compute, per_card=False):
+        """ The structure called `name` (anything hashable) for this deck,
+            from `structures` if anybody with the same deck has needed it
+            lately, otherwise built with `compute()` - only ever when a
+            question actually asks for it.
+
+            The fingerprint doesn't care what order the cards were listed in
+            or how their names were typed, but anything with a row per card,
+            lined up with compact().names, does: pass `per_card` for those,
+            and they're only shared with decks with the same layout().
+        """
+        layout = self.layout() if per_card else None
+        return self.structures.get((type(self).__name__, self.fingerprint(), layout, name), compute)
+
+    def layout(self):
+        """ A short string that identifies compact().names - the deck's card
+            names as listed, in order. See structure()."""
+        if self.__dict__.get('_layout') is None:
+            names = u"\n".join(self.compact().names)
+            self._layout = hashlib.sha1(names.encode('utf-8')).hexdigest()
+        return self._layout
+
     def size(self):
         # How many cards are in the deck? (usually 60)
-        return sum([ card.count for card in self.decklist ])
+        return self.compact().size()
+
+    def fingerprint(self):
+        """ A short string that identifies what's in this deck: a hash of the
+            sorted (canonical name, count) pairs - see Card.canonical_name() -
+            so the same cards in the same
+            numbers get the same fingerprint whatever order they were listed
+            in, however they were capitalized, and whether or not a card was
+            listed twice. Anything we compute about a deck can be shared
+            between everyone with that fingerprint."""
+        if self.__dict__.get('_fingerprint') is None:
+            counts = collections.Counter()
+            for card in self.decklist:
+                counts[canonical_key(card.canonical_name())] += card.count
+            lines = [ u"{}\t{}".format(name, count) for name, count in sorted(counts.items()) ]
+            self._fingerprint = hashlib.sha1(u"\n".join(lines).encode('utf-8')).hexdigest()
+        return self._fingerprint
+
+    def compact(self):
+        """ The CompactDeck form of this deck, built once and then cached.
+            Treat it as read-only - call its copy() method before removing
+            cards from it.
+        """
+        if self.__dict__.get('_compact') is None:
+            self._compact = CompactDeck.from_decklist(self.decklist)
+        return self._compact
+
+    def remove_random(self, cards, keep=0, rng=None):
+        """ See CompactDeck.remove_random(). The deck itself is untouched."""
+        return self.compact().remove_random(cards, keep, rng)
+
+    def probability_table(self, copies, population=None):
+        """ The table from hypergeometric_table() for a card with `copies`
+            copies in this deck, covering every draw depth up to `population`
+            (which defaults to the size of the deck; pass something smaller
+            for questions about a deck that some cards have already left).
+            Built the first time any deck asks about a card with that many
+            copies, then kept in `tables` - and, if there's a shared table
+            store, shared with all of our server processes.
+        """
+        if population is None:
+            population = self.size()
+        # More copies than cards all come out the same.
+        copies = min(copies, population)
+        # Other server processes may well have built this one already.
+        return self.tables.get((population, copies), lambda: shared_tables.fetch_or_publish(
+            'hypergeometric/{}/{}'.format(population, copies), lambda: hypergeometric_table(population, copies)))
+
+    def chance_at_least(self, copies, draws, at_least=1, population=None):
+        """ How likely is it that at least `at_least` of `copies` copies of a
+            card are in the top `draws` cards? See probability_table()."""
+        return float(self.probability_table(copies, population)[at_least, draws])
+
+    def draws_for_chance(self, copies, chance, drawn=0):
+        """ How many cards do you need to draw to have at least `chance`
+            (0-1) of having found one of `copies` copies of a card, if none of
+            them were among the `drawn` cards you've already drawn? Row 1
+            of the probability table for the rest of the deck is exactly the
+            "at least one copy within d draws" curve, and it never decreases,
+            so this is a binary search over a cached array - and every
+            threshold reuses the same curve.
+        """
+        curve = self.probability_table(copies, self.size() - drawn)[1]
+        return int(numpy.searchsorted(curve, chance))
+
+    def joint_distribution(self, categories, draws):
+        """ See CompactDeck.joint_distribution(). Cached per set of
+            categories, so labels and card lists (not predicates, which get
+            resolved to card lists first) are the cache key."""
+        compact = self.compact()
+        key = (tuple([ (label, tuple(compact.category_indices(cards))) for label, cards in categories ]), draws)
+        return self.structure(('joint_distribution', key), lambda: compact.joint_distribution(categories, draws),
+                              per_card=True)
+
+    def simulate(self, predicate, **kwargs):
+        """ Monte Carlo estimate of how likely a predicate registered with
+            lib.simulation is to hold for this deck once it's shuffled - see
+            simulation.simulate() for the knobs. For questions that don't have
+            a closed form; use given() or joint_distribution() when one does.
+        """
+        return simulation.simulate(self.compact(), predicate, **kwargs)
+
+    def given(self, hand=None, played=None, removed=None, others=0):
+        """ A DeckState for this deck, given what we already know about where
+            some of its cards have gone."""
+        return DeckState(self, hand, played, removed, others)
 
     def mode_copies(self):
         # The mode of a list of numbers is the number most frequently
-        # occurring in that list. Note that SciPy's mode() returns the
-        # smallest such number in the case of a tie.
-        return int(mode([ card.count for card in self.decklist ])[0][0])
+        # occurring in that list. Note that, like SciPy's, our mode() returns
+        # the smallest such number in the case of a tie.
+        return combinatorics.mode([ card.count for card in self.decklist ])
 
     def median_copies(self):
-        return int(median([ card.count for card in self.decklist ]))
+        return int(combinatorics.median([ card.count for card in self.decklist ]))
 
     def unique_cards(self, decklist):
         # How many *distinct* cards in the deck? Remember special cases like
@@ -63,28 +208,351 @@ class Deck(object):
         raise NotImplementedError
 
 
+class CompactDeck(object):
+    """ An array-backed representation of a deck: a tuple of card names, a
+        dict mapping each name to its position in that tuple, and a NumPy
+        vector holding the number of copies of each card. Questions that take
+        cards out of a deck work on one of these instead of a deepcopy of a
+        list of Card objects - copying a CompactDeck copies one small array,
+        and the name list and index are shared between copies. Card objects
+        only get built (with card() or cards()) when a template wants them.
+    """
+
+    def __init__(self, names, counts, card_class=None, index=None):
+        self.names = tuple(names)
+        if index is None:
+            index = dict((name, i) for i, name in enumerate(self.names))
+        self.index = index
+        self.counts = numpy.array(counts, dtype=int)
+        self.card_class = card_class or Card
+        self._size = int(self.counts.sum())
+
+    @classmethod
+    def from_decklist(cls, decklist):
+        card_class = type(decklist[0]) if decklist else Card
+        return cls([ card.name for card in decklist ],
+                   [ card.count for card in decklist ],
+                   card_class)
+
+    def size(self):
+        return self._size
+
+    def count(self, name):
+        return int(self.counts[self.index[name]])
+
+    def copy(self):
+        return CompactDeck(self.names, self.counts, self.card_class, self.index)
+
+    def remove(self, name, copies=1):
+        """ Take `copies` copies of the card called `name` out of the deck."""
+        i = self.index[name]
+        if copies > self.counts[i]:
+            raise ValueError("Can't remove {} copies of {}: only {} left.".format(copies, name, self.counts[i]))
+        self.counts[i] -= copies
+        self._size -= copies
+
+    def remove_counts(self, removed):
+        """ Take a whole vector of copies out of the deck at once - `removed`
+            lines up with self.names."""
+        removed = numpy.asarray(removed, dtype=int)
+        if (removed > self.counts).any():
+            raise ValueError("Can't remove more copies of a card than the deck has.")
+        self.counts -= removed
+        self._size -= int(removed.sum())
+
+    def remove_random(self, cards, keep=0, rng=None):
+        """ Takes `cards` cards out of a copy of this deck at random, without
+            replacement, in one multivariate hypergeometric draw over the
+            count vector. `keep` is the number of copies of each card that has
+            to stay in the deck (so keep=1 means "never remove the last copy of
+            anything"). Returns a tuple of (vector of removed copies, lined up
+            with self.names; the reduced CompactDeck). This is the one place
+            questions of the "some cards have left your deck" variety should
+            get their cards removed.
+        """
+        rng = rng or numpy.random
+        available = numpy.maximum(self.counts - keep, 0)
+        if cards > available.sum():
+            raise ValueError("Can't remove {} cards: only {} are removable.".format(cards, available.sum()))
+        if hasattr(rng, 'multivariate_hypergeometric'):
+            # NumPy 1.18+ Generators have a sampler for exactly this.
+            removed = rng.multivariate_hypergeometric(available, cards)
+        else:
+            # Otherwise: lay out one entry per removable copy, pick `cards`
+            # of them, count how many of each card got picked.
+            pool = numpy.repeat(numpy.arange(len(available)), available)
+            picked = rng.choice(pool, cards, replace=False)
+            removed = numpy.bincount(picked, minlength=len(available))
+        reduced = self.copy()
+        reduced.remove_counts(removed)
+        return removed, reduced
+
+    def category_indices(self, cards):
+        """ Positions in self.names of a category of cards, which can be given
+            as a list of names or as a predicate that takes a Card object."""
+        if callable(cards):
+            return [ i for i, name in enumerate(self.names) if cards(self.card(name)) ]
+        return sorted(set([ self.index[name] for name, _ in _copies_of(cards) ]))
+
+    def joint_distribution(self, categories, draws):
+        """ A lib.probability.JointDistribution over how many cards from each
+            category end up among `draws` cards drawn from this deck.
+            `categories` is a list of (label, cards) pairs - see
+            category_indices() - and the categories can't overlap.
+        """
+        labels, sizes, seen = [], [], set()
+        for label, cards in categories:
+            indices = self.category_indices(cards)
+            if seen.intersection(indices):
+                raise ValueError("Category {} overlaps an earlier category.".format(label))
+            seen.update(indices)
+            labels.append(label)
+            sizes.append(int(self.counts[indices].sum()))
+        return probability.JointDistribution(labels, probability.joint_distribution(sizes, self.size(), draws))
+
+    def card(self, name):
+        return self.card_class(name, self.count(name))
+
+    def cards(self):
+        """ Card objects for every card that still has copies in the deck."""
+        return [ self.card_class(self.names[i], int(self.counts[i]))
+                 for i in numpy.flatnonzero(self.counts) ]
+
+
+def canonical_key(name):
+    """ The part of a card's name that identifies it: case and spacing don't
+        make two cards different."""
+    return u" ".join(name.split()).lower()
+
+
+def _copies_of(cards):
+    """ Lets callers name cards however is handiest: a single name, a list of
+        names (one entry per copy), or a dict of {name: copies}. Returns a
+        list of (name, copies) pairs."""
+    if not cards:
+        return []
+    if isinstance(cards, basestring):
+        return [(cards, 1)]
+    if isinstance(cards, dict):
+        return cards.items()
+    return [ (name, 1) for name in cards ]
+
+
+class DeckState(object):
+    """ What we know about a deck partway through a game: which cards are in
+        hand, which have been played, and which have otherwise left the deck
+        (discarded, milled, prized...). `others` is a number of cards that have
+        left the deck that we know aren't any of the cards we're going to ask
+        about - e.g. the other six cards of an opening hand that contains one
+        copy of Foo, when the question is about Foo.
+
+        Given that, chance() answers "at least/exactly/at most this many
+        copies of this card (or any of these cards) in the next N cards"
+        exactly, using the memoized combinatorics in lib.probability rather
+        than simulation.
+    """
+
+    def __init__(self, deck, hand=None, played=None, removed=None, others=0):
+        self.deck = deck.compact() if isinstance(deck, Deck) else deck
+        self.known = numpy.zeros(len(self.deck.names), dtype=int)
+        for cards in (hand, played, removed):
+            for name, copies in _copies_of(cards):
+                self.known[self.deck.index[name]] += copies
+        if (self.known > self.deck.counts).any():
+            raise ValueError("More copies of a card are known than the deck contains.")
+        self.others = others
+        self.remaining = self.deck.size() - int(self.known.sum()) - others
+        if self.remaining < 0:
+            raise ValueError("More cards are known than the deck contains.")
+
+    def copies_left(self, cards):
+        """ How many copies of these cards haven't been accounted for?"""
+        indices = list(set([ self.deck.index[name] for name, _ in _copies_of(cards) ]))
+        return int((self.deck.counts[indices] - self.known[indices]).sum())
+
+    def chance(self, cards, draws, at_least=None, exactly=None, at_most=None):
+        """ How likely is it that the next `draws` cards contain at least
+            `at_least` and at most `at_most` copies of `cards` (or `exactly`
+            that many)? Asks "at least one" if you don't say."""
+        if exactly is not None:
+            at_least = at_most = exactly
+        elif at_least is None and at_most is None:
+            at_least = 1
+        return probability.hypergeometric_range(self.remaining, self.copies_left(cards),
+                                                draws, at_least or 0, at_most)
+
+
+class _IntSpace(object):
+    """ Every whole number from bottom to top (inclusive) except `correct`,
+        without building a list of them."""
+
+    def __init__(self, correct, bottom, top):
+        self.bottom = bottom
+        self.top = max(top, bottom - 1)
+        self.skip = correct if bottom <= correct <= self.top else None
+
+    def __len__(self):
+        return self.top - self.bottom + 1 - (self.skip is not None)
+
+    def sample(self, count, rng=random):
+        picks = rng.sample(xrange(len(self)), count)
+        return [ self.bottom + i + (self.skip is not None and self.bottom + i >= self.skip) for i in picks ]
+
+
+class _PercentSpace(object):
+    """ Every percentage between bottom and top, to two decimal places, that
+        would make a fair wrong answer - i.e. leaving out anything within a
+        percentage point (or `margin`) of the correct answer. Works in hundredths of a percent so that it's two integer
+        ranges. Averages, which are also two-decimal numbers up to 100, use
+        it too, with a smaller margin."""
+
+    def __init__(self, correct, bottom, top, margin=1.0):
+        bottom = max(int(math.ceil(bottom * 100)), 1)
+        top = min(int(math.floor(top * 100)), 10000)
+        correct, margin = correct * 100, margin * 100
+        self.below = xrange(bottom, min(top, int(math.floor(correct - margin))) + 1)
+        self.above = xrange(max(bottom, int(math.ceil(correct + margin))), top + 1)
+
+    def __len__(self):
+        return len(self.below) + len(self.above)
+
+    def sample(self, count, rng=random):
+        picks = rng.sample(xrange(len(self)), count)
+        hundredths = [ self.below[i] if i < len(self.below) else self.above[i - len(self.below)] for i in picks ]
+        return [ "{:.2f}".format(h / 100.0) for h in hundredths ]
+
+
+class QuestionInfeasible(Exception):
+    """ Raised by a question that can't be asked about the deck it was given."""
+
+
+class QuestionTimeout(Exception):
+    """ Raised by Question.check_deadline() once a question has used up its
+        time budget."""
+
+
+class QuestionInfo(object):
+    """ What the scheduler knows about one kind of question: which game it's
+        for, how hard it is, whether a deck can support it, how often it
+        should come up relative to other questions, and - measured as we go -
+        how long it takes and how it's fared in Question.ask().
+    """
+
+    def __init__(self, name, game=None, difficulty='medium', feasible=None, weight=1.0):
+        self.name = name
+        self.game = game
+        self.difficulty = difficulty
+        self.feasible = feasible
+        self.weight = weight
+        # Seconds, as an exponential moving average, once we've timed it.
+        self.average_cost = None
+        self.runs = 0
+        # Counts of 'ok', 'over_budget', 'infeasible' and 'timeout'.
+        self.outcomes = collections.Counter()
+        self._lock = threading.Lock()
+
+    def is_feasible(self, deck):
+        return self.feasible is None or self.feasible(deck)
+
+    def record(self, outcome, cost=None):
+        with self._lock:
+            self.outcomes[outcome] += 1
+            if cost is not None:
+                self.runs += 1
+                if self.average_cost is None:
+                    self.average_cost = cost
+                else:
+                    self.average_cost += 0.2 * (cost - self.average_cost)
+        if outcome != 'ok':
+            print "Question {}: {}".format(self.name, outcome)
+
+
+def question(game=None, difficulty='medium', feasible=None, weight=1.0):
+    """ Decorator for question-generating methods. `feasible` is a function
+        that takes a Deck and says whether the question can be asked about it
+        at all; `weight` is how often the question should come up relative to
+        the others. This only marks the method - @register_questions on the
+        class is what puts it in the registry.
+    """
+    def mark(method):
+        method.question_info = dict(game=game, difficulty=difficulty, feasible=feasible, weight=weight)
+        return method
+    return mark
+
+def register_questions(cls):
+    """ Class decorator for Question and its subclasses: builds the class's
+        `registry` of {name: QuestionInfo} out of its parents' registries plus
+        its own @question methods. This happens once, when the module is
+        imported, and subclasses get a registry of their own rather than
+        appending to their parent's.
+    """
+    registry = {}
+    for parent in reversed(cls.__mro__[1:]):
+        registry.update(getattr(parent, 'registry', {}))
+    for name, member in vars(cls).items():
+        info = getattr(member, 'question_info', None)
+        if info is not None:
+            registry[name] = QuestionInfo(name, **info)
+    cls.registry = registry
+    cls.question_list = tuple(sorted(registry))
+    return cls
+
+
+def _can_deal(deck, cards=7):
+    # Whether the deck has enough cards for the hands, draws and Prizes that
+    # a question deals out - by default, just an opening hand.
+    return deck.size() >= cards
+
+def _is_second_copy_findable(card, deck, hand_size=7):
+    # Whether a hand can have exactly one copy of `card`, with the rest of the
+    # hand made up of other cards.
+    return 1 < card.count <= deck.size() - hand_size + 1
+
+def _has_second_copy_to_find(deck, hand_size=7, depth=5):
+    return (_can_deal(deck, hand_size + depth)
+            and any([ _is_second_copy_findable(card, deck, hand_size) for card in deck.decklist ]))
+
+def _has_card_to_dig_for(deck, hand_size=7):
+    # A card that the opening hand could miss entirely.
+    return any([ card.count <= deck.size() - hand_size for card in deck.decklist ])
+
+def _has_four_copy_counts(deck):
+    # Removing cards can only ever merge copy counts together, so if the full
+    # deck doesn't have four of them there's no point trying.
+    return len(numpy.unique(deck.compact().counts)) >= 4 and deck.size() - len(deck.decklist) >= 20
+
+
 class Card(object):
     """Each *distinct* card in a deck is represented by a Card object - how
     many copies of that card are in the deck, is stored in the `count` property
     of the Card instance. Cards have a .count property because we're not
-    interested in them outside the context of a deck. (?) """
-    def __init__(self, name, count):
+    interested in them outside the context of a deck. (?) Any `hints` from
+    the decklist - set code, collector number and so on, see lib/formats -
+    are kept in the `hints` property, for telling printings apart."""
+    def __init__(self, name, count, **hints):
         self.name = name
         self.count = int(count)
+        self.hints = hints
 
     def __str__(self):
         """A basic representation of the card."""
         return "{} copies of a card named {}".format(self.count, self.name)
 
-    def canonical_name(self, name):
+    # Which game's card names (see lib/canonical) this card's name is one of.
+    short_game_name = None
+
+    def canonical_name(self, name=None):
         """Use this to do things like strip off EX at the end of the name, turn
-        'Bob' into 'Dark Confidant', etc. """
-        raise NotImplementedError
+        'Bob' into 'Dark Confidant', etc. Returns `name` (by default, this
+        card's name) as the game knows it, or unchanged if we can't tell -
+        see lib/canonical."""
+        return canonical.resolve(self.short_game_name, name or self.name)
 
     def rules_text(self, name):
         raise NotImplementedError
 
 
+@register_questions
 class Question(object):
     """ A class that generates questions when we don't know any of the
         semantics of the game, and which indicates that the deck we're
@@ -92,10 +560,19 @@ class Question(object):
         subclass Question so they can grind out questions specific to that
         game. The superclass also holds the methods that let a Question
         instance introspect on itself and generate a question for the user to
-        answer. Ideally we'd use a registery/decorator for this so that there's
-        a list that automatically gets populated with questions, but
-        implementing that would be very time-consuming - so we're doing it the
-        dumb way for now.
+        answer. Question-generating methods are marked with the @question
+        decorator, and @register_questions on the class collects them (and
+        the ones it inherits) into the class's `registry`, which
+        choose_question() and ask() schedule from.
+
+        Nothing in here touches the global `random` module. Each instance
+        (i.e. each session) has its own random number generator, `rng`, seeded
+        from `seed`; ask() uses it to pick questions and to draw a fresh seed
+        for each question it asks, and the question runs with `random` and
+        `numpy_random` seeded from that. So the same seed gives the same stream
+        of questions (handy for reproducing a bad one), separate sessions never
+        share generator state between threads, and any question can be
+        rebuilt from just its name and seed - see replay().
 
         Question-generating methods should take as arguments only a Deck object
         and **kwargs, and should return a tuple of the form (string
@@ -106,97 +583,265 @@ class Question(object):
         lands" or "Psychic Pokemon" instead of a specific card.
     """
 
-    def __init__(self):
-        self.generic_questions = [
-            'copies_in_full_deck',
-            'copies_in_opening_hand',
-            'copies_in_top_five',
-            'most_likely_top_card',
-            # 'draws_until_copy',
-            ]
-        self.question_list = [] + self.generic_questions
-
-    def choose_question(self):
-        question = random.choice(self.question_list)
-        print "chosen question: {}".format(question)
-        return getattr(self, question)
-
+    def __init__(self, seed=None):
+        # How many times this instance (i.e. this session) has asked each
+        # question, so that choose_question() can keep the mix varied.
+        self.asked = collections.Counter()
+        self.reseed(seed)
+
+    def reseed(self, seed=None):
+        """ Starts this instance's stream of questions over from `seed` - or,
+            with no seed, from a random one. Either way, self.seed says what it
+            was."""
+        if seed is None:
+            seed = random.SystemRandom().getrandbits(32)
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.seed_question(self.rng.getrandbits(32))
+
+    def seed_question(self, seed):
+        """ Sets up the generators that question methods draw from - one for
+            Python's random module functions, one for NumPy's - for a
+            question with this seed."""
+        self.question_seed = seed
+        self.random = random.Random(seed)
+        self.numpy_random = numpy.random.RandomState(seed)
+
+    # Answers we've already worked out, shared by every Question instance in
+    # the process - see cached().
+    result_cache = cache.LRUCache(20000)
+
+    # How long, in seconds, a question gets before ask() gives up on it, and
+    # when the question that's running right now has to be done by.
+    time_budget = 0.5
+    deadline = None
+    # How often choose_question() gives a question that's been over budget
+    # another go anyway, since it may only have been slow while the machine
+    # was busy - a quick run or two brings its average back down.
+    slow_retry_chance = 0.05
+
+    def cached(self, deck, question, card, params, compute):
+        """ The result of `compute()` for this question about this card in
+            this deck with these parameters, from the shared result cache if
+            anyone has asked before. Lots of people upload the same decks, and
+            the expensive part of a question is working out the answer - so
+            that's what goes in here. Anything random about how the question is
+            presented (which card, which wrong answers, what order) must stay
+            outside it. `params` has to be hashable.
+        """
+        key = (deck.fingerprint(), question, canonical_key(card) if card else None, params)
+        return self.result_cache.get(key, compute)
+
+    def feasible_questions(self, deck):
+        """ The names of the registered questions that `deck` can support."""
+        feasible = []
+        for name, info in self.registry.items():
+            if info.is_feasible(deck):
+                feasible.append(name)
+            else:
+                info.record('infeasible')
+        return feasible
+
+    def choose_question(self, candidates=None, exclude=(), budget=None):
+        """ Weighted random choice among `candidates` (default: every
+            registered question). A question's chance of coming up is its
+            weight, divided by one more than the number of times this instance
+            has already asked it, so the mix stays balanced; questions that
+            have been measured to take longer than `budget` (default:
+            time_budget) on average only come up once in a while (see
+            slow_retry_chance). Returns the bound method, or None if nothing's
+            left.
+        """
+        budget = budget or self.time_budget
+        if candidates is None:
+            candidates = sorted(self.registry)
+        weighted = []
+        for name in candidates:
+            info = self.registry[name]
+            if name in exclude:
+                continue
+            if info.runs >= 3 and info.average_cost > budget:
+                if self.rng.random() >= self.slow_retry_chance:
+                    continue
+            weighted.append((info.weight / (1.0 + self.asked[name]), name))
+        if not weighted:
+            return None
+        pick = self.rng.uniform(0, sum([ weight for weight, _ in weighted ]))
+        for weight, name in weighted:
+            pick -= weight
+            if pick <= 0:
+                break
+        print "chosen question: {}".format(name)
+        return getattr(self, name)
+
+    def prepare(self, deck):
+        """ Builds what every question reads from, so that a batch of
+            questions pays for it once, up front: the compact form (and with
+            it the deck size). Everything else gets built when a question
+            first needs it - see Deck.structure().
+        """
+        deck.compact()
+
+    def ask_many(self, deck, count, budget=None, seed=None, with_origins=False):
+        """ Generates `count` questions about `deck` in one go, sharing the
+            work that doesn't change between them: the deck's cached
+            structures (see prepare()) and the feasibility checks. Returns a
+            list of question tuples. With `seed`, the batch starts from that
+            seed (see reseed()), so the same seed gets the same batch. With
+            `with_origins`, each question comes paired with the (name, seed)
+            that replay() can rebuild it from: ((name, seed), question).
+        """
+        if seed is not None:
+            self.reseed(seed)
+        self.prepare(deck)
+        candidates = self.feasible_questions(deck)
+        questions = []
+        for _ in xrange(count):
+            asked = self.ask(deck, budget, candidates)
+            questions.append((self.last_asked, asked) if with_origins else asked)
+        return questions
+
+    def ask(self, deck, budget=None, candidates=None):
+        """ Generates a question about `deck` the safe way: only considers
+            questions the deck can support, and falls back to another question
+            if the chosen one turns out to be infeasible after all
+            (QuestionInfeasible) or runs past its time budget (QuestionTimeout
+            - questions that loop should call check_deadline() as they go).
+            Every outcome and every run time gets recorded in the question's
+            QuestionInfo. Returns the usual question tuple.
+            `candidates` lets callers who already know which questions are
+            feasible skip re-checking. Afterwards, `last_asked` holds the
+            (name, seed) pair that replay() needs to rebuild the question.
+        """
+        budget = budget or self.time_budget
+        if candidates is None:
+            candidates = self.feasible_questions(deck)
+        tried = set()
+        while True:
+            chosen = self.choose_question(candidates, exclude=tried, budget=budget)
+            if chosen is None:
+                raise QuestionInfeasible("No question in {} works for this deck.".format(type(self).__name__))
+            name = chosen.__name__
+            tried.add(name)
+            info = self.registry[name]
+            self.seed_question(self.rng.getrandbits(32))
+            started = time.time()
+            self.deadline = started + budget
+            try:
+                result = chosen(deck)
+            except QuestionInfeasible:
+                info.record('infeasible')
+                continue
+            except QuestionTimeout:
+                info.record('timeout', time.time() - started)
+                continue
+            finally:
+                self.deadline = None
+            # It's done, so we may as well use it - but count it.
+            cost = time.time() - started
+            info.record('ok' if cost <= budget else 'over_budget', cost)
+            self.asked[name] += 1
+            self.last_asked = (name, self.question_seed)
+            return result
+
+    def replay(self, deck, name, seed):
+        """ The question that `name` asked about `deck` with this seed, asked
+            again - so a question can be stored, logged or passed around as
+            just (name, seed). Doesn't count towards the session's mix."""
+        self.seed_question(seed)
+        return getattr(self, name)(deck)
+
+    def check_deadline(self):
+        """ For questions with loops in them: call this every so often, and
+            ask() will move on to another question if this one's taking too
+            long."""
+        if self.deadline is not None and time.time() > self.deadline:
+            raise QuestionTimeout
+
+    @question(difficulty='easy', feasible=functools.partial(_can_deal, cards=1))
     def copies_in_full_deck(self, deck):
         # FUTURE: For specific games, the hard version of this question will
         # have the ability to pick a card that's _not_ in your deck, leading to
         # a situation where '0' is the correct answer.
         question_string = "How many copies of {card} are in your deck?"
         answer_suffix = "copies"
-        chosen_card = random.choice(deck.decklist)
+        chosen_card = self.random.choice(deck.decklist)
         correct = chosen_card.count
-        possible = self.gen_wrong(correct, 'int', 4, mode=deck.mode_copies(), median=deck.median_copies())
+        mode, median = self.cached(deck, 'copies_in_full_deck', None, (),
+                                   lambda: (deck.mode_copies(), deck.median_copies()))
+        possible = self.gen_wrong(correct, 'int', 4, mode=mode, median=median)
         possible.append(correct)
-        random.shuffle(possible)
+        self.random.shuffle(possible)
         return question_string.format(card=chosen_card.name), correct, possible, answer_suffix, chosen_card
 
+    @question(difficulty='medium', feasible=_can_deal)
     def copies_in_opening_hand(self, deck, hand_size=7):
         question_string = ("How likely is it that at least one copy of {card} "
                            "will be in your opening hand?")
         answer_suffix = 'percent'
-        chosen_card = random.choice(deck.decklist)
-        copies = chosen_card.count
-        # TODO: replace with Deck object's .size property.
-        deck_size = sum([ c.count for c in deck.decklist ])
-
-        opening_hand_chance = hypergeom.sf(1, deck_size, copies, hand_size)
-        # Consult docs or Stack Overflow: what's that first parameter mean
-        # again? Thank goodness I gave the rest meaningful variable names.
-        # http://docs.scipy.org/doc/scipy/reference/generated/scipy.stats.hypergeom.html
-        # See also: http://stackoverflow.com/q/11286430/244494
-
+        chosen_card = self.random.choice(deck.decklist)
+        opening_hand_chance = self.cached(deck, 'copies_in_opening_hand', chosen_card.name, (hand_size,),
+                                          lambda: deck.chance_at_least(chosen_card.count, hand_size))
         opening_hand_chance = opening_hand_chance * 100
         correct_string = "{:.2f}".format(opening_hand_chance)
 
         wrongs = self.gen_wrong(opening_hand_chance, 'percent', 4)
         possible = wrongs + [correct_string]
-        random.shuffle(possible)
+        self.random.shuffle(possible)
 
         print "Chance of a copy of {} in opening hand: {}".format(chosen_card.name, correct_string)
         return question_string.format(card=chosen_card.name), correct_string, possible, answer_suffix, chosen_card
 
-    def copies_in_top_five(self, deck):
-        """ Another difficult question - but also somewhat difficult to code,
-            since it requires that we pick a bunch of cards that have already
-            left the deck. Well, it would require that for the serious
-            version. For this version - just use a scalar! "copies in top N"
-            can come later.
+    @question(difficulty='hard', feasible=_has_second_copy_to_find)
+    def copies_in_top_five(self, deck, hand_size=7, depth=5):
+        """ Another difficult question - how likely is another copy of a card
+            you've already drawn to be close to the top of your deck? The
+            hand's other cards aren't copies of the chosen card, so they go
+            into DeckState as `others`.
         """
-        question_string = ("After drawing your 7-card opening hand with one "
-                           "copy of {card}, how likely is it that at least "
-                           "one more copy of {card} is in the top five cards "
-                           "of your deck?")
+        question_string = ("After drawing your {hand_size}-card opening hand "
+                           "with one copy of {card}, how likely is it that at "
+                           "least one more copy of {card} is in the top "
+                           "{depth} cards of your deck?")
         answer_suffix = 'percent'
-        chosen_card = random.choice([ card for card in deck.decklist if card.count > 1 ])
-        remaining_copies = chosen_card.count - 1
-        remaining_deck = sum([c.count for c in deck.decklist]) - 7
-        in_top_five_chance = hypergeom.sf(1, remaining_deck, remaining_copies, 5)
+        candidates = [ card for card in deck.decklist if _is_second_copy_findable(card, deck, hand_size) ]
+        if not candidates:
+            raise QuestionInfeasible("No card can be in the hand exactly once.")
+        chosen_card = self.random.choice(candidates)
+        def compute():
+            state = deck.given(hand={chosen_card.name: 1}, others=hand_size - 1)
+            return state.chance(chosen_card.name, depth, at_least=1)
+        in_top_five_chance = self.cached(deck, 'copies_in_top_five', chosen_card.name, (hand_size, depth), compute)
         in_top_five_chance = in_top_five_chance * 100
         correct_string = "{:.2f}".format(in_top_five_chance)
         wrongs = self.gen_wrong(in_top_five_chance, 'percent', 4)
         possible = wrongs + [correct_string]
-        random.shuffle(possible)
+        self.random.shuffle(possible)
 
-        print "Chance of a copy of {} in the next five cards: {}".format(chosen_card.name, correct_string)
-        return question_string.format(card=chosen_card.name), correct_string, possible, answer_suffix, chosen_card
+        print "Chance of a copy of {} in the next {} cards: {}".format(chosen_card.name, depth, correct_string)
+        return question_string.format(card=chosen_card.name, hand_size=hand_size, depth=depth), correct_string, possible, answer_suffix, chosen_card
 
-    def average_draws_until_copy(self, deck, opening_hand=7):
-        """ This will, once implemented, be our new flagbearer hard question -
-            it's also the one that requires the most semantic deck knowledge of the
-            generic questions. Which is to say, "any."
+    @question(difficulty='hard', feasible=_has_card_to_dig_for)
+    def average_draws_until_copy(self, deck, opening_hand=7, threshold=90):
+        """ Our flagbearer hard question - and the one that requires the most
+            semantic deck knowledge of the generic questions. Which is to say,
+            "any." Deck.draws_for_chance() does the work.
         """
         question_string = ("If your opening hand contains zero copies of "
                            "{card}, how many cards do you have to draw in order "
-                           "to have at least a 90 percent chance that a copy of "
-                           "{card} is among them?")
-        chosen_card = random.choice(deck.decklist)
+                           "to have at least a {threshold} percent chance that a "
+                           "copy of {card} is among them?")
         answer_suffix = 'cards'
-        raise NotImplementedError
+        remaining_deck = deck.size() - opening_hand
+        chosen_card = self.random.choice([ card for card in deck.decklist if card.count <= remaining_deck ])
+        correct = self.cached(deck, 'average_draws_until_copy', chosen_card.name, (opening_hand, threshold),
+                              lambda: deck.draws_for_chance(chosen_card.count, threshold / 100.0, drawn=opening_hand))
+        possible = self.gen_wrong(correct, 'int', 4, answer_ceiling=remaining_deck)
+        possible.append(correct)
+        self.random.shuffle(possible)
+        return question_string.format(card=chosen_card.name, threshold=threshold), correct, possible, answer_suffix, chosen_card
 
+    @question(difficulty='medium', feasible=_has_four_copy_counts)
     def most_likely_top_card(self, deck):
         """ A medium-difficulty question - removes 10-20 random cards from your
             deck, then asks which of four options the top card of your deck is
@@ -204,36 +849,24 @@ class Question(object):
             implement in a game-agnostic way, so it's here instead of in
             game-specific code.
 
-            KNOWN BUG: will break on decks with too few unique cards or where
-            too few cards have at least 2 copies in the deck. However, still
-            works on 95% of MTG/Pokemon decks.
+            Needs four cards with different numbers of copies left after the
+            removal, so that there are no ties; raises QuestionInfeasible if
+            the removal didn't leave that. See also _has_four_copy_counts().
+            This is the one question that doesn't go through cached(): the
+            random removal is part of the question, not its presentation.
         """
         question_string = ("If {}have been removed from your deck, which of "
                            "the following cards is most likely to be the top "
                            "card of your deck?")
         answer_suffix = "is most likely to be the top card"
-        reduced_deck = copy.deepcopy(deck)
-
-        cards_to_remove = random.choice(range(10,21))
+        cards_to_remove = self.random.choice(range(10,21))
         print "Chose to remove {} cards".format(cards_to_remove)
-        removed_cards = {}
-        # TODO: Many questions are going to want to remove cards from the deck:
-        #       this chunk should probably be pulled out into its own function
-        #       so it can be easily re-used.
-        while sum([ removed_cards[key] for key in removed_cards.keys() ]) < cards_to_remove:
-            drawn_card = random.choice([ card for card in reduced_deck.decklist if card.count > 1 ])
-            print "Removed a copy of {} from the deck.".format(drawn_card.name)
-            drawn_card.count -= 1
-            print "{} cards remain in the deck.".format(sum([ card.count for card in reduced_deck.decklist ]))
-            # if the card is in the group we've already removed, just
-            # increment, otherwise add to that set.
-            if drawn_card.name in [ c for c in removed_cards.keys()]:
-                removed_cards[drawn_card.name] += 1
-            else:
-                removed_cards[drawn_card.name] = 1
+        # Leave at least one copy of everything, so that every card in the
+        # deck is still a possible answer.
+        removed, reduced_deck = deck.remove_random(cards_to_remove, keep=1, rng=self.numpy_random)
+        removed_cards = dict((reduced_deck.names[i], int(removed[i])) for i in numpy.flatnonzero(removed))
         print "Removed: {}".format(removed_cards)
-        # TODO: replace with Deck object's .size property.
-        reduced_deck_size = sum([ card.count for card in reduced_deck.decklist ])
+        reduced_deck_size = reduced_deck.size()
 
         removed_cards_string = ""
         for key in removed_cards.keys():
@@ -242,30 +875,19 @@ class Question(object):
             if len(removed_cards.keys()) == 0:
                 removed_cards_string += "and "
             removed_cards_string += "{0} {1} of {2}, ".format(c, copy_plural, key)
-        print removed_cards_string
         print question_string.format(removed_cards_string)
 
         choices = 4
-        chosen_cards = []
-        print "The deck is now: {}".format(reduced_deck.decklist)
-        while len(chosen_cards) < choices:
-            # TODO: Rewrite this with list.pop() so that we don't just pull the
-            # same thing over and over?
-            this_card = random.choice(reduced_deck.decklist)
-            print "Chose: {}".format(this_card.name)
-            # Second test is so that we don't have to deal with ties - however,
-            # now we just have to make sure that there are at least 4 different
-            # card counts remaining in the deck, which should be the norm - but
-            # it's not guaranteed!
-            if (this_card not in chosen_cards) and (this_card.count not in [ card.count for card in chosen_cards ]):
-                chosen_cards.append(this_card)
-                print "List now contains: {}".format([ card.name for card in chosen_cards ])
-
-        card_odds_pairings = []
-        for card in chosen_cards:
-            # top_card_odds = hypergeom.sf(1, reduced_deck_size, card.count, 1)
-            top_card_odds = card.count / float(reduced_deck_size)
-            card_odds_pairings.append((top_card_odds, card.name))
+        # One card for each of four different copy counts, so that we don't
+        # have to deal with ties.
+        remaining_counts = numpy.unique(reduced_deck.counts)
+        if len(remaining_counts) < choices:
+            raise QuestionInfeasible("Only {} different copy counts left in the deck.".format(len(remaining_counts)))
+        chosen_counts = self.random.sample(remaining_counts.tolist(), choices)
+        chosen_indices = [ self.random.choice(numpy.flatnonzero(reduced_deck.counts == c)) for c in chosen_counts ]
+
+        top_card_odds = reduced_deck.counts[chosen_indices] / float(reduced_deck_size)
+        card_odds_pairings = zip(top_card_odds.tolist(), [ reduced_deck.names[i] for i in chosen_indices ])
         sorted_odds_pairings = sorted(card_odds_pairings, key=operator.itemgetter(0))
         print "Cards with odds: {}".format(sorted_odds_pairings)
 
@@ -283,7 +905,7 @@ class Question(object):
             answer. Requires as arguments:
 
             * The correct answer
-            * The type of wrong answer desired (int or percent)
+            * The type of wrong answer desired (int, percent or average)
             * How many wrong answers the caller needs
             * The largest plausible answer to the question
             * Keyword arguments to be passed to the specific function
@@ -300,29 +922,32 @@ class Question(object):
             quite the same as 'how likely is it that two copies of this card
             start the game as Prizes?'
         """
-        wrongness_validator = None
-        wrongness_generator = None
         if flavor is 'percent':
-            wrongness_generator = self._gen_wrong_percent
-            wrongness_validator = self._validate_wrong_percent
-        if flavor is 'int':
-            wrongness_generator = self._gen_wrong_int
-            wrongness_validator = self._validate_wrong_int
-        if not wrongness_validator or not wrongness_generator:
+            candidate_spaces = self._wrong_percent_spaces
+        elif flavor is 'int':
+            candidate_spaces = self._wrong_int_spaces
+        elif flavor is 'average':
+            candidate_spaces = self._wrong_average_spaces
+        else:
             raise NotImplementedError
 
-        generated_answers = []
-        while len(generated_answers) < count:
-            candidate = wrongness_generator(correct, **kwargs)
-            viable = wrongness_validator(candidate, correct, **kwargs)
-            if viable and (candidate not in generated_answers):
-                generated_answers.append(viable)
-        return generated_answers
-
-    def _gen_wrong_percent(self, correct, **kwargs):
-        """ Generate a wrong answer for "how likely is it" questions, which
-            need a 0-100 percentage as an answer. This function requires that
-            the 'correct' parameter already be a float in the 0-100 range."""
+        # Rather than drawing candidates until enough of them pass
+        # validation (which near 0% or 100%, or with a low answer_ceiling,
+        # could take forever), lay out every acceptable wrong answer once and
+        # sample from that. The first space is the plausible one; if it's too
+        # small to supply `count` answers, the second is as wide as the
+        # question allows. If even that's too small, you get every wrong
+        # answer there is - possibly fewer than `count`. Either way it's at
+        # most two spaces and one sample.
+        for space in candidate_spaces(correct, **kwargs):
+            if len(space) >= count:
+                break
+        return space.sample(min(count, len(space)), self.random)
+
+    def _wrong_percent_spaces(self, correct, **kwargs):
+        """ Candidate spaces for "how likely is it" questions, which need a
+            0-100 percentage as an answer. This function requires that the
+            'correct' parameter already be a float in the 0-100 range."""
         # Lower variance will make the question harder - it's a kwarg instead
         # of a required parameter so that it's easier on our callers.
         variance = kwargs.get('variance', 3.0)
@@ -331,45 +956,30 @@ class Question(object):
         # possibility space a bit.
         top = max(correct * variance, 10.0)
         bottom = max(correct / variance, 1.0)
-        candidate = random.uniform(bottom, top)
-        return candidate
-
-    def _validate_wrong_percent(self, candidate, correct, **kwargs):
-        """ Scrutinize a wrong answer and return its string representation if
-            it's acceptable, or None if it's unacceptable. String
-            representation truncates to 2 decimal places so that it's
-            human-readable (and avoids problems with the limits of
-            floating-point precision). """
-        if candidate > 100.0 or candidate < 0.01:
-            return None
-        # Eliminate wrong answers that make the question too hard.
-        if (candidate > correct - 1.0) and (candidate < correct + 1.0):
-            # This also covers the candidate == correct case.
-            return None
-        return "{:.2f}".format(candidate)
-
-    def _gen_wrong_int(self, correct, **kwargs):
+        yield _PercentSpace(correct, bottom, top)
+        yield _PercentSpace(correct, 0.01, 100.0)
+
+    def _wrong_average_spaces(self, correct, **kwargs):
+        """ Candidate spaces for "on average, how many" questions: numbers to
+            two decimal places, no more than `answer_ceiling` (say, the hand
+            size), and at least a quarter of a card away from the correct
+            answer."""
+        answer_ceiling = kwargs.get('answer_ceiling', 100.0)
+        yield _PercentSpace(correct, max(correct - 2.0, 0.01), min(correct + 2.0, answer_ceiling), margin=0.25)
+        yield _PercentSpace(correct, 0.01, answer_ceiling, margin=0.25)
+
+    def _wrong_int_spaces(self, correct, **kwargs):
         # This function should know that if you pass a 'mode' argument, that
         # the mode is relevant - how does it use that information? Should it be
         # 'biased' towards picking something close to the mode?
-        mode = kwargs.get('mode', None)
         variance = kwargs.get('variance', 2)
         answer_ceiling = kwargs.get('answer_ceiling', None)
         if answer_ceiling:
-            top = max(correct * variance, answer_ceiling)
+            top = min(max(correct * variance, answer_ceiling) - 1, answer_ceiling)
+            widest = answer_ceiling
         else:
-            top = correct * variance
+            top = correct * variance - 1
+            widest = max(top, correct + 4)
         bottom = max(1, correct / variance)
-        candidate = random.choice(range(bottom, top))
-        return candidate
-
-    def _validate_wrong_int(self, candidate, correct, **kwargs):
-        """ Takes a wrong answer, considers whether it's suitable, returns the
-            string representation of the 'candidate' parameter if so, otherwise
-            returns None."""
-        if candidate == correct:
-            return None
-        answer_ceiling = kwargs.get('answer_ceiling', None)
-        if answer_ceiling and (candidate > answer_ceiling):
-            return None
-        return candidate
+        yield _IntSpace(correct, bottom, top)
+        yield _IntSpace(correct, 1, widest)
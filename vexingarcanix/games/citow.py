@@ -25,7 +25,7 @@ class CITOWCard(Card):
     """card"""
     def __init__(self, name, count, **hints):
         # Later we'll use the **hints dict to help disambiguate cards.
-        super(CITOWCard, self).__init__(name, count)
+        super(CITOWCard, self).__init__(name, count, **hints)
 
 
 class CITOWQuestion(Question):
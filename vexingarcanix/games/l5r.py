@@ -23,9 +23,11 @@ class L5RDeck(Deck):
 
 class L5RCard(Card):
     """card"""
+    short_game_name = "l5r"
+
     def __init__(self, name, count, **hints):
         # Later we'll use the **hints dict to help disambiguate cards.
-        super(L5RCard, self).__init__(name, count)
+        super(L5RCard, self).__init__(name, count, **hints)
 
 
 class L5RQuestion(Question):
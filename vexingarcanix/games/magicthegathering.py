@@ -3,7 +3,9 @@
     to be getting the most attention.
 """
 
-from vexingarcanix.games.base import Deck, Card, Question
+from vexingarcanix.games.base import Deck, Card, Question, question, register_questions
+from vexingarcanix.lib import canonical
+import functools
 import re
 
 class MTGDeck(Deck):
@@ -57,12 +59,11 @@ class MTGCard(Card):
         properties.
     """
 
+    short_game_name = "magicthegathering"
+
     def __init__(self, name, count, **hints):
         # Later we'll use the **hints dict to help disambiguate cards.
-        super(MTGCard, self).__init__(name, count)
-
-    def canonical_name(self):
-        pass
+        super(MTGCard, self).__init__(name, count, **hints)
 
     def is_basic_land(self):
         basics = ['plains', 'island', 'swamp', 'mountain', 'forest', 'snow-covered plains', 'snow-covered island', 'snow-covered swamp', 'snow-covered mountain', 'snow-covered forest']
@@ -97,19 +98,22 @@ class MTGCard(Card):
         raise NotImplementedError
 
 
+def _has_basics_and_spells(deck, cards=7):
+    # `cards` is how deep into the deck the question looks.
+    basics = [ card.is_basic_land() for card in deck.decklist ]
+    return deck.size() >= cards and any(basics) and not all(basics)
+
+
+@register_questions
 class MTGQuestion(Question):
     """Questions are important: without them, answers are meaningless."""
-    def __init__(self):
-        super(MTGQuestion, self).__init__()
-        self.question_list = self.generic_questions
-        self.question_list += ['basics_count',
-                               #'basic_in_next_n',
-                               ]
+    # TODO: basic_in_next_n
 
+    @question(game='magicthegathering', difficulty='easy')
     def basics_count(self, deck):
         question_string = "How many basic lands are in your deck?"
         answer_suffix = "basic lands"
-        correct = count = deck.basic_land_count()
+        correct = count = self.cached(deck, 'basics_count', None, (), deck.basic_land_count)
         if count < 5:
             possible = range(0, 5)
         else:
@@ -119,6 +123,64 @@ class MTGQuestion(Question):
         # ... but we're still in MVP mode.
         return question_string, correct, possible, answer_suffix, "basic lands"
 
+    @question(game='magicthegathering', difficulty='medium', feasible=_has_basics_and_spells)
+    def basics_and_card_in_opening(self, deck, hand_size=7):
+        """ Mana and a spell to cast with it: both at once, so this one reads
+            off a joint distribution instead of multiplying two chances
+            together (which would be wrong - they aren't independent)."""
+        question_string = ("How likely is it that your opening hand has "
+                           "between {low} and {high} basic lands and at least "
+                           "one copy of {card}?")
+        answer_suffix = 'percent'
+        low, high = 2, 4
+        chosen_card = self.random.choice([ card for card in deck.decklist if not card.is_basic_land() ])
+        def compute():
+            hands = deck.joint_distribution([ ('basics', lambda card: card.is_basic_land()),
+                                              ('card', [chosen_card.name]), ],
+                                            hand_size)
+            return hands.chance({'basics': (low, high), 'card': 1})
+        chance = self.cached(deck, 'basics_and_card_in_opening', chosen_card.name, (hand_size, low, high), compute) * 100
+        correct_string = "{:.2f}".format(chance)
+        possible = self.gen_wrong(chance, 'percent', 4) + [correct_string]
+        self.random.shuffle(possible)
+        return question_string.format(low=low, high=high, card=chosen_card.name), correct_string, possible, answer_suffix, chosen_card
+
+    @question(game='magicthegathering', difficulty='hard', feasible=functools.partial(_has_basics_and_spells, cards=20))
+    def basic_land_drought(self, deck, depth=20):
+        """ Droughts depend on the order the lands turn up in, not just on how
+            many there are, so there's no tidy formula for this one: it's
+            simulated - see lib.simulation.gap_of_at_least(). With a fixed
+            seed, so that asking again gets the same answer."""
+        question_string = ("How likely is it that the top {depth} cards of your "
+                           "deck include {gap} or more cards in a row without a "
+                           "basic land?")
+        answer_suffix = 'percent'
+        gap = self.random.choice(range(4, 9))
+        basics = [ card.name for card in deck.decklist if card.is_basic_land() ]
+        estimate = self.cached(deck, 'basic_land_drought', None, (depth, gap),
+                               lambda: deck.simulate('gap_of_at_least', cards=basics, depth=depth, gap=gap, seed=0,
+                                                     between_batches=self.check_deadline))
+        chance = estimate.probability * 100
+        correct_string = "{:.2f}".format(chance)
+        possible = self.gen_wrong(chance, 'percent', 4) + [correct_string]
+        self.random.shuffle(possible)
+        print "Chance of {} cards in a row without a basic land: {}".format(gap, correct_string)
+        return question_string.format(depth=depth, gap=gap), correct_string, possible, answer_suffix, "basic lands"
+
 
     def basic_in_next_n(self, deck, depth=None):
         raise NotImplementedError
+
+
+# The card names we know so far, and what people call some cards - see
+# lib/canonical. A card catalog will add the rest.
+canonical.register_names('magicthegathering',
+                         [ u'Plains', u'Island', u'Swamp', u'Mountain', u'Forest',
+                           u'Snow-Covered Plains', u'Snow-Covered Island', u'Snow-Covered Swamp',
+                           u'Snow-Covered Mountain', u'Snow-Covered Forest', u'Relentless Rats', ],
+                         { u'Jace TMS': u'Jace, the Mind Sculptor',
+                           u'JTMS': u'Jace, the Mind Sculptor',
+                           u'Bob': u'Dark Confidant',
+                           u'Goyf': u'Tarmogoyf',
+                           u'Snapcaster': u'Snapcaster Mage',
+                           u'Snowcovered Forest': u'Snow-Covered Forest', })
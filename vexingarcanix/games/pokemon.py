@@ -5,8 +5,15 @@
     (i.e. backslash-u 03b4).
 """
 
-import re
-from vexingarcanix.games.base import Deck, Card, Question
+import collections, csv, os, re
+import numpy
+from vexingarcanix.games.base import Deck, Card, Question, canonical_key, question, register_questions
+from vexingarcanix.lib import cache, canonical, probability
+
+# One way of evolving up to a Pokemon in the deck: for each stage, Basic
+# first, the names of the deck's cards of that species, and how many copies
+# of them there are between them.
+EvolutionLine = collections.namedtuple('EvolutionLine', ['names', 'copies'])
 
 class PokemonDeck(Deck):
     def __init__(self, decklist, **kwargs):
@@ -14,6 +21,7 @@ class PokemonDeck(Deck):
         self.short_game_name = "pokemon"
         self.max_copies = 4
         self.opening_hand = 7
+        self.prizes = 6
         self.max_copies_exempt = ['Darkness Energy','Fighting Energy','Fire Energy','Grass Energy','Lightning Energy','Metal Energy','Psychic Energy', 'Water Energy', 'Arceus']
 
     game_name = u"Pok\xe9mon"
@@ -22,59 +30,142 @@ class PokemonDeck(Deck):
         """Should only be mildly tricky."""
         formats = ['standard', 'unlimited', ]
 
+    def basic_pokemon(self):
+        """ A boolean array, lined up with compact().names, saying which of
+            the deck's cards are Basic Pokemon - the cards an opening hand has
+            to have one of."""
+        compact = self.compact()
+        return self.structure('basic_pokemon', lambda: numpy.array(
+            [ compact.card(name)._is_basic_pokemon(name) for name in compact.names ], dtype=bool), per_card=True)
+
+    def prize_table(self):
+        """ probability.hand_and_prize_tables() for this deck: T[i, h, p] is
+            the chance that the opening hand (redrawn until it has a Basic)
+            has exactly h copies of compact().names[i] and exactly p of them
+            are among the Prize cards. One call covers every card in the deck;
+            it's built when a question first needs it.
+        """
+        compact = self.compact()
+        return self.structure(('prize_table', self.opening_hand, self.prizes), lambda:
+                              probability.hand_and_prize_tables(compact.counts, self.basic_pokemon(), compact.size(),
+                                                                self.opening_hand, self.prizes), per_card=True)
+
+    def energy_classes(self):
+        """ classify_energy() for every card in the deck at once, as a NumPy
+            array lined up with compact().names. Built once per deck."""
+        compact = self.compact()
+        return self.structure('energy_classes', lambda: classify_energies(
+            [ compact.card(name).canonical_name() for name in compact.names ]), per_card=True)
+
+    def opening_hand_distribution(self, basic=None):
+        """ A probability.JointDistribution over the opening hand, redrawn
+            until it has a Basic Pokemon, with categories 'basic pokemon' and
+            'basic energy'. Given the name of one of the deck's Basics, that
+            Basic gets a category of its own, 'chosen basic', and the rest go
+            in 'other basics'. Worked out once per deck (and Basic) from the
+            exact joint distribution - no simulating.
+        """
+        def compute():
+            compact = self.compact()
+            basics = [ name for name, is_basic in zip(compact.names, self.basic_pokemon()) if is_basic ]
+            energy = [ name for name, classes in zip(compact.names, self.energy_classes()) if classes & BASIC_ENERGY ]
+            if basic is None:
+                categories = [('basic pokemon', basics)]
+            else:
+                categories = [('chosen basic', [basic]), ('other basics', [ name for name in basics if name != basic ])]
+            joint = self.joint_distribution(categories + [('basic energy', energy)], self.opening_hand)
+            return joint.given_some([ label for label, _ in categories ])
+        return self.structure(('opening_hand', self.opening_hand, basic), compute)
+
+    def chance_prized(self, name, at_least=1):
+        """ How likely it is that at least `at_least` copies of `name` are
+            prized - whatever's in the hand."""
+        return float(self.prize_table()[self.compact().index[name], :, at_least:].sum())
+
+    def evolution_lines(self):
+        """ Every evolution line in the deck, as EvolutionLines: one for each
+            evolved Pokemon that nothing else in the deck evolves from, if the
+            deck has every stage below it, down to the Basic. A Basic with two
+            evolutions in the deck (Eevee, say) is in both of their lines.
+
+            Cards with a suffix (Mewtwo EX, Latias \u03b4) are their own thing
+            rather than a stage of their species, so they're left out. Worked
+            out from the SpeciesStore's parent links once per deck.
+        """
+        def compute():
+            store = species()
+            rows = collections.OrderedDict()
+            for card in self.decklist:
+                base_name, suffix = split_suffix(card.name)
+                row = None if suffix else store.row(base_name)
+                if row is not None:
+                    rows.setdefault(int(row), []).append(card)
+            lines = []
+            for row in rows:
+                if store.basic[row] or any(int(child) in rows for child in store.children(row)):
+                    continue
+                stages = [row]
+                while not store.basic[stages[0]] and int(store.parent[stages[0]]) in rows:
+                    stages.insert(0, int(store.parent[stages[0]]))
+                if store.basic[stages[0]]:
+                    lines.append(EvolutionLine(tuple(tuple(card.name for card in rows[r]) for r in stages),
+                                               tuple(sum(card.count for card in rows[r]) for r in stages)))
+            return lines
+        # Per card, since the lines hold the names as this deck spells them.
+        return self.structure('evolution_lines', compute, per_card=True)
+
+    def evolution_line_chance(self, line, cards_seen):
+        """ How likely it is that the opening hand and the cards drawn after
+            it - `cards_seen` cards in all - include at least one card from
+            every stage of `line`. Exact, see
+            probability.all_categories_chance(). Cached per line.
+
+            Mulligans do change this: the opening hand gets redrawn until it
+            has a Basic Pokemon, so the chance is the one given that the first
+            opening_hand cards include a Basic - which makes the line's own
+            Basics a little likelier to be there.
+
+            Prizes don't: they're set aside at random after the hand, so the
+            cards you draw are still a random handful of the rest of the deck.
+            (They do change which cards you can still draw, which is another
+            question.)
+        """
+        def compute():
+            basics = int(self.compact().counts[self.basic_pokemon()].sum())
+            # The line's first stage is all Basics.
+            required = (line.copies[0],) + (0,) * (len(line.copies) - 1)
+            return probability.all_categories_chance(line.copies, self.size(), cards_seen, required,
+                                                     basics - line.copies[0], self.opening_hand)
+        return self.structure(('evolution_line_chance', line.names, cards_seen), compute)
+
 
 class PokemonCard(Card):
+    short_game_name = "pokemon"
+
     def __init__(self, name, count, **hints):
         # Later we'll use the **hints dict to help disambiguate cards.
-        super(PokemonCard, self).__init__(name, count)
+        super(PokemonCard, self).__init__(name, count, **hints)
         # self.is_energy = None
 
-    def canonical_name(self, name):
-        # Make sure the name that we're using is the name that the official
-        # game knows, not the string the user typed in - we scrutinize the
-        # latter to pick the former from our existing list.
-        pass
-
     def _is_energy(self, name):
-        oddball_energy = [r'Double Rainbow Energy', r'Dark Metal Energy', r'Holon Energy [A-Z]{1,2}',]
-        # What the fuck Pokemon, you have serious canonicalization issues.
-        delta_energy = [u'\u03b4 .+ Energy',]
-        generic_energy = r'[a-zA-Z]+ Energy'
-        # re.match(name, '')
-        # For each oddball type of energy, use the appropriate regex to see if
-        # it's one of those.
-        raise NotImplementedError
+        return bool(classify_energy(self.canonical_name(name)))
 
     def _is_basic_energy(self, name):
-        basics = ['darkness energy','fighting energy','fire energy','grass energy','lightning energy','metal energy','psychic energy', 'water energy',]
-        if name.lower() in basics:
-            return True
-        return False
+        return bool(classify_energy(self.canonical_name(name)) & BASIC_ENERGY)
+
+    def _is_special_energy(self, name):
+        return bool(classify_energy(self.canonical_name(name)) & SPECIAL_ENERGY)
 
     def _is_pokemon(self, name):
-        if name.lower() in species_data.keys():
-            return True
-        return False
+        return species().row(name) is not None
 
     def _is_basic_pokemon(self, name):
-        name = name.lower()
-        if not self._is_pokemon(name):
-            return False
-        if species_data[name]['is_baby']:
-            return True
-        previous_stage_species_id = species_data[name]['evolves_from_species_id']
-        if not previous_stage_species_id:
-            return True
-        previous_is_baby = [ species_data[name]['is_baby'] for name in species_data.keys() if species_data[name]['species_id'] == previous_stage_species_id ][0]
-        if previous_is_baby == 0:
-           return True
-        return False
+        row = species().row(name)
+        return row is not None and bool(species().basic[row])
 
     def _is_stage_one(self, name):
-        if name in species_data.keys():
-            if species_data[name]['foo']:
-                pass
-        raise NotImplementedError
+        row = species().row(name)
+        return row is not None and species().stage[row] == 1
 
     def _is_trainer(self, name):
         raise NotImplementedError
@@ -83,675 +174,273 @@ class PokemonCard(Card):
         raise NotImplementedError
 
 
+# The turns evolution_line_by_turn() asks about.
+_EVOLUTION_TURNS = range(1, 5)
+
+def _has_evolution_line(deck):
+    return deck.size() >= deck.opening_hand + _EVOLUTION_TURNS[-1] and bool(deck.evolution_lines())
+
+def _has_basics_and_basic_energy(deck):
+    return (deck.size() >= deck.opening_hand and deck.basic_pokemon().any()
+            and (deck.energy_classes() & BASIC_ENERGY).any())
+
+def _has_two_basics(deck):
+    return deck.size() >= deck.opening_hand and deck.basic_pokemon().sum() >= 2
+
+def _has_basics_and_prizable_cards(deck):
+    # Every copy has to fit in the Prizes, and with no Basics there's no
+    # legal opening hand to condition on.
+    return (deck.size() >= deck.opening_hand + deck.prizes and deck.basic_pokemon().any()
+            and any([ 1 < card.count <= deck.prizes for card in deck.decklist ]))
+
+
+@register_questions
 class PokemonQuestion(Question):
-    def __init__(self):
-        super(PokemonQuestion, self).__init__()
-        self.question_list = self.generic_questions
 
+    @question(game='pokemon', difficulty='hard', feasible=_has_evolution_line)
+    def evolution_line_by_turn(self, deck, hand_size=7):
+        """ Setting up a Stage 2 takes a whole line of cards, and you can't
+            evolve until you've drawn them all. Turn N means the draw at the
+            start of each of your first N turns, on top of the opening hand."""
+        question_string = ("How likely is it that you'll have drawn {line} - at "
+                           "least one of each - by your turn {turn}?")
+        answer_suffix = 'percent'
+        line = self.random.choice(deck.evolution_lines())
+        turn = self.random.choice(_EVOLUTION_TURNS)
+        top_card = line.names[-1][0]
+        chance = self.cached(deck, 'evolution_line_by_turn', top_card, (line.names, hand_size + turn),
+                             lambda: deck.evolution_line_chance(line, hand_size + turn))
+        chance = chance * 100
+        correct_string = "{:.2f}".format(chance)
+        possible = self.gen_wrong(chance, 'percent', 4) + [correct_string]
+        self.random.shuffle(possible)
+        names = [ u" or ".join(stage) for stage in line.names ]
+        line_string = u"{} and {}".format(u", ".join(names[:-1]), names[-1])
+        print "Chance of {} by turn {}: {}".format(line_string.encode('utf-8'), turn, correct_string)
+        return question_string.format(line=line_string, turn=turn), correct_string, possible, answer_suffix, top_card
+
+    @question(game='pokemon', difficulty='hard', feasible=_has_basics_and_prizable_cards)
+    def all_copies_prized(self, deck):
+        """ The one everybody dreads: every copy of a card stuck in the
+            Prizes. Read off the deck's prize table, which already accounts
+            for mulligans."""
+        question_string = ("How likely is it that {count} copies of {card} "
+                           "end up among your Prize cards?")
+        answer_suffix = 'percent'
+        chosen_card = self.random.choice([ card for card in deck.decklist if 1 < card.count <= deck.prizes ])
+        chance = self.cached(deck, 'all_copies_prized', chosen_card.name, (deck.prizes,),
+                             lambda: deck.chance_prized(chosen_card.name, chosen_card.count))
+        chance = chance * 100
+        correct_string = "{:.2f}".format(chance)
+        possible = self.gen_wrong(chance, 'percent', 4) + [correct_string]
+        self.random.shuffle(possible)
+        print "Chance of every {} prized: {}".format(chosen_card.name.encode('utf-8'), correct_string)
+        count = "both" if chosen_card.count == 2 else "all {}".format(chosen_card.count)
+        return (question_string.format(count=count, card=chosen_card.name), correct_string,
+                possible, answer_suffix, chosen_card)
+
+    @question(game='pokemon', difficulty='medium', feasible=_has_basics_and_basic_energy)
     def basic_energy_in_opening(self, deck):
         """ On average, how many basic Energy cards will be in your opening
-            hand?"""
-        raise NotImplementedError
+            hand? Mulligans count: a hand full of Energy and no Basics gets
+            redrawn, which is why this isn't just 7 * energy / deck size."""
+        question_string = ("On average, how many basic Energy cards will be in "
+                           "your opening hand?")
+        answer_suffix = 'basic Energy cards'
+        average = self.cached(deck, 'basic_energy_in_opening', None, (deck.opening_hand,),
+                              lambda: deck.opening_hand_distribution().expected('basic energy'))
+        correct_string = "{:.2f}".format(average)
+        possible = self.gen_wrong(average, 'average', 4, answer_ceiling=deck.opening_hand) + [correct_string]
+        self.random.shuffle(possible)
+        print "Average basic Energy in opening hand: {}".format(correct_string)
+        return question_string, correct_string, possible, answer_suffix, "basic Energy"
 
+    @question(game='pokemon', difficulty='hard', feasible=_has_two_basics)
     def this_basic_alone(self, deck):
         """ How likely is it that you'll get $basic as the only Pokemon in your
             starting hand? (including multiple copies of it?)  Alternative
             phrasing: How likely is it that the only basics in your opening
-            hand will be one or more copies of $basic?"""
-        raise NotImplementedError
+            hand will be one or more copies of $basic? That's the one we ask -
+            and since every opening hand has a Basic, it's just the chance of
+            none of the others."""
+        question_string = ("How likely is it that the only Basic Pokemon in your "
+                           "opening hand will be one or more copies of {card}?")
+        answer_suffix = 'percent'
+        basics = [ card for card in deck.decklist if card._is_basic_pokemon(card.name) ]
+        chosen_card = self.random.choice(basics)
+        chance = self.cached(deck, 'this_basic_alone', chosen_card.name, (deck.opening_hand,),
+                             lambda: deck.opening_hand_distribution(chosen_card.name).chance({'other basics': (0, 0)}))
+        chance = chance * 100
+        correct_string = "{:.2f}".format(chance)
+        possible = self.gen_wrong(chance, 'percent', 4) + [correct_string]
+        self.random.shuffle(possible)
+        print "Chance of {} as the only Basic: {}".format(chosen_card.name.encode('utf-8'), correct_string)
+        return question_string.format(card=chosen_card.name), correct_string, possible, answer_suffix, chosen_card
+
+
+# What kind of Energy a card is, as bits, since some are more than one kind: a
+# Holon Energy is a special Energy and a Holon one.
+BASIC_ENERGY, SPECIAL_ENERGY, DELTA_ENERGY, HOLON_ENERGY = 1, 2, 4, 8
+
+# Every Energy pattern, in one alternation, so that classifying a name is one
+# match. The first group that matches decides; anything else called
+# "Something Energy" (Double Colorless, Dark Metal, Double Rainbow...) is
+# special. What the fuck Pokemon, you have serious canonicalization issues:
+# delta Energy gets its delta at either end, or spelled out.
+_energy_pattern = re.compile(u'^(?:(?P<basic>(?:darkness|fighting|fire|grass|lightning|metal|psychic|water) energy)'
+                             u'|(?P<holon>holon energy [a-z]{1,2})'
+                             u'|(?P<delta>\u03b4 .+ energy|.+ energy[ -]*(?:\u03b4|\\(?delta species\\)?|delta))'
+                             u'|(?P<special>.+ energy))$', re.IGNORECASE | re.UNICODE)
+
+_energy_groups = { 'basic': BASIC_ENERGY, 'holon': SPECIAL_ENERGY | HOLON_ENERGY,
+                   'delta': SPECIAL_ENERGY | DELTA_ENERGY, 'special': SPECIAL_ENERGY, }
+
+# Canonical key -> energy bits, for the card names we've seen lately.
+energy_cache = cache.LRUCache(4096)
+
+def _classify(key):
+    match = _energy_pattern.match(key)
+    return _energy_groups[match.lastgroup] if match else 0
+
+def classify_energy(name):
+    """ The energy bits (BASIC_ENERGY and so on) for a card name, or 0 if it
+        isn't an Energy card. Pass canonical names - see
+        Card.canonical_name() - so that every spelling of a card shares one
+        cache entry."""
+    key = canonical_key(name)
+    return energy_cache.get(key, lambda: _classify(key))
+
+def classify_energies(names):
+    """ classify_energy() for a whole decklist's worth of names, as a NumPy
+        array."""
+    return numpy.array([ classify_energy(name) for name in names ], dtype=numpy.uint8)
+
+
+class SpeciesStore(object):
+    """ Data about every Pokemon species, in packed NumPy columns - one entry
+        per species, in species_id order - loaded from
+        data/pokemon_species.csv the first time anybody asks (see species()).
+        Eventually this will go in the database.
+
+        Alongside the columns are the indexes the questions need: species
+        name -> row, species_id -> row, and each species' parent (what it
+        evolves from) and children (what evolves from it). Whether a species
+        is a Basic, and what stage it is, are worked out once for every
+        species at load time, so every lookup after that is O(1).
+    """
+
+    path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'pokemon_species.csv')
+
+    def __init__(self, path=None):
+        with open(path or self.path) as f:
+            rows = list(csv.DictReader(f))
+        count = len(rows)
+        self.keys = tuple(row['species_name'] for row in rows)
+        self.species_id = numpy.array([ int(row['species_id']) for row in rows ], dtype=numpy.int16)
+        self.generation = numpy.array([ int(row['generation_id']) for row in rows ], dtype=numpy.int8)
+        self.evolution_chain = numpy.array([ int(row['evolution_chain_id']) for row in rows ], dtype=numpy.int16)
+        self.is_baby = numpy.array([ row['is_baby'] == '1' for row in rows ], dtype=bool)
+
+        self.by_id = numpy.full(int(self.species_id.max()) + 1, -1, dtype=numpy.int16)
+        self.by_id[self.species_id] = numpy.arange(count)
+        # Row of the species each one evolves from, or -1.
+        parents = [ int(row['evolves_from_species_id'] or 0) for row in rows ]
+        self.parent = numpy.array([ self.by_id[p] if p else -1 for p in parents ], dtype=numpy.int16)
+        # Children, CSR-style: the children of row r are
+        # child_rows[child_start[r]:child_start[r + 1]].
+        order = numpy.argsort(self.parent, kind='mergesort')
+        order = order[self.parent[order] >= 0]
+        self.child_rows = order.astype(numpy.int16)
+        self.child_start = numpy.searchsorted(self.parent[order], numpy.arange(count + 1)).astype(numpy.int16)
+
+        # In the card game, babies are Basics, and so is anything that
+        # evolves from a baby (Pichu and Pikachu both are). Stage counts
+        # evolutions from the Basic.
+        self.stage = numpy.zeros(count, dtype=numpy.int8)
+        for row in xrange(count):
+            stage, current = 0, row
+            while self.parent[current] >= 0 and not self.is_baby[current] and not self.is_baby[self.parent[current]]:
+                stage, current = stage + 1, self.parent[current]
+            self.stage[row] = stage
+        self.basic = self.stage == 0
+
+        self.by_name = {}
+        for row, key in enumerate(self.keys):
+            self.by_name[key] = row
+            self.by_name[_species_name(key).lower()] = row
+
+    def __len__(self):
+        return len(self.keys)
+
+    def row(self, name):
+        """ The row for a species - by key ('mr-mime'), or by name as printed
+            on cards ('Mr. Mime', 'Mewtwo EX'), in any case - or None."""
+        row = self.by_name.get(name.lower())
+        if row is None:
+            row = self.by_name.get(u" ".join(split_suffix(name)[0].split()).lower())
+        return row
+
+    def children(self, row):
+        return self.child_rows[self.child_start[row]:self.child_start[row + 1]]
+
+    def name(self, row):
+        return _species_name(self.keys[row])
+
+
+_species = []
+
+def species():
+    """ The SpeciesStore, loaded the first time it's needed."""
+    if not _species:
+        _species.append(SpeciesStore())
+    return _species[0]
+
+
+# Card names for lib/canonical: every species, properly spelled and
+# capitalized, plus the Energy cards. Suffixes like EX and delta aren't part
+# of the name - see split_suffix().
+_species_names = { 'mr-mime': u'Mr. Mime', 'mime-jr': u'Mime Jr.', 'nidoran-f': u'Nidoran\u2640',
+                   'nidoran-m': u'Nidoran\u2642', 'farfetchd': u"Farfetch'd", 'porygon-z': u'Porygon-Z',
+                   'ho-oh': u'Ho-Oh', }
+
+def _species_name(key):
+    return _species_names.get(key) or unicode(key).capitalize()
+
+# Suffix as typed (lowercased) -> suffix as printed. EX and ex are different
+# things (Black & White-era EX versus the old ex cards), so those keep
+# whatever case they were typed in.
+_suffixes = { u'ex': None, u'gx': u'GX', u'v': u'V', u'vmax': u'VMAX', u'vstar': u'VSTAR',
+              u'break': u'BREAK', u'lv.x': u'LV.X', u'prime': u'Prime', u'legend': u'LEGEND',
+              u'\u03b4': u'\u03b4', u'delta': u'\u03b4', }
+
+def split_suffix(name):
+    """ Splits e.g. "Mewtwo-EX" into ("Mewtwo", "EX") and "Latias (Delta
+        Species)" into ("Latias", "\u03b4"). Names without a suffix come back
+        with u'' as theirs."""
+    name = name.strip()
+    lowered = name.lower()
+    for typed, suffix in ((u'(delta species)', u'\u03b4'), (u'delta species', u'\u03b4'),
+                          (u'lv. x', u'LV.X'), (u'lv.x', u'LV.X')):
+        if lowered.endswith(typed) and len(name) > len(typed):
+            return name[:-len(typed)].rstrip(u' -'), suffix
+    head, separator, last = name.rpartition(u' ')
+    if not separator:
+        head, separator, last = name.rpartition(u'-')
+    if head and last.lower() in _suffixes:
+        suffix = _suffixes[last.lower()] or (last if last in (u'EX', u'ex') else u'EX')
+        return head.rstrip(u' -'), suffix
+    return name, u''
+
+def _register_names():
+    canonical.register_names('pokemon',
+                             [ _species_name(key) for key in species().keys ] +
+                             [ u'Darkness Energy', u'Fighting Energy', u'Fire Energy', u'Grass Energy',
+                               u'Lightning Energy', u'Metal Energy', u'Psychic Energy', u'Water Energy',
+                               u'Double Colorless Energy', u'Double Rainbow Energy', u'Dark Metal Energy', ],
+                             dict([ (key, _species_name(key)) for key in _species_names ] +
+                                  [ (u'Mr Mime', u'Mr. Mime'), (u'Mime Jr', u'Mime Jr.'), ]),
+                             normalize=split_suffix)
 
-# Giant dictionary of data about individual Pokemon - eventually this will go
-# in the database, but it was easy to get it in this form, so this is the
-# short-term solution.
-
-species_data= {
-    'bulbasaur': {'species_id': 1, 'species_name': 'bulbasaur', 'generation_id': 1, 'evolves_from_species_id': None, 'evolution_chain_id': 1, 'is_baby': 0},
-    'ivysaur': {'species_id': 2, 'species_name': 'ivysaur', 'generation_id': 1, 'evolves_from_species_id': 1, 'evolution_chain_id': 1, 'is_baby': 0},
-    'venusaur': {'species_id': 3, 'species_name': 'venusaur', 'generation_id': 1, 'evolves_from_species_id': 2, 'evolution_chain_id': 1, 'is_baby': 0},
-    'charmander': {'species_id': 4, 'species_name': 'charmander', 'generation_id': 1, 'evolves_from_species_id': None, 'evolution_chain_id': 2, 'is_baby': 0},
-    'charmeleon': {'species_id': 5, 'species_name': 'charmeleon', 'generation_id': 1, 'evolves_from_species_id': 4, 'evolution_chain_id': 2, 'is_baby': 0},
-    'charizard': {'species_id': 6, 'species_name': 'charizard', 'generation_id': 1, 'evolves_from_species_id': 5, 'evolution_chain_id': 2, 'is_baby': 0},
-    'squirtle': {'species_id': 7, 'species_name': 'squirtle', 'generation_id': 1, 'evolves_from_species_id': None, 'evolution_chain_id': 3, 'is_baby': 0},
-    'wartortle': {'species_id': 8, 'species_name': 'wartortle', 'generation_id': 1, 'evolves_from_species_id': 7, 'evolution_chain_id': 3, 'is_baby': 0},
-    'blastoise': {'species_id': 9, 'species_name': 'blastoise', 'generation_id': 1, 'evolves_from_species_id': 8, 'evolution_chain_id': 3, 'is_baby': 0},
-    'caterpie': {'species_id': 10, 'species_name': 'caterpie', 'generation_id': 1, 'evolves_from_species_id': None, 'evolution_chain_id': 4, 'is_baby': 0},
-    'metapod': {'species_id': 11, 'species_name': 'metapod', 'generation_id': 1, 'evolves_from_species_id': 10, 'evolution_chain_id': 4, 'is_baby': 0},
-    'butterfree': {'species_id': 12, 'species_name': 'butterfree', 'generation_id': 1, 'evolves_from_species_id': 11, 'evolution_chain_id': 4, 'is_baby': 0},
-    'weedle': {'species_id': 13, 'species_name': 'weedle', 'generation_id': 1, 'evolves_from_species_id': None, 'evolution_chain_id': 5, 'is_baby': 0},
-    'kakuna': {'species_id': 14, 'species_name': 'kakuna', 'generation_id': 1, 'evolves_from_species_id': 13, 'evolution_chain_id': 5, 'is_baby': 0},
-    'beedrill': {'species_id': 15, 'species_name': 'beedrill', 'generation_id': 1, 'evolves_from_species_id': 14, 'evolution_chain_id': 5, 'is_baby': 0},
-    'pidgey': {'species_id': 16, 'species_name': 'pidgey', 'generation_id': 1, 'evolves_from_species_id': None, 'evolution_chain_id': 6, 'is_baby': 0},
-    'pidgeotto': {'species_id': 17, 'species_name': 'pidgeotto', 'generation_id': 1, 'evolves_from_species_id': 16, 'evolution_chain_id': 6, 'is_baby': 0},
-    'pidgeot': {'species_id': 18, 'species_name': 'pidgeot', 'generation_id': 1, 'evolves_from_species_id': 17, 'evolution_chain_id': 6, 'is_baby': 0},
-    'rattata': {'species_id': 19, 'species_name': 'rattata', 'generation_id': 1, 'evolves_from_species_id': None, 'evolution_chain_id': 7, 'is_baby': 0},
-    'raticate': {'species_id': 20, 'species_name': 'raticate', 'generation_id': 1, 'evolves_from_species_id': 19, 'evolution_chain_id': 7, 'is_baby': 0},
-    'spearow': {'species_id': 21, 'species_name': 'spearow', 'generation_id': 1, 'evolves_from_species_id': None, 'evolution_chain_id': 8, 'is_baby': 0},
-    'fearow': {'species_id': 22, 'species_name': 'fearow', 'generation_id': 1, 'evolves_from_species_id': 21, 'evolution_chain_id': 8, 'is_baby': 0},
-    'ekans': {'species_id': 23, 'species_name': 'ekans', 'generation_id': 1, 'evolves_from_species_id': None, 'evolution_chain_id': 9, 'is_baby': 0},
-    'arbok': {'species_id': 24, 'species_name': 'arbok', 'generation_id': 1, 'evolves_from_species_id': 23, 'evolution_chain_id': 9, 'is_baby': 0},
-    'pikachu': {'species_id': 25, 'species_name': 'pikachu', 'generation_id': 1, 'evolves_from_species_id': 172, 'evolution_chain_id': 10, 'is_baby': 0},
-    'raichu': {'species_id': 26, 'species_name': 'raichu', 'generation_id': 1, 'evolves_from_species_id': 25, 'evolution_chain_id': 10, 'is_baby': 0},
-    'sandshrew': {'species_id': 27, 'species_name': 'sandshrew', 'generation_id': 1, 'evolves_from_species_id': None, 'evolution_chain_id': 11, 'is_baby': 0},
-    'sandslash': {'species_id': 28, 'species_name': 'sandslash', 'generation_id': 1, 'evolves_from_species_id': 27, 'evolution_chain_id': 11, 'is_baby': 0},
-    'nidoran-f': {'species_id': 29, 'species_name': 'nidoran-f', 'generation_id': 1, 'evolves_from_species_id': None, 'evolution_chain_id': 12, 'is_baby': 0},
-    'nidorina': {'species_id': 30, 'species_name': 'nidorina', 'generation_id': 1, 'evolves_from_species_id': 29, 'evolution_chain_id': 12, 'is_baby': 0},
-    'nidoqueen': {'species_id': 31, 'species_name': 'nidoqueen', 'generation_id': 1, 'evolves_from_species_id': 30, 'evolution_chain_id': 12, 'is_baby': 0},
-    'nidoran-m': {'species_id': 32, 'species_name': 'nidoran-m', 'generation_id': 1, 'evolves_from_species_id': None, 'evolution_chain_id': 13, 'is_baby': 0},
-    'nidorino': {'species_id': 33, 'species_name': 'nidorino', 'generation_id': 1, 'evolves_from_species_id': 32, 'evolution_chain_id': 13, 'is_baby': 0},
-    'nidoking': {'species_id': 34, 'species_name': 'nidoking', 'generation_id': 1, 'evolves_from_species_id': 33, 'evolution_chain_id': 13, 'is_baby': 0},
-    'clefairy': {'species_id': 35, 'species_name': 'clefairy', 'generation_id': 1, 'evolves_from_species_id': 173, 'evolution_chain_id': 14, 'is_baby': 0},
-    'clefable': {'species_id': 36, 'species_name': 'clefable', 'generation_id': 1, 'evolves_from_species_id': 35, 'evolution_chain_id': 14, 'is_baby': 0},
-    'vulpix': {'species_id': 37, 'species_name': 'vulpix', 'generation_id': 1, 'evolves_from_species_id': None, 'evolution_chain_id': 15, 'is_baby': 0},
-    'ninetales': {'species_id': 38, 'species_name': 'ninetales', 'generation_id': 1, 'evolves_from_species_id': 37, 'evolution_chain_id': 15, 'is_baby': 0},
-    'jigglypuff': {'species_id': 39, 'species_name': 'jigglypuff', 'generation_id': 1, 'evolves_from_species_id': 174, 'evolution_chain_id': 16, 'is_baby': 0},
-    'wigglytuff': {'species_id': 40, 'species_name': 'wigglytuff', 'generation_id': 1, 'evolves_from_species_id': 39, 'evolution_chain_id': 16, 'is_baby': 0},
-    'zubat': {'species_id': 41, 'species_name': 'zubat', 'generation_id': 1, 'evolves_from_species_id': None, 'evolution_chain_id': 17, 'is_baby': 0},
-    'golbat': {'species_id': 42, 'species_name': 'golbat', 'generation_id': 1, 'evolves_from_species_id': 41, 'evolution_chain_id': 17, 'is_baby': 0},
-    'oddish': {'species_id': 43, 'species_name': 'oddish', 'generation_id': 1, 'evolves_from_species_id': None, 'evolution_chain_id': 18, 'is_baby': 0},
-    'gloom': {'species_id': 44, 'species_name': 'gloom', 'generation_id': 1, 'evolves_from_species_id': 43, 'evolution_chain_id': 18, 'is_baby': 0},
-    'vileplume': {'species_id': 45, 'species_name': 'vileplume', 'generation_id': 1, 'evolves_from_species_id': 44, 'evolution_chain_id': 18, 'is_baby': 0},
-    'paras': {'species_id': 46, 'species_name': 'paras', 'generation_id': 1, 'evolves_from_species_id': None, 'evolution_chain_id': 19, 'is_baby': 0},
-    'parasect': {'species_id': 47, 'species_name': 'parasect', 'generation_id': 1, 'evolves_from_species_id': 46, 'evolution_chain_id': 19, 'is_baby': 0},
-    'venonat': {'species_id': 48, 'species_name': 'venonat', 'generation_id': 1, 'evolves_from_species_id': None, 'evolution_chain_id': 20, 'is_baby': 0},
-    'venomoth': {'species_id': 49, 'species_name': 'venomoth', 'generation_id': 1, 'evolves_from_species_id': 48, 'evolution_chain_id': 20, 'is_baby': 0},
-    'diglett': {'species_id': 50, 'species_name': 'diglett', 'generation_id': 1, 'evolves_from_species_id': None, 'evolution_chain_id': 21, 'is_baby': 0},
-    'dugtrio': {'species_id': 51, 'species_name': 'dugtrio', 'generation_id': 1, 'evolves_from_species_id': 50, 'evolution_chain_id': 21, 'is_baby': 0},
-    'meowth': {'species_id': 52, 'species_name': 'meowth', 'generation_id': 1, 'evolves_from_species_id': None, 'evolution_chain_id': 22, 'is_baby': 0},
-    'persian': {'species_id': 53, 'species_name': 'persian', 'generation_id': 1, 'evolves_from_species_id': 52, 'evolution_chain_id': 22, 'is_baby': 0},
-    'psyduck': {'species_id': 54, 'species_name': 'psyduck', 'generation_id': 1, 'evolves_from_species_id': None, 'evolution_chain_id': 23, 'is_baby': 0},
-    'golduck': {'species_id': 55, 'species_name': 'golduck', 'generation_id': 1, 'evolves_from_species_id': 54, 'evolution_chain_id': 23, 'is_baby': 0},
-    'mankey': {'species_id': 56, 'species_name': 'mankey', 'generation_id': 1, 'evolves_from_species_id': None, 'evolution_chain_id': 24, 'is_baby': 0},
-    'primeape': {'species_id': 57, 'species_name': 'primeape', 'generation_id': 1, 'evolves_from_species_id': 56, 'evolution_chain_id': 24, 'is_baby': 0},
-    'growlithe': {'species_id': 58, 'species_name': 'growlithe', 'generation_id': 1, 'evolves_from_species_id': None, 'evolution_chain_id': 25, 'is_baby': 0},
-    'arcanine': {'species_id': 59, 'species_name': 'arcanine', 'generation_id': 1, 'evolves_from_species_id': 58, 'evolution_chain_id': 25, 'is_baby': 0},
-    'poliwag': {'species_id': 60, 'species_name': 'poliwag', 'generation_id': 1, 'evolves_from_species_id': None, 'evolution_chain_id': 26, 'is_baby': 0},
-    'poliwhirl': {'species_id': 61, 'species_name': 'poliwhirl', 'generation_id': 1, 'evolves_from_species_id': 60, 'evolution_chain_id': 26, 'is_baby': 0},
-    'poliwrath': {'species_id': 62, 'species_name': 'poliwrath', 'generation_id': 1, 'evolves_from_species_id': 61, 'evolution_chain_id': 26, 'is_baby': 0},
-    'abra': {'species_id': 63, 'species_name': 'abra', 'generation_id': 1, 'evolves_from_species_id': None, 'evolution_chain_id': 27, 'is_baby': 0},
-    'kadabra': {'species_id': 64, 'species_name': 'kadabra', 'generation_id': 1, 'evolves_from_species_id': 63, 'evolution_chain_id': 27, 'is_baby': 0},
-    'alakazam': {'species_id': 65, 'species_name': 'alakazam', 'generation_id': 1, 'evolves_from_species_id': 64, 'evolution_chain_id': 27, 'is_baby': 0},
-    'machop': {'species_id': 66, 'species_name': 'machop', 'generation_id': 1, 'evolves_from_species_id': None, 'evolution_chain_id': 28, 'is_baby': 0},
-    'machoke': {'species_id': 67, 'species_name': 'machoke', 'generation_id': 1, 'evolves_from_species_id': 66, 'evolution_chain_id': 28, 'is_baby': 0},
-    'machamp': {'species_id': 68, 'species_name': 'machamp', 'generation_id': 1, 'evolves_from_species_id': 67, 'evolution_chain_id': 28, 'is_baby': 0},
-    'bellsprout': {'species_id': 69, 'species_name': 'bellsprout', 'generation_id': 1, 'evolves_from_species_id': None, 'evolution_chain_id': 29, 'is_baby': 0},
-    'weepinbell': {'species_id': 70, 'species_name': 'weepinbell', 'generation_id': 1, 'evolves_from_species_id': 69, 'evolution_chain_id': 29, 'is_baby': 0},
-    'victreebel': {'species_id': 71, 'species_name': 'victreebel', 'generation_id': 1, 'evolves_from_species_id': 70, 'evolution_chain_id': 29, 'is_baby': 0},
-    'tentacool': {'species_id': 72, 'species_name': 'tentacool', 'generation_id': 1, 'evolves_from_species_id': None, 'evolution_chain_id': 30, 'is_baby': 0},
-    'tentacruel': {'species_id': 73, 'species_name': 'tentacruel', 'generation_id': 1, 'evolves_from_species_id': 72, 'evolution_chain_id': 30, 'is_baby': 0},
-    'geodude': {'species_id': 74, 'species_name': 'geodude', 'generation_id': 1, 'evolves_from_species_id': None, 'evolution_chain_id': 31, 'is_baby': 0},
-    'graveler': {'species_id': 75, 'species_name': 'graveler', 'generation_id': 1, 'evolves_from_species_id': 74, 'evolution_chain_id': 31, 'is_baby': 0},
-    'golem': {'species_id': 76, 'species_name': 'golem', 'generation_id': 1, 'evolves_from_species_id': 75, 'evolution_chain_id': 31, 'is_baby': 0},
-    'ponyta': {'species_id': 77, 'species_name': 'ponyta', 'generation_id': 1, 'evolves_from_species_id': None, 'evolution_chain_id': 32, 'is_baby': 0},
-    'rapidash': {'species_id': 78, 'species_name': 'rapidash', 'generation_id': 1, 'evolves_from_species_id': 77, 'evolution_chain_id': 32, 'is_baby': 0},
-    'slowpoke': {'species_id': 79, 'species_name': 'slowpoke', 'generation_id': 1, 'evolves_from_species_id': None, 'evolution_chain_id': 33, 'is_baby': 0},
-    'slowbro': {'species_id': 80, 'species_name': 'slowbro', 'generation_id': 1, 'evolves_from_species_id': 79, 'evolution_chain_id': 33, 'is_baby': 0},
-    'magnemite': {'species_id': 81, 'species_name': 'magnemite', 'generation_id': 1, 'evolves_from_species_id': None, 'evolution_chain_id': 34, 'is_baby': 0},
-    'magneton': {'species_id': 82, 'species_name': 'magneton', 'generation_id': 1, 'evolves_from_species_id': 81, 'evolution_chain_id': 34, 'is_baby': 0},
-    'farfetchd': {'species_id': 83, 'species_name': 'farfetchd', 'generation_id': 1, 'evolves_from_species_id': None, 'evolution_chain_id': 35, 'is_baby': 0},
-    'doduo': {'species_id': 84, 'species_name': 'doduo', 'generation_id': 1, 'evolves_from_species_id': None, 'evolution_chain_id': 36, 'is_baby': 0},
-    'dodrio': {'species_id': 85, 'species_name': 'dodrio', 'generation_id': 1, 'evolves_from_species_id': 84, 'evolution_chain_id': 36, 'is_baby': 0},
-    'seel': {'species_id': 86, 'species_name': 'seel', 'generation_id': 1, 'evolves_from_species_id': None, 'evolution_chain_id': 37, 'is_baby': 0},
-    'dewgong': {'species_id': 87, 'species_name': 'dewgong', 'generation_id': 1, 'evolves_from_species_id': 86, 'evolution_chain_id': 37, 'is_baby': 0},
-    'grimer': {'species_id': 88, 'species_name': 'grimer', 'generation_id': 1, 'evolves_from_species_id': None, 'evolution_chain_id': 38, 'is_baby': 0},
-    'muk': {'species_id': 89, 'species_name': 'muk', 'generation_id': 1, 'evolves_from_species_id': 88, 'evolution_chain_id': 38, 'is_baby': 0},
-    'shellder': {'species_id': 90, 'species_name': 'shellder', 'generation_id': 1, 'evolves_from_species_id': None, 'evolution_chain_id': 39, 'is_baby': 0},
-    'cloyster': {'species_id': 91, 'species_name': 'cloyster', 'generation_id': 1, 'evolves_from_species_id': 90, 'evolution_chain_id': 39, 'is_baby': 0},
-    'gastly': {'species_id': 92, 'species_name': 'gastly', 'generation_id': 1, 'evolves_from_species_id': None, 'evolution_chain_id': 40, 'is_baby': 0},
-    'haunter': {'species_id': 93, 'species_name': 'haunter', 'generation_id': 1, 'evolves_from_species_id': 92, 'evolution_chain_id': 40, 'is_baby': 0},
-    'gengar': {'species_id': 94, 'species_name': 'gengar', 'generation_id': 1, 'evolves_from_species_id': 93, 'evolution_chain_id': 40, 'is_baby': 0},
-    'onix': {'species_id': 95, 'species_name': 'onix', 'generation_id': 1, 'evolves_from_species_id': None, 'evolution_chain_id': 41, 'is_baby': 0},
-    'drowzee': {'species_id': 96, 'species_name': 'drowzee', 'generation_id': 1, 'evolves_from_species_id': None, 'evolution_chain_id': 42, 'is_baby': 0},
-    'hypno': {'species_id': 97, 'species_name': 'hypno', 'generation_id': 1, 'evolves_from_species_id': 96, 'evolution_chain_id': 42, 'is_baby': 0},
-    'krabby': {'species_id': 98, 'species_name': 'krabby', 'generation_id': 1, 'evolves_from_species_id': None, 'evolution_chain_id': 43, 'is_baby': 0},
-    'kingler': {'species_id': 99, 'species_name': 'kingler', 'generation_id': 1, 'evolves_from_species_id': 98, 'evolution_chain_id': 43, 'is_baby': 0},
-    'voltorb': {'species_id': 100, 'species_name': 'voltorb', 'generation_id': 1, 'evolves_from_species_id': None, 'evolution_chain_id': 44, 'is_baby': 0},
-    'electrode': {'species_id': 101, 'species_name': 'electrode', 'generation_id': 1, 'evolves_from_species_id': 100, 'evolution_chain_id': 44, 'is_baby': 0},
-    'exeggcute': {'species_id': 102, 'species_name': 'exeggcute', 'generation_id': 1, 'evolves_from_species_id': None, 'evolution_chain_id': 45, 'is_baby': 0},
-    'exeggutor': {'species_id': 103, 'species_name': 'exeggutor', 'generation_id': 1, 'evolves_from_species_id': 102, 'evolution_chain_id': 45, 'is_baby': 0},
-    'cubone': {'species_id': 104, 'species_name': 'cubone', 'generation_id': 1, 'evolves_from_species_id': None, 'evolution_chain_id': 46, 'is_baby': 0},
-    'marowak': {'species_id': 105, 'species_name': 'marowak', 'generation_id': 1, 'evolves_from_species_id': 104, 'evolution_chain_id': 46, 'is_baby': 0},
-    'hitmonlee': {'species_id': 106, 'species_name': 'hitmonlee', 'generation_id': 1, 'evolves_from_species_id': 236, 'evolution_chain_id': 47, 'is_baby': 0},
-    'hitmonchan': {'species_id': 107, 'species_name': 'hitmonchan', 'generation_id': 1, 'evolves_from_species_id': 236, 'evolution_chain_id': 47, 'is_baby': 0},
-    'lickitung': {'species_id': 108, 'species_name': 'lickitung', 'generation_id': 1, 'evolves_from_species_id': None, 'evolution_chain_id': 48, 'is_baby': 0},
-    'koffing': {'species_id': 109, 'species_name': 'koffing', 'generation_id': 1, 'evolves_from_species_id': None, 'evolution_chain_id': 49, 'is_baby': 0},
-    'weezing': {'species_id': 110, 'species_name': 'weezing', 'generation_id': 1, 'evolves_from_species_id': 109, 'evolution_chain_id': 49, 'is_baby': 0},
-    'rhyhorn': {'species_id': 111, 'species_name': 'rhyhorn', 'generation_id': 1, 'evolves_from_species_id': None, 'evolution_chain_id': 50, 'is_baby': 0},
-    'rhydon': {'species_id': 112, 'species_name': 'rhydon', 'generation_id': 1, 'evolves_from_species_id': 111, 'evolution_chain_id': 50, 'is_baby': 0},
-    'chansey': {'species_id': 113, 'species_name': 'chansey', 'generation_id': 1, 'evolves_from_species_id': 440, 'evolution_chain_id': 51, 'is_baby': 0},
-    'tangela': {'species_id': 114, 'species_name': 'tangela', 'generation_id': 1, 'evolves_from_species_id': None, 'evolution_chain_id': 52, 'is_baby': 0},
-    'kangaskhan': {'species_id': 115, 'species_name': 'kangaskhan', 'generation_id': 1, 'evolves_from_species_id': None, 'evolution_chain_id': 53, 'is_baby': 0},
-    'horsea': {'species_id': 116, 'species_name': 'horsea', 'generation_id': 1, 'evolves_from_species_id': None, 'evolution_chain_id': 54, 'is_baby': 0},
-    'seadra': {'species_id': 117, 'species_name': 'seadra', 'generation_id': 1, 'evolves_from_species_id': 116, 'evolution_chain_id': 54, 'is_baby': 0},
-    'goldeen': {'species_id': 118, 'species_name': 'goldeen', 'generation_id': 1, 'evolves_from_species_id': None, 'evolution_chain_id': 55, 'is_baby': 0},
-    'seaking': {'species_id': 119, 'species_name': 'seaking', 'generation_id': 1, 'evolves_from_species_id': 118, 'evolution_chain_id': 55, 'is_baby': 0},
-    'staryu': {'species_id': 120, 'species_name': 'staryu', 'generation_id': 1, 'evolves_from_species_id': None, 'evolution_chain_id': 56, 'is_baby': 0},
-    'starmie': {'species_id': 121, 'species_name': 'starmie', 'generation_id': 1, 'evolves_from_species_id': 120, 'evolution_chain_id': 56, 'is_baby': 0},
-    'mr-mime': {'species_id': 122, 'species_name': 'mr-mime', 'generation_id': 1, 'evolves_from_species_id': 439, 'evolution_chain_id': 57, 'is_baby': 0},
-    'scyther': {'species_id': 123, 'species_name': 'scyther', 'generation_id': 1, 'evolves_from_species_id': None, 'evolution_chain_id': 58, 'is_baby': 0},
-    'jynx': {'species_id': 124, 'species_name': 'jynx', 'generation_id': 1, 'evolves_from_species_id': 238, 'evolution_chain_id': 59, 'is_baby': 0},
-    'electabuzz': {'species_id': 125, 'species_name': 'electabuzz', 'generation_id': 1, 'evolves_from_species_id': 239, 'evolution_chain_id': 60, 'is_baby': 0},
-    'magmar': {'species_id': 126, 'species_name': 'magmar', 'generation_id': 1, 'evolves_from_species_id': 240, 'evolution_chain_id': 61, 'is_baby': 0},
-    'pinsir': {'species_id': 127, 'species_name': 'pinsir', 'generation_id': 1, 'evolves_from_species_id': None, 'evolution_chain_id': 62, 'is_baby': 0},
-    'tauros': {'species_id': 128, 'species_name': 'tauros', 'generation_id': 1, 'evolves_from_species_id': None, 'evolution_chain_id': 63, 'is_baby': 0},
-    'magikarp': {'species_id': 129, 'species_name': 'magikarp', 'generation_id': 1, 'evolves_from_species_id': None, 'evolution_chain_id': 64, 'is_baby': 0},
-    'gyarados': {'species_id': 130, 'species_name': 'gyarados', 'generation_id': 1, 'evolves_from_species_id': 129, 'evolution_chain_id': 64, 'is_baby': 0},
-    'lapras': {'species_id': 131, 'species_name': 'lapras', 'generation_id': 1, 'evolves_from_species_id': None, 'evolution_chain_id': 65, 'is_baby': 0},
-    'ditto': {'species_id': 132, 'species_name': 'ditto', 'generation_id': 1, 'evolves_from_species_id': None, 'evolution_chain_id': 66, 'is_baby': 0},
-    'eevee': {'species_id': 133, 'species_name': 'eevee', 'generation_id': 1, 'evolves_from_species_id': None, 'evolution_chain_id': 67, 'is_baby': 0},
-    'vaporeon': {'species_id': 134, 'species_name': 'vaporeon', 'generation_id': 1, 'evolves_from_species_id': 133, 'evolution_chain_id': 67, 'is_baby': 0},
-    'jolteon': {'species_id': 135, 'species_name': 'jolteon', 'generation_id': 1, 'evolves_from_species_id': 133, 'evolution_chain_id': 67, 'is_baby': 0},
-    'flareon': {'species_id': 136, 'species_name': 'flareon', 'generation_id': 1, 'evolves_from_species_id': 133, 'evolution_chain_id': 67, 'is_baby': 0},
-    'porygon': {'species_id': 137, 'species_name': 'porygon', 'generation_id': 1, 'evolves_from_species_id': None, 'evolution_chain_id': 68, 'is_baby': 0},
-    'omanyte': {'species_id': 138, 'species_name': 'omanyte', 'generation_id': 1, 'evolves_from_species_id': None, 'evolution_chain_id': 69, 'is_baby': 0},
-    'omastar': {'species_id': 139, 'species_name': 'omastar', 'generation_id': 1, 'evolves_from_species_id': 138, 'evolution_chain_id': 69, 'is_baby': 0},
-    'kabuto': {'species_id': 140, 'species_name': 'kabuto', 'generation_id': 1, 'evolves_from_species_id': None, 'evolution_chain_id': 70, 'is_baby': 0},
-    'kabutops': {'species_id': 141, 'species_name': 'kabutops', 'generation_id': 1, 'evolves_from_species_id': 140, 'evolution_chain_id': 70, 'is_baby': 0},
-    'aerodactyl': {'species_id': 142, 'species_name': 'aerodactyl', 'generation_id': 1, 'evolves_from_species_id': None, 'evolution_chain_id': 71, 'is_baby': 0},
-    'snorlax': {'species_id': 143, 'species_name': 'snorlax', 'generation_id': 1, 'evolves_from_species_id': 446, 'evolution_chain_id': 72, 'is_baby': 0},
-    'articuno': {'species_id': 144, 'species_name': 'articuno', 'generation_id': 1, 'evolves_from_species_id': None, 'evolution_chain_id': 73, 'is_baby': 0},
-    'zapdos': {'species_id': 145, 'species_name': 'zapdos', 'generation_id': 1, 'evolves_from_species_id': None, 'evolution_chain_id': 74, 'is_baby': 0},
-    'moltres': {'species_id': 146, 'species_name': 'moltres', 'generation_id': 1, 'evolves_from_species_id': None, 'evolution_chain_id': 75, 'is_baby': 0},
-    'dratini': {'species_id': 147, 'species_name': 'dratini', 'generation_id': 1, 'evolves_from_species_id': None, 'evolution_chain_id': 76, 'is_baby': 0},
-    'dragonair': {'species_id': 148, 'species_name': 'dragonair', 'generation_id': 1, 'evolves_from_species_id': 147, 'evolution_chain_id': 76, 'is_baby': 0},
-    'dragonite': {'species_id': 149, 'species_name': 'dragonite', 'generation_id': 1, 'evolves_from_species_id': 148, 'evolution_chain_id': 76, 'is_baby': 0},
-    'mewtwo': {'species_id': 150, 'species_name': 'mewtwo', 'generation_id': 1, 'evolves_from_species_id': None, 'evolution_chain_id': 77, 'is_baby': 0},
-    'mew': {'species_id': 151, 'species_name': 'mew', 'generation_id': 1, 'evolves_from_species_id': None, 'evolution_chain_id': 78, 'is_baby': 0},
-    'chikorita': {'species_id': 152, 'species_name': 'chikorita', 'generation_id': 2, 'evolves_from_species_id': None, 'evolution_chain_id': 79, 'is_baby': 0},
-    'bayleef': {'species_id': 153, 'species_name': 'bayleef', 'generation_id': 2, 'evolves_from_species_id': 152, 'evolution_chain_id': 79, 'is_baby': 0},
-    'meganium': {'species_id': 154, 'species_name': 'meganium', 'generation_id': 2, 'evolves_from_species_id': 153, 'evolution_chain_id': 79, 'is_baby': 0},
-    'cyndaquil': {'species_id': 155, 'species_name': 'cyndaquil', 'generation_id': 2, 'evolves_from_species_id': None, 'evolution_chain_id': 80, 'is_baby': 0},
-    'quilava': {'species_id': 156, 'species_name': 'quilava', 'generation_id': 2, 'evolves_from_species_id': 155, 'evolution_chain_id': 80, 'is_baby': 0},
-    'typhlosion': {'species_id': 157, 'species_name': 'typhlosion', 'generation_id': 2, 'evolves_from_species_id': 156, 'evolution_chain_id': 80, 'is_baby': 0},
-    'totodile': {'species_id': 158, 'species_name': 'totodile', 'generation_id': 2, 'evolves_from_species_id': None, 'evolution_chain_id': 81, 'is_baby': 0},
-    'croconaw': {'species_id': 159, 'species_name': 'croconaw', 'generation_id': 2, 'evolves_from_species_id': 158, 'evolution_chain_id': 81, 'is_baby': 0},
-    'feraligatr': {'species_id': 160, 'species_name': 'feraligatr', 'generation_id': 2, 'evolves_from_species_id': 159, 'evolution_chain_id': 81, 'is_baby': 0},
-    'sentret': {'species_id': 161, 'species_name': 'sentret', 'generation_id': 2, 'evolves_from_species_id': None, 'evolution_chain_id': 82, 'is_baby': 0},
-    'furret': {'species_id': 162, 'species_name': 'furret', 'generation_id': 2, 'evolves_from_species_id': 161, 'evolution_chain_id': 82, 'is_baby': 0},
-    'hoothoot': {'species_id': 163, 'species_name': 'hoothoot', 'generation_id': 2, 'evolves_from_species_id': None, 'evolution_chain_id': 83, 'is_baby': 0},
-    'noctowl': {'species_id': 164, 'species_name': 'noctowl', 'generation_id': 2, 'evolves_from_species_id': 163, 'evolution_chain_id': 83, 'is_baby': 0},
-    'ledyba': {'species_id': 165, 'species_name': 'ledyba', 'generation_id': 2, 'evolves_from_species_id': None, 'evolution_chain_id': 84, 'is_baby': 0},
-    'ledian': {'species_id': 166, 'species_name': 'ledian', 'generation_id': 2, 'evolves_from_species_id': 165, 'evolution_chain_id': 84, 'is_baby': 0},
-    'spinarak': {'species_id': 167, 'species_name': 'spinarak', 'generation_id': 2, 'evolves_from_species_id': None, 'evolution_chain_id': 85, 'is_baby': 0},
-    'ariados': {'species_id': 168, 'species_name': 'ariados', 'generation_id': 2, 'evolves_from_species_id': 167, 'evolution_chain_id': 85, 'is_baby': 0},
-    'crobat': {'species_id': 169, 'species_name': 'crobat', 'generation_id': 2, 'evolves_from_species_id': 42, 'evolution_chain_id': 17, 'is_baby': 0},
-    'chinchou': {'species_id': 170, 'species_name': 'chinchou', 'generation_id': 2, 'evolves_from_species_id': None, 'evolution_chain_id': 86, 'is_baby': 0},
-    'lanturn': {'species_id': 171, 'species_name': 'lanturn', 'generation_id': 2, 'evolves_from_species_id': 170, 'evolution_chain_id': 86, 'is_baby': 0},
-    'pichu': {'species_id': 172, 'species_name': 'pichu', 'generation_id': 2, 'evolves_from_species_id': None, 'evolution_chain_id': 10, 'is_baby': 1},
-    'cleffa': {'species_id': 173, 'species_name': 'cleffa', 'generation_id': 2, 'evolves_from_species_id': None, 'evolution_chain_id': 14, 'is_baby': 1},
-    'igglybuff': {'species_id': 174, 'species_name': 'igglybuff', 'generation_id': 2, 'evolves_from_species_id': None, 'evolution_chain_id': 16, 'is_baby': 1},
-    'togepi': {'species_id': 175, 'species_name': 'togepi', 'generation_id': 2, 'evolves_from_species_id': None, 'evolution_chain_id': 87, 'is_baby': 1},
-    'togetic': {'species_id': 176, 'species_name': 'togetic', 'generation_id': 2, 'evolves_from_species_id': 175, 'evolution_chain_id': 87, 'is_baby': 0},
-    'natu': {'species_id': 177, 'species_name': 'natu', 'generation_id': 2, 'evolves_from_species_id': None, 'evolution_chain_id': 88, 'is_baby': 0},
-    'xatu': {'species_id': 178, 'species_name': 'xatu', 'generation_id': 2, 'evolves_from_species_id': 177, 'evolution_chain_id': 88, 'is_baby': 0},
-    'mareep': {'species_id': 179, 'species_name': 'mareep', 'generation_id': 2, 'evolves_from_species_id': None, 'evolution_chain_id': 89, 'is_baby': 0},
-    'flaaffy': {'species_id': 180, 'species_name': 'flaaffy', 'generation_id': 2, 'evolves_from_species_id': 179, 'evolution_chain_id': 89, 'is_baby': 0},
-    'ampharos': {'species_id': 181, 'species_name': 'ampharos', 'generation_id': 2, 'evolves_from_species_id': 180, 'evolution_chain_id': 89, 'is_baby': 0},
-    'bellossom': {'species_id': 182, 'species_name': 'bellossom', 'generation_id': 2, 'evolves_from_species_id': 44, 'evolution_chain_id': 18, 'is_baby': 0},
-    'marill': {'species_id': 183, 'species_name': 'marill', 'generation_id': 2, 'evolves_from_species_id': 298, 'evolution_chain_id': 90, 'is_baby': 0},
-    'azumarill': {'species_id': 184, 'species_name': 'azumarill', 'generation_id': 2, 'evolves_from_species_id': 183, 'evolution_chain_id': 90, 'is_baby': 0},
-    'sudowoodo': {'species_id': 185, 'species_name': 'sudowoodo', 'generation_id': 2, 'evolves_from_species_id': 438, 'evolution_chain_id': 91, 'is_baby': 0},
-    'politoed': {'species_id': 186, 'species_name': 'politoed', 'generation_id': 2, 'evolves_from_species_id': 61, 'evolution_chain_id': 26, 'is_baby': 0},
-    'hoppip': {'species_id': 187, 'species_name': 'hoppip', 'generation_id': 2, 'evolves_from_species_id': None, 'evolution_chain_id': 92, 'is_baby': 0},
-    'skiploom': {'species_id': 188, 'species_name': 'skiploom', 'generation_id': 2, 'evolves_from_species_id': 187, 'evolution_chain_id': 92, 'is_baby': 0},
-    'jumpluff': {'species_id': 189, 'species_name': 'jumpluff', 'generation_id': 2, 'evolves_from_species_id': 188, 'evolution_chain_id': 92, 'is_baby': 0},
-    'aipom': {'species_id': 190, 'species_name': 'aipom', 'generation_id': 2, 'evolves_from_species_id': None, 'evolution_chain_id': 93, 'is_baby': 0},
-    'sunkern': {'species_id': 191, 'species_name': 'sunkern', 'generation_id': 2, 'evolves_from_species_id': None, 'evolution_chain_id': 94, 'is_baby': 0},
-    'sunflora': {'species_id': 192, 'species_name': 'sunflora', 'generation_id': 2, 'evolves_from_species_id': 191, 'evolution_chain_id': 94, 'is_baby': 0},
-    'yanma': {'species_id': 193, 'species_name': 'yanma', 'generation_id': 2, 'evolves_from_species_id': None, 'evolution_chain_id': 95, 'is_baby': 0},
-    'wooper': {'species_id': 194, 'species_name': 'wooper', 'generation_id': 2, 'evolves_from_species_id': None, 'evolution_chain_id': 96, 'is_baby': 0},
-    'quagsire': {'species_id': 195, 'species_name': 'quagsire', 'generation_id': 2, 'evolves_from_species_id': 194, 'evolution_chain_id': 96, 'is_baby': 0},
-    'espeon': {'species_id': 196, 'species_name': 'espeon', 'generation_id': 2, 'evolves_from_species_id': 133, 'evolution_chain_id': 67, 'is_baby': 0},
-    'umbreon': {'species_id': 197, 'species_name': 'umbreon', 'generation_id': 2, 'evolves_from_species_id': 133, 'evolution_chain_id': 67, 'is_baby': 0},
-    'murkrow': {'species_id': 198, 'species_name': 'murkrow', 'generation_id': 2, 'evolves_from_species_id': None, 'evolution_chain_id': 97, 'is_baby': 0},
-    'slowking': {'species_id': 199, 'species_name': 'slowking', 'generation_id': 2, 'evolves_from_species_id': 79, 'evolution_chain_id': 33, 'is_baby': 0},
-    'misdreavus': {'species_id': 200, 'species_name': 'misdreavus', 'generation_id': 2, 'evolves_from_species_id': None, 'evolution_chain_id': 98, 'is_baby': 0},
-    'unown': {'species_id': 201, 'species_name': 'unown', 'generation_id': 2, 'evolves_from_species_id': None, 'evolution_chain_id': 99, 'is_baby': 0},
-    'wobbuffet': {'species_id': 202, 'species_name': 'wobbuffet', 'generation_id': 2, 'evolves_from_species_id': 360, 'evolution_chain_id': 100, 'is_baby': 0},
-    'girafarig': {'species_id': 203, 'species_name': 'girafarig', 'generation_id': 2, 'evolves_from_species_id': None, 'evolution_chain_id': 101, 'is_baby': 0},
-    'pineco': {'species_id': 204, 'species_name': 'pineco', 'generation_id': 2, 'evolves_from_species_id': None, 'evolution_chain_id': 102, 'is_baby': 0},
-    'forretress': {'species_id': 205, 'species_name': 'forretress', 'generation_id': 2, 'evolves_from_species_id': 204, 'evolution_chain_id': 102, 'is_baby': 0},
-    'dunsparce': {'species_id': 206, 'species_name': 'dunsparce', 'generation_id': 2, 'evolves_from_species_id': None, 'evolution_chain_id': 103, 'is_baby': 0},
-    'gligar': {'species_id': 207, 'species_name': 'gligar', 'generation_id': 2, 'evolves_from_species_id': None, 'evolution_chain_id': 104, 'is_baby': 0},
-    'steelix': {'species_id': 208, 'species_name': 'steelix', 'generation_id': 2, 'evolves_from_species_id': 95, 'evolution_chain_id': 41, 'is_baby': 0},
-    'snubbull': {'species_id': 209, 'species_name': 'snubbull', 'generation_id': 2, 'evolves_from_species_id': None, 'evolution_chain_id': 105, 'is_baby': 0},
-    'granbull': {'species_id': 210, 'species_name': 'granbull', 'generation_id': 2, 'evolves_from_species_id': 209, 'evolution_chain_id': 105, 'is_baby': 0},
-    'qwilfish': {'species_id': 211, 'species_name': 'qwilfish', 'generation_id': 2, 'evolves_from_species_id': None, 'evolution_chain_id': 106, 'is_baby': 0},
-    'scizor': {'species_id': 212, 'species_name': 'scizor', 'generation_id': 2, 'evolves_from_species_id': 123, 'evolution_chain_id': 58, 'is_baby': 0},
-    'shuckle': {'species_id': 213, 'species_name': 'shuckle', 'generation_id': 2, 'evolves_from_species_id': None, 'evolution_chain_id': 107, 'is_baby': 0},
-    'heracross': {'species_id': 214, 'species_name': 'heracross', 'generation_id': 2, 'evolves_from_species_id': None, 'evolution_chain_id': 108, 'is_baby': 0},
-    'sneasel': {'species_id': 215, 'species_name': 'sneasel', 'generation_id': 2, 'evolves_from_species_id': None, 'evolution_chain_id': 109, 'is_baby': 0},
-    'teddiursa': {'species_id': 216, 'species_name': 'teddiursa', 'generation_id': 2, 'evolves_from_species_id': None, 'evolution_chain_id': 110, 'is_baby': 0},
-    'ursaring': {'species_id': 217, 'species_name': 'ursaring', 'generation_id': 2, 'evolves_from_species_id': 216, 'evolution_chain_id': 110, 'is_baby': 0},
-    'slugma': {'species_id': 218, 'species_name': 'slugma', 'generation_id': 2, 'evolves_from_species_id': None, 'evolution_chain_id': 111, 'is_baby': 0},
-    'magcargo': {'species_id': 219, 'species_name': 'magcargo', 'generation_id': 2, 'evolves_from_species_id': 218, 'evolution_chain_id': 111, 'is_baby': 0},
-    'swinub': {'species_id': 220, 'species_name': 'swinub', 'generation_id': 2, 'evolves_from_species_id': None, 'evolution_chain_id': 112, 'is_baby': 0},
-    'piloswine': {'species_id': 221, 'species_name': 'piloswine', 'generation_id': 2, 'evolves_from_species_id': 220, 'evolution_chain_id': 112, 'is_baby': 0},
-    'corsola': {'species_id': 222, 'species_name': 'corsola', 'generation_id': 2, 'evolves_from_species_id': None, 'evolution_chain_id': 113, 'is_baby': 0},
-    'remoraid': {'species_id': 223, 'species_name': 'remoraid', 'generation_id': 2, 'evolves_from_species_id': None, 'evolution_chain_id': 114, 'is_baby': 0},
-    'octillery': {'species_id': 224, 'species_name': 'octillery', 'generation_id': 2, 'evolves_from_species_id': 223, 'evolution_chain_id': 114, 'is_baby': 0},
-    'delibird': {'species_id': 225, 'species_name': 'delibird', 'generation_id': 2, 'evolves_from_species_id': None, 'evolution_chain_id': 115, 'is_baby': 0},
-    'mantine': {'species_id': 226, 'species_name': 'mantine', 'generation_id': 2, 'evolves_from_species_id': 458, 'evolution_chain_id': 116, 'is_baby': 0},
-    'skarmory': {'species_id': 227, 'species_name': 'skarmory', 'generation_id': 2, 'evolves_from_species_id': None, 'evolution_chain_id': 117, 'is_baby': 0},
-    'houndour': {'species_id': 228, 'species_name': 'houndour', 'generation_id': 2, 'evolves_from_species_id': None, 'evolution_chain_id': 118, 'is_baby': 0},
-    'houndoom': {'species_id': 229, 'species_name': 'houndoom', 'generation_id': 2, 'evolves_from_species_id': 228, 'evolution_chain_id': 118, 'is_baby': 0},
-    'kingdra': {'species_id': 230, 'species_name': 'kingdra', 'generation_id': 2, 'evolves_from_species_id': 117, 'evolution_chain_id': 54, 'is_baby': 0},
-    'phanpy': {'species_id': 231, 'species_name': 'phanpy', 'generation_id': 2, 'evolves_from_species_id': None, 'evolution_chain_id': 119, 'is_baby': 0},
-    'donphan': {'species_id': 232, 'species_name': 'donphan', 'generation_id': 2, 'evolves_from_species_id': 231, 'evolution_chain_id': 119, 'is_baby': 0},
-    'porygon2': {'species_id': 233, 'species_name': 'porygon2', 'generation_id': 2, 'evolves_from_species_id': 137, 'evolution_chain_id': 68,'is_baby': 0},
-    'stantler': {'species_id': 234, 'species_name': 'stantler', 'generation_id': 2, 'evolves_from_species_id': None, 'evolution_chain_id': 120, 'is_baby': 0},
-    'smeargle': {'species_id': 235, 'species_name': 'smeargle', 'generation_id': 2, 'evolves_from_species_id': None, 'evolution_chain_id': 121, 'is_baby': 0},
-    'tyrogue': {'species_id': 236, 'species_name': 'tyrogue', 'generation_id': 2, 'evolves_from_species_id': None, 'evolution_chain_id': 47, 'is_baby': 1},
-    'hitmontop': {'species_id': 237, 'species_name': 'hitmontop', 'generation_id': 2, 'evolves_from_species_id': 236, 'evolution_chain_id': 47, 'is_baby': 0},
-    'smoochum': {'species_id': 238, 'species_name': 'smoochum', 'generation_id': 2, 'evolves_from_species_id': None, 'evolution_chain_id': 59, 'is_baby': 1},
-    'elekid': {'species_id': 239, 'species_name': 'elekid', 'generation_id': 2, 'evolves_from_species_id': None, 'evolution_chain_id': 60, 'is_baby': 1},
-    'magby': {'species_id': 240, 'species_name': 'magby', 'generation_id': 2, 'evolves_from_species_id': None, 'evolution_chain_id': 61, 'is_baby': 1},
-    'miltank': {'species_id': 241, 'species_name': 'miltank', 'generation_id': 2, 'evolves_from_species_id': None, 'evolution_chain_id': 122, 'is_baby': 0},
-    'blissey': {'species_id': 242, 'species_name': 'blissey', 'generation_id': 2, 'evolves_from_species_id': 113, 'evolution_chain_id': 51, 'is_baby': 0},
-    'raikou': {'species_id': 243, 'species_name': 'raikou', 'generation_id': 2, 'evolves_from_species_id': None, 'evolution_chain_id': 123, 'is_baby': 0},
-    'entei': {'species_id': 244, 'species_name': 'entei', 'generation_id': 2, 'evolves_from_species_id': None, 'evolution_chain_id': 124, 'is_baby': 0},
-    'suicune': {'species_id': 245, 'species_name': 'suicune', 'generation_id': 2, 'evolves_from_species_id': None, 'evolution_chain_id': 125, 'is_baby': 0},
-    'larvitar': {'species_id': 246, 'species_name': 'larvitar', 'generation_id': 2, 'evolves_from_species_id': None, 'evolution_chain_id': 126, 'is_baby': 0},
-    'pupitar': {'species_id': 247, 'species_name': 'pupitar', 'generation_id': 2, 'evolves_from_species_id': 246, 'evolution_chain_id': 126, 'is_baby': 0},
-    'tyranitar': {'species_id': 248, 'species_name': 'tyranitar', 'generation_id': 2, 'evolves_from_species_id': 247, 'evolution_chain_id': 126, 'is_baby': 0},
-    'lugia': {'species_id': 249, 'species_name': 'lugia', 'generation_id': 2, 'evolves_from_species_id': None, 'evolution_chain_id': 127, 'is_baby': 0},
-    'ho-oh': {'species_id': 250, 'species_name': 'ho-oh', 'generation_id': 2, 'evolves_from_species_id': None, 'evolution_chain_id': 128, 'is_baby': 0},
-    'celebi': {'species_id': 251, 'species_name': 'celebi', 'generation_id': 2, 'evolves_from_species_id': None, 'evolution_chain_id': 129, 'is_baby': 0},
-    'treecko': {'species_id': 252, 'species_name': 'treecko', 'generation_id': 3, 'evolves_from_species_id': None, 'evolution_chain_id': 130, 'is_baby': 0},
-    'grovyle': {'species_id': 253, 'species_name': 'grovyle', 'generation_id': 3, 'evolves_from_species_id': 252, 'evolution_chain_id': 130, 'is_baby': 0},
-    'sceptile': {'species_id': 254, 'species_name': 'sceptile', 'generation_id': 3, 'evolves_from_species_id': 253, 'evolution_chain_id': 130, 'is_baby': 0},
-    'torchic': {'species_id': 255, 'species_name': 'torchic', 'generation_id': 3, 'evolves_from_species_id': None, 'evolution_chain_id': 131, 'is_baby': 0},
-    'combusken': {'species_id': 256, 'species_name': 'combusken', 'generation_id': 3, 'evolves_from_species_id': 255, 'evolution_chain_id': 131, 'is_baby': 0},
-    'blaziken': {'species_id': 257, 'species_name': 'blaziken', 'generation_id': 3, 'evolves_from_species_id': 256, 'evolution_chain_id': 131, 'is_baby': 0},
-    'mudkip': {'species_id': 258, 'species_name': 'mudkip', 'generation_id': 3, 'evolves_from_species_id': None, 'evolution_chain_id': 132, 'is_baby': 0},
-    'marshtomp': {'species_id': 259, 'species_name': 'marshtomp', 'generation_id': 3, 'evolves_from_species_id': 258, 'evolution_chain_id': 132, 'is_baby': 0},
-    'swampert': {'species_id': 260, 'species_name': 'swampert', 'generation_id': 3, 'evolves_from_species_id': 259, 'evolution_chain_id': 132, 'is_baby': 0},
-    'poochyena': {'species_id': 261, 'species_name': 'poochyena', 'generation_id': 3, 'evolves_from_species_id': None, 'evolution_chain_id': 133, 'is_baby': 0},
-    'mightyena': {'species_id': 262, 'species_name': 'mightyena', 'generation_id': 3, 'evolves_from_species_id': 261, 'evolution_chain_id': 133, 'is_baby': 0},
-    'zigzagoon': {'species_id': 263, 'species_name': 'zigzagoon', 'generation_id': 3, 'evolves_from_species_id': None, 'evolution_chain_id': 134, 'is_baby': 0},
-    'linoone': {'species_id': 264, 'species_name': 'linoone', 'generation_id': 3, 'evolves_from_species_id': 263, 'evolution_chain_id': 134, 'is_baby': 0},
-    'wurmple': {'species_id': 265, 'species_name': 'wurmple', 'generation_id': 3, 'evolves_from_species_id': None, 'evolution_chain_id': 135, 'is_baby': 0},
-    'silcoon': {'species_id': 266, 'species_name': 'silcoon', 'generation_id': 3, 'evolves_from_species_id': 265, 'evolution_chain_id': 135, 'is_baby': 0},
-    'beautifly': {'species_id': 267, 'species_name': 'beautifly', 'generation_id': 3, 'evolves_from_species_id': 266, 'evolution_chain_id': 135, 'is_baby': 0},
-    'cascoon': {'species_id': 268, 'species_name': 'cascoon', 'generation_id': 3, 'evolves_from_species_id': 265, 'evolution_chain_id': 135, 'is_baby': 0},
-    'dustox': {'species_id': 269, 'species_name': 'dustox', 'generation_id': 3, 'evolves_from_species_id': 268, 'evolution_chain_id': 135, 'is_baby': 0},
-    'lotad': {'species_id': 270, 'species_name': 'lotad', 'generation_id': 3, 'evolves_from_species_id': None, 'evolution_chain_id': 136, 'is_baby': 0},
-    'lombre': {'species_id': 271, 'species_name': 'lombre', 'generation_id': 3, 'evolves_from_species_id': 270, 'evolution_chain_id': 136, 'is_baby': 0},
-    'ludicolo': {'species_id': 272, 'species_name': 'ludicolo', 'generation_id': 3, 'evolves_from_species_id': 271, 'evolution_chain_id': 136, 'is_baby': 0},
-    'seedot': {'species_id': 273, 'species_name': 'seedot', 'generation_id': 3, 'evolves_from_species_id': None, 'evolution_chain_id': 137, 'is_baby': 0},
-    'nuzleaf': {'species_id': 274, 'species_name': 'nuzleaf', 'generation_id': 3, 'evolves_from_species_id': 273, 'evolution_chain_id': 137, 'is_baby': 0},
-    'shiftry': {'species_id': 275, 'species_name': 'shiftry', 'generation_id': 3, 'evolves_from_species_id': 274, 'evolution_chain_id': 137, 'is_baby': 0},
-    'taillow': {'species_id': 276, 'species_name': 'taillow', 'generation_id': 3, 'evolves_from_species_id': None, 'evolution_chain_id': 138, 'is_baby': 0},
-    'swellow': {'species_id': 277, 'species_name': 'swellow', 'generation_id': 3, 'evolves_from_species_id': 276, 'evolution_chain_id': 138, 'is_baby': 0},
-    'wingull': {'species_id': 278, 'species_name': 'wingull', 'generation_id': 3, 'evolves_from_species_id': None, 'evolution_chain_id': 139, 'is_baby': 0},
-    'pelipper': {'species_id': 279, 'species_name': 'pelipper', 'generation_id': 3, 'evolves_from_species_id': 278, 'evolution_chain_id': 139, 'is_baby': 0},
-    'ralts': {'species_id': 280, 'species_name': 'ralts', 'generation_id': 3, 'evolves_from_species_id': None, 'evolution_chain_id': 140, 'is_baby': 0},
-    'kirlia': {'species_id': 281, 'species_name': 'kirlia', 'generation_id': 3, 'evolves_from_species_id': 280, 'evolution_chain_id': 140, 'is_baby': 0},
-    'gardevoir': {'species_id': 282, 'species_name': 'gardevoir', 'generation_id': 3, 'evolves_from_species_id': 281, 'evolution_chain_id': 140, 'is_baby': 0},
-    'surskit': {'species_id': 283, 'species_name': 'surskit', 'generation_id': 3, 'evolves_from_species_id': None, 'evolution_chain_id': 141, 'is_baby': 0},
-    'masquerain': {'species_id': 284, 'species_name': 'masquerain', 'generation_id': 3, 'evolves_from_species_id': 283, 'evolution_chain_id': 141, 'is_baby': 0},
-    'shroomish': {'species_id': 285, 'species_name': 'shroomish', 'generation_id': 3, 'evolves_from_species_id': None, 'evolution_chain_id': 142, 'is_baby': 0},
-    'breloom': {'species_id': 286, 'species_name': 'breloom', 'generation_id': 3, 'evolves_from_species_id': 285, 'evolution_chain_id': 142, 'is_baby': 0},
-    'slakoth': {'species_id': 287, 'species_name': 'slakoth', 'generation_id': 3, 'evolves_from_species_id': None, 'evolution_chain_id': 143, 'is_baby': 0},
-    'vigoroth': {'species_id': 288, 'species_name': 'vigoroth', 'generation_id': 3, 'evolves_from_species_id': 287, 'evolution_chain_id': 143, 'is_baby': 0},
-    'slaking': {'species_id': 289, 'species_name': 'slaking', 'generation_id': 3, 'evolves_from_species_id': 288, 'evolution_chain_id': 143, 'is_baby': 0},
-    'nincada': {'species_id': 290, 'species_name': 'nincada', 'generation_id': 3, 'evolves_from_species_id': None, 'evolution_chain_id': 144, 'is_baby': 0},
-    'ninjask': {'species_id': 291, 'species_name': 'ninjask', 'generation_id': 3, 'evolves_from_species_id': 290, 'evolution_chain_id': 144, 'is_baby': 0},
-    'shedinja': {'species_id': 292, 'species_name': 'shedinja', 'generation_id': 3, 'evolves_from_species_id': 290, 'evolution_chain_id': 144, 'is_baby': 0},
-    'whismur': {'species_id': 293, 'species_name': 'whismur', 'generation_id': 3, 'evolves_from_species_id': None, 'evolution_chain_id': 145, 'is_baby': 0},
-    'loudred': {'species_id': 294, 'species_name': 'loudred', 'generation_id': 3, 'evolves_from_species_id': 293, 'evolution_chain_id': 145, 'is_baby': 0},
-    'exploud': {'species_id': 295, 'species_name': 'exploud', 'generation_id': 3, 'evolves_from_species_id': 294, 'evolution_chain_id': 145, 'is_baby': 0},
-    'makuhita': {'species_id': 296, 'species_name': 'makuhita', 'generation_id': 3, 'evolves_from_species_id': None, 'evolution_chain_id': 146, 'is_baby': 0},
-    'hariyama': {'species_id': 297, 'species_name': 'hariyama', 'generation_id': 3, 'evolves_from_species_id': 296, 'evolution_chain_id': 146, 'is_baby': 0},
-    'azurill': {'species_id': 298, 'species_name': 'azurill', 'generation_id': 3, 'evolves_from_species_id': None, 'evolution_chain_id': 90, 'is_baby': 1},
-    'nosepass': {'species_id': 299, 'species_name': 'nosepass', 'generation_id': 3, 'evolves_from_species_id': None, 'evolution_chain_id': 147, 'is_baby': 0},
-    'skitty': {'species_id': 300, 'species_name': 'skitty', 'generation_id': 3, 'evolves_from_species_id': None, 'evolution_chain_id': 148, 'is_baby': 0},
-    'delcatty': {'species_id': 301, 'species_name': 'delcatty', 'generation_id': 3, 'evolves_from_species_id': 300, 'evolution_chain_id': 148, 'is_baby': 0},
-    'sableye': {'species_id': 302, 'species_name': 'sableye', 'generation_id': 3, 'evolves_from_species_id': None, 'evolution_chain_id': 149, 'is_baby': 0},
-    'mawile': {'species_id': 303, 'species_name': 'mawile', 'generation_id': 3, 'evolves_from_species_id': None, 'evolution_chain_id': 150, 'is_baby': 0},
-    'aron': {'species_id': 304, 'species_name': 'aron', 'generation_id': 3, 'evolves_from_species_id': None, 'evolution_chain_id': 151, 'is_baby': 0},
-    'lairon': {'species_id': 305, 'species_name': 'lairon', 'generation_id': 3, 'evolves_from_species_id': 304, 'evolution_chain_id': 151, 'is_baby': 0},
-    'aggron': {'species_id': 306, 'species_name': 'aggron', 'generation_id': 3, 'evolves_from_species_id': 305, 'evolution_chain_id': 151, 'is_baby': 0},
-    'meditite': {'species_id': 307, 'species_name': 'meditite', 'generation_id': 3, 'evolves_from_species_id': None, 'evolution_chain_id': 152, 'is_baby': 0},
-    'medicham': {'species_id': 308, 'species_name': 'medicham', 'generation_id': 3, 'evolves_from_species_id': 307, 'evolution_chain_id': 152, 'is_baby': 0},
-    'electrike': {'species_id': 309, 'species_name': 'electrike', 'generation_id': 3, 'evolves_from_species_id': None, 'evolution_chain_id': 153, 'is_baby': 0},
-    'manectric': {'species_id': 310, 'species_name': 'manectric', 'generation_id': 3, 'evolves_from_species_id': 309, 'evolution_chain_id': 153, 'is_baby': 0},
-    'plusle': {'species_id': 311, 'species_name': 'plusle', 'generation_id': 3, 'evolves_from_species_id': None, 'evolution_chain_id': 154, 'is_baby': 0},
-    'minun': {'species_id': 312, 'species_name': 'minun', 'generation_id': 3, 'evolves_from_species_id': None, 'evolution_chain_id': 155, 'is_baby': 0},
-    'volbeat': {'species_id': 313, 'species_name': 'volbeat', 'generation_id': 3, 'evolves_from_species_id': None, 'evolution_chain_id': 156, 'is_baby': 0},
-    'illumise': {'species_id': 314, 'species_name': 'illumise', 'generation_id': 3, 'evolves_from_species_id': None, 'evolution_chain_id': 157, 'is_baby': 0},
-    'roselia': {'species_id': 315, 'species_name': 'roselia', 'generation_id': 3, 'evolves_from_species_id': 406, 'evolution_chain_id': 158, 'is_baby': 0},
-    'gulpin': {'species_id': 316, 'species_name': 'gulpin', 'generation_id': 3, 'evolves_from_species_id': None, 'evolution_chain_id': 159, 'is_baby': 0},
-    'swalot': {'species_id': 317, 'species_name': 'swalot', 'generation_id': 3, 'evolves_from_species_id': 316, 'evolution_chain_id': 159, 'is_baby': 0},
-    'carvanha': {'species_id': 318, 'species_name': 'carvanha', 'generation_id': 3, 'evolves_from_species_id': None, 'evolution_chain_id': 160, 'is_baby': 0},
-    'sharpedo': {'species_id': 319, 'species_name': 'sharpedo', 'generation_id': 3, 'evolves_from_species_id': 318, 'evolution_chain_id': 160, 'is_baby': 0},
-    'wailmer': {'species_id': 320, 'species_name': 'wailmer', 'generation_id': 3, 'evolves_from_species_id': None, 'evolution_chain_id': 161, 'is_baby': 0},
-    'wailord': {'species_id': 321, 'species_name': 'wailord', 'generation_id': 3, 'evolves_from_species_id': 320, 'evolution_chain_id': 161, 'is_baby': 0},
-    'numel': {'species_id': 322, 'species_name': 'numel', 'generation_id': 3, 'evolves_from_species_id': None, 'evolution_chain_id': 162, 'is_baby': 0},
-    'camerupt': {'species_id': 323, 'species_name': 'camerupt', 'generation_id': 3, 'evolves_from_species_id': 322, 'evolution_chain_id': 162, 'is_baby': 0},
-    'torkoal': {'species_id': 324, 'species_name': 'torkoal', 'generation_id': 3, 'evolves_from_species_id': None, 'evolution_chain_id': 163, 'is_baby': 0},
-    'spoink': {'species_id': 325, 'species_name': 'spoink', 'generation_id': 3, 'evolves_from_species_id': None, 'evolution_chain_id': 164, 'is_baby': 0},
-    'grumpig': {'species_id': 326, 'species_name': 'grumpig', 'generation_id': 3, 'evolves_from_species_id': 325, 'evolution_chain_id': 164, 'is_baby': 0},
-    'spinda': {'species_id': 327, 'species_name': 'spinda', 'generation_id': 3, 'evolves_from_species_id': None, 'evolution_chain_id': 165, 'is_baby': 0},
-    'trapinch': {'species_id': 328, 'species_name': 'trapinch', 'generation_id': 3, 'evolves_from_species_id': None, 'evolution_chain_id': 166, 'is_baby': 0},
-    'vibrava': {'species_id': 329, 'species_name': 'vibrava', 'generation_id': 3, 'evolves_from_species_id': 328, 'evolution_chain_id': 166, 'is_baby': 0},
-    'flygon': {'species_id': 330, 'species_name': 'flygon', 'generation_id': 3, 'evolves_from_species_id': 329, 'evolution_chain_id': 166, 'is_baby': 0},
-    'cacnea': {'species_id': 331, 'species_name': 'cacnea', 'generation_id': 3, 'evolves_from_species_id': None, 'evolution_chain_id': 167, 'is_baby': 0},
-    'cacturne': {'species_id': 332, 'species_name': 'cacturne', 'generation_id': 3, 'evolves_from_species_id': 331, 'evolution_chain_id': 167, 'is_baby': 0},
-    'swablu': {'species_id': 333, 'species_name': 'swablu', 'generation_id': 3, 'evolves_from_species_id': None, 'evolution_chain_id': 168, 'is_baby': 0},
-    'altaria': {'species_id': 334, 'species_name': 'altaria', 'generation_id': 3, 'evolves_from_species_id': 333, 'evolution_chain_id': 168, 'is_baby': 0},
-    'zangoose': {'species_id': 335, 'species_name': 'zangoose', 'generation_id': 3, 'evolves_from_species_id': None, 'evolution_chain_id': 169, 'is_baby': 0},
-    'seviper': {'species_id': 336, 'species_name': 'seviper', 'generation_id': 3, 'evolves_from_species_id': None, 'evolution_chain_id': 170, 'is_baby': 0},
-    'lunatone': {'species_id': 337, 'species_name': 'lunatone', 'generation_id': 3, 'evolves_from_species_id': None, 'evolution_chain_id': 171, 'is_baby': 0},
-    'solrock': {'species_id': 338, 'species_name': 'solrock', 'generation_id': 3, 'evolves_from_species_id': None, 'evolution_chain_id': 172, 'is_baby': 0},
-    'barboach': {'species_id': 339, 'species_name': 'barboach', 'generation_id': 3, 'evolves_from_species_id': None, 'evolution_chain_id': 173, 'is_baby': 0},
-    'whiscash': {'species_id': 340, 'species_name': 'whiscash', 'generation_id': 3, 'evolves_from_species_id': 339, 'evolution_chain_id': 173, 'is_baby': 0},
-    'corphish': {'species_id': 341, 'species_name': 'corphish', 'generation_id': 3, 'evolves_from_species_id': None, 'evolution_chain_id': 174, 'is_baby': 0},
-    'crawdaunt': {'species_id': 342, 'species_name': 'crawdaunt', 'generation_id': 3, 'evolves_from_species_id': 341, 'evolution_chain_id': 174, 'is_baby': 0},
-    'baltoy': {'species_id': 343, 'species_name': 'baltoy', 'generation_id': 3, 'evolves_from_species_id': None, 'evolution_chain_id': 175, 'is_baby': 0},
-    'claydol': {'species_id': 344, 'species_name': 'claydol', 'generation_id': 3, 'evolves_from_species_id': 343, 'evolution_chain_id': 175, 'is_baby': 0},
-    'lileep': {'species_id': 345, 'species_name': 'lileep', 'generation_id': 3, 'evolves_from_species_id': None, 'evolution_chain_id': 176, 'is_baby': 0},
-    'cradily': {'species_id': 346, 'species_name': 'cradily', 'generation_id': 3, 'evolves_from_species_id': 345, 'evolution_chain_id': 176, 'is_baby': 0},
-    'anorith': {'species_id': 347, 'species_name': 'anorith', 'generation_id': 3, 'evolves_from_species_id': None, 'evolution_chain_id': 177, 'is_baby': 0},
-    'armaldo': {'species_id': 348, 'species_name': 'armaldo', 'generation_id': 3, 'evolves_from_species_id': 347, 'evolution_chain_id': 177, 'is_baby': 0},
-    'feebas': {'species_id': 349, 'species_name': 'feebas', 'generation_id': 3, 'evolves_from_species_id': None, 'evolution_chain_id': 178, 'is_baby': 0},
-    'milotic': {'species_id': 350, 'species_name': 'milotic', 'generation_id': 3, 'evolves_from_species_id': 349, 'evolution_chain_id': 178, 'is_baby': 0},
-    'castform': {'species_id': 351, 'species_name': 'castform', 'generation_id': 3, 'evolves_from_species_id': None, 'evolution_chain_id': 179, 'is_baby': 0},
-    'kecleon': {'species_id': 352, 'species_name': 'kecleon', 'generation_id': 3, 'evolves_from_species_id': None, 'evolution_chain_id': 180, 'is_baby': 0},
-    'shuppet': {'species_id': 353, 'species_name': 'shuppet', 'generation_id': 3, 'evolves_from_species_id': None, 'evolution_chain_id': 181, 'is_baby': 0},
-    'banette': {'species_id': 354, 'species_name': 'banette', 'generation_id': 3, 'evolves_from_species_id': 353, 'evolution_chain_id': 181, 'is_baby': 0},
-    'duskull': {'species_id': 355, 'species_name': 'duskull', 'generation_id': 3, 'evolves_from_species_id': None, 'evolution_chain_id': 182, 'is_baby': 0},
-    'dusclops': {'species_id': 356, 'species_name': 'dusclops', 'generation_id': 3, 'evolves_from_species_id': 355, 'evolution_chain_id': 182, 'is_baby': 0},
-    'tropius': {'species_id': 357, 'species_name': 'tropius', 'generation_id': 3, 'evolves_from_species_id': None, 'evolution_chain_id': 183, 'is_baby': 0},
-    'chimecho': {'species_id': 358, 'species_name': 'chimecho', 'generation_id': 3, 'evolves_from_species_id': 433, 'evolution_chain_id': 184, 'is_baby': 0},
-    'absol': {'species_id': 359, 'species_name': 'absol', 'generation_id': 3, 'evolves_from_species_id': None, 'evolution_chain_id': 185, 'is_baby': 0},
-    'wynaut': {'species_id': 360, 'species_name': 'wynaut', 'generation_id': 3, 'evolves_from_species_id': None, 'evolution_chain_id': 100, 'is_baby': 1},
-    'snorunt': {'species_id': 361, 'species_name': 'snorunt', 'generation_id': 3, 'evolves_from_species_id': None, 'evolution_chain_id': 186, 'is_baby': 0},
-    'glalie': {'species_id': 362, 'species_name': 'glalie', 'generation_id': 3, 'evolves_from_species_id': 361, 'evolution_chain_id': 186, 'is_baby': 0},
-    'spheal': {'species_id': 363, 'species_name': 'spheal', 'generation_id': 3, 'evolves_from_species_id': None, 'evolution_chain_id': 187, 'is_baby': 0},
-    'sealeo': {'species_id': 364, 'species_name': 'sealeo', 'generation_id': 3, 'evolves_from_species_id': 363, 'evolution_chain_id': 187, 'is_baby': 0},
-    'walrein': {'species_id': 365, 'species_name': 'walrein', 'generation_id': 3, 'evolves_from_species_id': 364, 'evolution_chain_id': 187, 'is_baby': 0},
-    'clamperl': {'species_id': 366, 'species_name': 'clamperl', 'generation_id': 3, 'evolves_from_species_id': None, 'evolution_chain_id': 188, 'is_baby': 0},
-    'huntail': {'species_id': 367, 'species_name': 'huntail', 'generation_id': 3, 'evolves_from_species_id': 366, 'evolution_chain_id': 188, 'is_baby': 0},
-    'gorebyss': {'species_id': 368, 'species_name': 'gorebyss', 'generation_id': 3, 'evolves_from_species_id': 366, 'evolution_chain_id': 188, 'is_baby': 0},
-    'relicanth': {'species_id': 369, 'species_name': 'relicanth', 'generation_id': 3, 'evolves_from_species_id': None, 'evolution_chain_id': 189, 'is_baby': 0},
-    'luvdisc': {'species_id': 370, 'species_name': 'luvdisc', 'generation_id': 3, 'evolves_from_species_id': None, 'evolution_chain_id': 190, 'is_baby': 0},
-    'bagon': {'species_id': 371, 'species_name': 'bagon', 'generation_id': 3, 'evolves_from_species_id': None, 'evolution_chain_id': 191, 'is_baby': 0},
-    'shelgon': {'species_id': 372, 'species_name': 'shelgon', 'generation_id': 3, 'evolves_from_species_id': 371, 'evolution_chain_id': 191, 'is_baby': 0},
-    'salamence': {'species_id': 373, 'species_name': 'salamence', 'generation_id': 3, 'evolves_from_species_id': 372, 'evolution_chain_id': 191, 'is_baby': 0},
-    'beldum': {'species_id': 374, 'species_name': 'beldum', 'generation_id': 3, 'evolves_from_species_id': None, 'evolution_chain_id': 192, 'is_baby': 0},
-    'metang': {'species_id': 375, 'species_name': 'metang', 'generation_id': 3, 'evolves_from_species_id': 374, 'evolution_chain_id': 192, 'is_baby': 0},
-    'metagross': {'species_id': 376, 'species_name': 'metagross', 'generation_id': 3, 'evolves_from_species_id': 375, 'evolution_chain_id': 192, 'is_baby': 0},
-    'regirock': {'species_id': 377, 'species_name': 'regirock', 'generation_id': 3, 'evolves_from_species_id': None, 'evolution_chain_id': 193, 'is_baby': 0},
-    'regice': {'species_id': 378, 'species_name': 'regice', 'generation_id': 3, 'evolves_from_species_id': None, 'evolution_chain_id': 194, 'is_baby': 0},
-    'registeel': {'species_id': 379, 'species_name': 'registeel', 'generation_id': 3, 'evolves_from_species_id': None, 'evolution_chain_id': 195, 'is_baby': 0},
-    'latias': {'species_id': 380, 'species_name': 'latias', 'generation_id': 3, 'evolves_from_species_id': None, 'evolution_chain_id': 196, 'is_baby': 0},
-    'latios': {'species_id': 381, 'species_name': 'latios', 'generation_id': 3, 'evolves_from_species_id': None, 'evolution_chain_id': 197, 'is_baby': 0},
-    'kyogre': {'species_id': 382, 'species_name': 'kyogre', 'generation_id': 3, 'evolves_from_species_id': None, 'evolution_chain_id': 198, 'is_baby': 0},
-    'groudon': {'species_id': 383, 'species_name': 'groudon', 'generation_id': 3, 'evolves_from_species_id': None, 'evolution_chain_id': 199, 'is_baby': 0},
-    'rayquaza': {'species_id': 384, 'species_name': 'rayquaza', 'generation_id': 3, 'evolves_from_species_id': None, 'evolution_chain_id': 200, 'is_baby': 0},
-    'jirachi': {'species_id': 385, 'species_name': 'jirachi', 'generation_id': 3, 'evolves_from_species_id': None, 'evolution_chain_id': 201, 'is_baby': 0},
-    'deoxys': {'species_id': 386, 'species_name': 'deoxys', 'generation_id': 3, 'evolves_from_species_id': None, 'evolution_chain_id': 202, 'is_baby': 0},
-    'turtwig': {'species_id': 387, 'species_name': 'turtwig', 'generation_id': 4, 'evolves_from_species_id': None, 'evolution_chain_id': 203, 'is_baby': 0},
-    'grotle': {'species_id': 388, 'species_name': 'grotle', 'generation_id': 4, 'evolves_from_species_id': 387, 'evolution_chain_id': 203, 'is_baby': 0},
-    'torterra': {'species_id': 389, 'species_name': 'torterra', 'generation_id': 4, 'evolves_from_species_id': 388, 'evolution_chain_id': 203, 'is_baby': 0},
-    'chimchar': {'species_id': 390, 'species_name': 'chimchar', 'generation_id': 4, 'evolves_from_species_id': None, 'evolution_chain_id': 204, 'is_baby': 0},
-    'monferno': {'species_id': 391, 'species_name': 'monferno', 'generation_id': 4, 'evolves_from_species_id': 390, 'evolution_chain_id': 204, 'is_baby': 0},
-    'infernape': {'species_id': 392, 'species_name': 'infernape', 'generation_id': 4, 'evolves_from_species_id': 391, 'evolution_chain_id': 204, 'is_baby': 0},
-    'piplup': {'species_id': 393, 'species_name': 'piplup', 'generation_id': 4, 'evolves_from_species_id': None, 'evolution_chain_id': 205, 'is_baby': 0},
-    'prinplup': {'species_id': 394, 'species_name': 'prinplup', 'generation_id': 4, 'evolves_from_species_id': 393, 'evolution_chain_id': 205, 'is_baby': 0},
-    'empoleon': {'species_id': 395, 'species_name': 'empoleon', 'generation_id': 4, 'evolves_from_species_id': 394, 'evolution_chain_id': 205, 'is_baby': 0},
-    'starly': {'species_id': 396, 'species_name': 'starly', 'generation_id': 4, 'evolves_from_species_id': None, 'evolution_chain_id': 206, 'is_baby': 0},
-    'staravia': {'species_id': 397, 'species_name': 'staravia', 'generation_id': 4, 'evolves_from_species_id': 396, 'evolution_chain_id': 206, 'is_baby': 0},
-    'staraptor': {'species_id': 398, 'species_name': 'staraptor', 'generation_id': 4, 'evolves_from_species_id': 397, 'evolution_chain_id': 206, 'is_baby': 0},
-    'bidoof': {'species_id': 399, 'species_name': 'bidoof', 'generation_id': 4, 'evolves_from_species_id': None, 'evolution_chain_id': 207, 'is_baby': 0},
-    'bibarel': {'species_id': 400, 'species_name': 'bibarel', 'generation_id': 4, 'evolves_from_species_id': 399, 'evolution_chain_id': 207, 'is_baby': 0},
-    'kricketot': {'species_id': 401, 'species_name': 'kricketot', 'generation_id': 4, 'evolves_from_species_id': None, 'evolution_chain_id': 208, 'is_baby': 0},
-    'kricketune': {'species_id': 402, 'species_name': 'kricketune', 'generation_id': 4, 'evolves_from_species_id': 401, 'evolution_chain_id': 208, 'is_baby': 0},
-    'shinx': {'species_id': 403, 'species_name': 'shinx', 'generation_id': 4, 'evolves_from_species_id': None, 'evolution_chain_id': 209, 'is_baby': 0},
-    'luxio': {'species_id': 404, 'species_name': 'luxio', 'generation_id': 4, 'evolves_from_species_id': 403, 'evolution_chain_id': 209, 'is_baby': 0},
-    'luxray': {'species_id': 405, 'species_name': 'luxray', 'generation_id': 4, 'evolves_from_species_id': 404, 'evolution_chain_id': 209, 'is_baby': 0},
-    'budew': {'species_id': 406, 'species_name': 'budew', 'generation_id': 4, 'evolves_from_species_id': None, 'evolution_chain_id': 158, 'is_baby': 1},
-    'roserade': {'species_id': 407, 'species_name': 'roserade', 'generation_id': 4, 'evolves_from_species_id': 315, 'evolution_chain_id': 158, 'is_baby': 0},
-    'cranidos': {'species_id': 408, 'species_name': 'cranidos', 'generation_id': 4, 'evolves_from_species_id': None, 'evolution_chain_id': 211, 'is_baby': 0},
-    'rampardos': {'species_id': 409, 'species_name': 'rampardos', 'generation_id': 4, 'evolves_from_species_id': 408, 'evolution_chain_id': 211, 'is_baby': 0},
-    'shieldon': {'species_id': 410, 'species_name': 'shieldon', 'generation_id': 4, 'evolves_from_species_id': None, 'evolution_chain_id': 212, 'is_baby': 0},
-    'bastiodon': {'species_id': 411, 'species_name': 'bastiodon', 'generation_id': 4, 'evolves_from_species_id': 410, 'evolution_chain_id': 212, 'is_baby': 0},
-    'burmy': {'species_id': 412, 'species_name': 'burmy', 'generation_id': 4, 'evolves_from_species_id': None, 'evolution_chain_id': 213, 'is_baby': 0},
-    'wormadam': {'species_id': 413, 'species_name': 'wormadam', 'generation_id': 4, 'evolves_from_species_id': 412, 'evolution_chain_id': 213, 'is_baby': 0},
-    'mothim': {'species_id': 414, 'species_name': 'mothim', 'generation_id': 4, 'evolves_from_species_id': 412, 'evolution_chain_id': 213, 'is_baby': 0},
-    'combee': {'species_id': 415, 'species_name': 'combee', 'generation_id': 4, 'evolves_from_species_id': None, 'evolution_chain_id': 214, 'is_baby': 0},
-    'vespiquen': {'species_id': 416, 'species_name': 'vespiquen', 'generation_id': 4, 'evolves_from_species_id': 415, 'evolution_chain_id': 214, 'is_baby': 0},
-    'pachirisu': {'species_id': 417, 'species_name': 'pachirisu', 'generation_id': 4, 'evolves_from_species_id': None, 'evolution_chain_id': 215, 'is_baby': 0},
-    'buizel': {'species_id': 418, 'species_name': 'buizel', 'generation_id': 4, 'evolves_from_species_id': None, 'evolution_chain_id': 216, 'is_baby': 0},
-    'floatzel': {'species_id': 419, 'species_name': 'floatzel', 'generation_id': 4, 'evolves_from_species_id': 418, 'evolution_chain_id': 216, 'is_baby': 0},
-    'cherubi': {'species_id': 420, 'species_name': 'cherubi', 'generation_id': 4, 'evolves_from_species_id': None, 'evolution_chain_id': 217, 'is_baby': 0},
-    'cherrim': {'species_id': 421, 'species_name': 'cherrim', 'generation_id': 4, 'evolves_from_species_id': 420, 'evolution_chain_id': 217, 'is_baby': 0},
-    'shellos': {'species_id': 422, 'species_name': 'shellos', 'generation_id': 4, 'evolves_from_species_id': None, 'evolution_chain_id': 218, 'is_baby': 0},
-    'gastrodon': {'species_id': 423, 'species_name': 'gastrodon', 'generation_id': 4, 'evolves_from_species_id': 422, 'evolution_chain_id': 218, 'is_baby': 0},
-    'ambipom': {'species_id': 424, 'species_name': 'ambipom', 'generation_id': 4, 'evolves_from_species_id': 190, 'evolution_chain_id': 93, 'is_baby': 0},
-    'drifloon': {'species_id': 425, 'species_name': 'drifloon', 'generation_id': 4, 'evolves_from_species_id': None, 'evolution_chain_id': 219, 'is_baby': 0},
-    'drifblim': {'species_id': 426, 'species_name': 'drifblim', 'generation_id': 4, 'evolves_from_species_id': 425, 'evolution_chain_id': 219, 'is_baby': 0},
-    'buneary': {'species_id': 427, 'species_name': 'buneary', 'generation_id': 4, 'evolves_from_species_id': None, 'evolution_chain_id': 220, 'is_baby': 0},
-    'lopunny': {'species_id': 428, 'species_name': 'lopunny', 'generation_id': 4, 'evolves_from_species_id': 427, 'evolution_chain_id': 220, 'is_baby': 0},
-    'mismagius': {'species_id': 429, 'species_name': 'mismagius', 'generation_id': 4, 'evolves_from_species_id': 200, 'evolution_chain_id': 98, 'is_baby': 0},
-    'honchkrow': {'species_id': 430, 'species_name': 'honchkrow', 'generation_id': 4, 'evolves_from_species_id': 198, 'evolution_chain_id': 97, 'is_baby': 0},
-    'glameow': {'species_id': 431, 'species_name': 'glameow', 'generation_id': 4, 'evolves_from_species_id': None, 'evolution_chain_id': 221, 'is_baby': 0},
-    'purugly': {'species_id': 432, 'species_name': 'purugly', 'generation_id': 4, 'evolves_from_species_id': 431, 'evolution_chain_id': 221, 'is_baby': 0},
-    'chingling': {'species_id': 433, 'species_name': 'chingling', 'generation_id': 4, 'evolves_from_species_id': None, 'evolution_chain_id': 184, 'is_baby': 1},
-    'stunky': {'species_id': 434, 'species_name': 'stunky', 'generation_id': 4, 'evolves_from_species_id': None, 'evolution_chain_id': 223, 'is_baby': 0},
-    'skuntank': {'species_id': 435, 'species_name': 'skuntank', 'generation_id': 4, 'evolves_from_species_id': 434, 'evolution_chain_id': 223, 'is_baby': 0},
-    'bronzor': {'species_id': 436, 'species_name': 'bronzor', 'generation_id': 4, 'evolves_from_species_id': None, 'evolution_chain_id': 224, 'is_baby': 0},
-    'bronzong': {'species_id': 437, 'species_name': 'bronzong', 'generation_id': 4, 'evolves_from_species_id': 436, 'evolution_chain_id': 224, 'is_baby': 0},
-    'bonsly': {'species_id': 438, 'species_name': 'bonsly', 'generation_id': 4, 'evolves_from_species_id': None, 'evolution_chain_id': 91, 'is_baby': 1},
-    'mime-jr': {'species_id': 439, 'species_name': 'mime-jr', 'generation_id': 4, 'evolves_from_species_id': None, 'evolution_chain_id': 57, 'is_baby': 1},
-    'happiny': {'species_id': 440, 'species_name': 'happiny', 'generation_id': 4, 'evolves_from_species_id': None, 'evolution_chain_id': 51, 'is_baby': 1},
-    'chatot': {'species_id': 441, 'species_name': 'chatot', 'generation_id': 4, 'evolves_from_species_id': None, 'evolution_chain_id': 228, 'is_baby': 0},
-    'spiritomb': {'species_id': 442, 'species_name': 'spiritomb', 'generation_id': 4, 'evolves_from_species_id': None, 'evolution_chain_id': 229, 'is_baby': 0},
-    'gible': {'species_id': 443, 'species_name': 'gible', 'generation_id': 4, 'evolves_from_species_id': None, 'evolution_chain_id': 230, 'is_baby': 0},
-    'gabite': {'species_id': 444, 'species_name': 'gabite', 'generation_id': 4, 'evolves_from_species_id': 443, 'evolution_chain_id': 230, 'is_baby': 0},
-    'garchomp': {'species_id': 445, 'species_name': 'garchomp', 'generation_id': 4, 'evolves_from_species_id': 444, 'evolution_chain_id': 230, 'is_baby': 0},
-    'munchlax': {'species_id': 446, 'species_name': 'munchlax', 'generation_id': 4, 'evolves_from_species_id': None, 'evolution_chain_id': 72, 'is_baby': 1},
-    'riolu': {'species_id': 447, 'species_name': 'riolu', 'generation_id': 4, 'evolves_from_species_id': None, 'evolution_chain_id': 232, 'is_baby': 1},
-    'lucario': {'species_id': 448, 'species_name': 'lucario', 'generation_id': 4, 'evolves_from_species_id': 447, 'evolution_chain_id': 232, 'is_baby': 0},
-    'hippopotas': {'species_id': 449, 'species_name': 'hippopotas', 'generation_id': 4, 'evolves_from_species_id': None, 'evolution_chain_id': 233, 'is_baby': 0},
-    'hippowdon': {'species_id': 450, 'species_name': 'hippowdon', 'generation_id': 4, 'evolves_from_species_id': 449, 'evolution_chain_id': 233, 'is_baby': 0},
-    'skorupi': {'species_id': 451, 'species_name': 'skorupi', 'generation_id': 4, 'evolves_from_species_id': None, 'evolution_chain_id': 234, 'is_baby': 0},
-    'drapion': {'species_id': 452, 'species_name': 'drapion', 'generation_id': 4, 'evolves_from_species_id': 451, 'evolution_chain_id': 234, 'is_baby': 0},
-    'croagunk': {'species_id': 453, 'species_name': 'croagunk', 'generation_id': 4, 'evolves_from_species_id': None, 'evolution_chain_id': 235, 'is_baby': 0},
-    'toxicroak': {'species_id': 454, 'species_name': 'toxicroak', 'generation_id': 4, 'evolves_from_species_id': 453, 'evolution_chain_id': 235, 'is_baby': 0},
-    'carnivine': {'species_id': 455, 'species_name': 'carnivine', 'generation_id': 4, 'evolves_from_species_id': None, 'evolution_chain_id': 236, 'is_baby': 0},
-    'finneon': {'species_id': 456, 'species_name': 'finneon', 'generation_id': 4, 'evolves_from_species_id': None, 'evolution_chain_id': 237, 'is_baby': 0},
-    'lumineon': {'species_id': 457, 'species_name': 'lumineon', 'generation_id': 4, 'evolves_from_species_id': 456, 'evolution_chain_id': 237, 'is_baby': 0},
-    'mantyke': {'species_id': 458, 'species_name': 'mantyke', 'generation_id': 4, 'evolves_from_species_id': None, 'evolution_chain_id': 116, 'is_baby': 1},
-    'snover': {'species_id': 459, 'species_name': 'snover', 'generation_id': 4, 'evolves_from_species_id': None, 'evolution_chain_id': 239, 'is_baby': 0},
-    'abomasnow': {'species_id': 460, 'species_name': 'abomasnow', 'generation_id': 4, 'evolves_from_species_id': 459, 'evolution_chain_id': 239, 'is_baby': 0},
-    'weavile': {'species_id': 461, 'species_name': 'weavile', 'generation_id': 4, 'evolves_from_species_id': 215, 'evolution_chain_id': 109, 'is_baby': 0},
-    'magnezone': {'species_id': 462, 'species_name': 'magnezone', 'generation_id': 4, 'evolves_from_species_id': 82, 'evolution_chain_id': 34, 'is_baby': 0},
-    'lickilicky': {'species_id': 463, 'species_name': 'lickilicky', 'generation_id': 4, 'evolves_from_species_id': 108, 'evolution_chain_id': 48, 'is_baby': 0},
-    'rhyperior': {'species_id': 464, 'species_name': 'rhyperior', 'generation_id': 4, 'evolves_from_species_id': 112, 'evolution_chain_id': 50, 'is_baby': 0},
-    'tangrowth': {'species_id': 465, 'species_name': 'tangrowth', 'generation_id': 4, 'evolves_from_species_id': 114, 'evolution_chain_id': 52, 'is_baby': 0},
-    'electivire': {'species_id': 466, 'species_name': 'electivire', 'generation_id': 4, 'evolves_from_species_id': 125, 'evolution_chain_id': 60, 'is_baby': 0},
-    'magmortar': {'species_id': 467, 'species_name': 'magmortar', 'generation_id': 4, 'evolves_from_species_id': 126, 'evolution_chain_id': 61, 'is_baby': 0},
-    'togekiss': {'species_id': 468, 'species_name': 'togekiss', 'generation_id': 4, 'evolves_from_species_id': 176, 'evolution_chain_id': 87, 'is_baby': 0},
-    'yanmega': {'species_id': 469, 'species_name': 'yanmega', 'generation_id': 4, 'evolves_from_species_id': 193, 'evolution_chain_id': 95, 'is_baby': 0},
-    'leafeon': {'species_id': 470, 'species_name': 'leafeon', 'generation_id': 4, 'evolves_from_species_id': 133, 'evolution_chain_id': 67, 'is_baby': 0},
-    'glaceon': {'species_id': 471, 'species_name': 'glaceon', 'generation_id': 4, 'evolves_from_species_id': 133, 'evolution_chain_id': 67, 'is_baby': 0},
-    'gliscor': {'species_id': 472, 'species_name': 'gliscor', 'generation_id': 4, 'evolves_from_species_id': 207, 'evolution_chain_id': 104, 'is_baby': 0},
-    'mamoswine': {'species_id': 473, 'species_name': 'mamoswine', 'generation_id': 4, 'evolves_from_species_id': 221, 'evolution_chain_id': 112, 'is_baby': 0},
-    'porygon-z': {'species_id': 474, 'species_name': 'porygon-z', 'generation_id': 4, 'evolves_from_species_id': 233, 'evolution_chain_id': 68, 'is_baby': 0},
-    'gallade': {'species_id': 475, 'species_name': 'gallade', 'generation_id': 4, 'evolves_from_species_id': 281, 'evolution_chain_id': 140, 'is_baby': 0},
-    'probopass': {'species_id': 476, 'species_name': 'probopass', 'generation_id': 4, 'evolves_from_species_id': 299, 'evolution_chain_id': 147, 'is_baby': 0},
-    'dusknoir': {'species_id': 477, 'species_name': 'dusknoir', 'generation_id': 4, 'evolves_from_species_id': 356, 'evolution_chain_id': 182, 'is_baby': 0},
-    'froslass': {'species_id': 478, 'species_name': 'froslass', 'generation_id': 4, 'evolves_from_species_id': 361, 'evolution_chain_id': 186, 'is_baby': 0},
-    'rotom': {'species_id': 479, 'species_name': 'rotom', 'generation_id': 4, 'evolves_from_species_id': None, 'evolution_chain_id': 240, 'is_baby': 0},
-    'uxie': {'species_id': 480, 'species_name': 'uxie', 'generation_id': 4, 'evolves_from_species_id': None, 'evolution_chain_id': 241, 'is_baby': 0},
-    'mesprit': {'species_id': 481, 'species_name': 'mesprit', 'generation_id': 4, 'evolves_from_species_id': None, 'evolution_chain_id': 242, 'is_baby': 0},
-    'azelf': {'species_id': 482, 'species_name': 'azelf', 'generation_id': 4, 'evolves_from_species_id': None, 'evolution_chain_id': 243, 'is_baby': 0},
-    'dialga': {'species_id': 483, 'species_name': 'dialga', 'generation_id': 4, 'evolves_from_species_id': None, 'evolution_chain_id': 244, 'is_baby': 0},
-    'palkia': {'species_id': 484, 'species_name': 'palkia', 'generation_id': 4, 'evolves_from_species_id': None, 'evolution_chain_id': 245, 'is_baby': 0},
-    'heatran': {'species_id': 485, 'species_name': 'heatran', 'generation_id': 4, 'evolves_from_species_id': None, 'evolution_chain_id': 246, 'is_baby': 0},
-    'regigigas': {'species_id': 486, 'species_name': 'regigigas', 'generation_id': 4, 'evolves_from_species_id': None, 'evolution_chain_id': 247, 'is_baby': 0},
-    'giratina': {'species_id': 487, 'species_name': 'giratina', 'generation_id': 4, 'evolves_from_species_id': None, 'evolution_chain_id': 248, 'is_baby': 0},
-    'cresselia': {'species_id': 488, 'species_name': 'cresselia', 'generation_id': 4, 'evolves_from_species_id': None, 'evolution_chain_id': 249, 'is_baby': 0},
-    'phione': {'species_id': 489, 'species_name': 'phione', 'generation_id': 4, 'evolves_from_species_id': None, 'evolution_chain_id': 250, 'is_baby': 0},
-    'manaphy': {'species_id': 490, 'species_name': 'manaphy', 'generation_id': 4, 'evolves_from_species_id': None, 'evolution_chain_id': 250, 'is_baby': 0},
-    'darkrai': {'species_id': 491, 'species_name': 'darkrai', 'generation_id': 4, 'evolves_from_species_id': None, 'evolution_chain_id': 252, 'is_baby': 0},
-    'shaymin': {'species_id': 492, 'species_name': 'shaymin', 'generation_id': 4, 'evolves_from_species_id': None, 'evolution_chain_id': 253, 'is_baby': 0},
-    'arceus': {'species_id': 493, 'species_name': 'arceus', 'generation_id': 4, 'evolves_from_species_id': None, 'evolution_chain_id': 254, 'is_baby': 0},
-    'victini': {'species_id': 494, 'species_name': 'victini', 'generation_id': 5, 'evolves_from_species_id': None, 'evolution_chain_id': 255, 'is_baby': 0},
-    'snivy': {'species_id': 495, 'species_name': 'snivy', 'generation_id': 5, 'evolves_from_species_id': None, 'evolution_chain_id': 256, 'is_baby': 0},
-    'servine': {'species_id': 496, 'species_name': 'servine', 'generation_id': 5, 'evolves_from_species_id': 495, 'evolution_chain_id': 256, 'is_baby': 0},
-    'serperior': {'species_id': 497, 'species_name': 'serperior', 'generation_id': 5, 'evolves_from_species_id': 496, 'evolution_chain_id': 256, 'is_baby': 0},
-    'tepig': {'species_id': 498, 'species_name': 'tepig', 'generation_id': 5, 'evolves_from_species_id': None, 'evolution_chain_id': 257, 'is_baby': 0},
-    'pignite': {'species_id': 499, 'species_name': 'pignite', 'generation_id': 5, 'evolves_from_species_id': 498, 'evolution_chain_id': 257, 'is_baby': 0},
-    'emboar': {'species_id': 500, 'species_name': 'emboar', 'generation_id': 5, 'evolves_from_species_id': 499, 'evolution_chain_id': 257, 'is_baby': 0},
-    'oshawott': {'species_id': 501, 'species_name': 'oshawott', 'generation_id': 5, 'evolves_from_species_id': None, 'evolution_chain_id': 258, 'is_baby': 0},
-    'dewott': {'species_id': 502, 'species_name': 'dewott', 'generation_id': 5, 'evolves_from_species_id': 501, 'evolution_chain_id': 258, 'is_baby': 0},
-    'samurott': {'species_id': 503, 'species_name': 'samurott', 'generation_id': 5, 'evolves_from_species_id': 502, 'evolution_chain_id': 258, 'is_baby': 0},
-    'patrat': {'species_id': 504, 'species_name': 'patrat', 'generation_id': 5, 'evolves_from_species_id': None, 'evolution_chain_id': 259, 'is_baby': 0},
-    'watchog': {'species_id': 505, 'species_name': 'watchog', 'generation_id': 5, 'evolves_from_species_id': 504, 'evolution_chain_id': 259, 'is_baby': 0},
-    'lillipup': {'species_id': 506, 'species_name': 'lillipup', 'generation_id': 5, 'evolves_from_species_id': None, 'evolution_chain_id': 260, 'is_baby': 0},
-    'herdier': {'species_id': 507, 'species_name': 'herdier', 'generation_id': 5, 'evolves_from_species_id': 506, 'evolution_chain_id': 260, 'is_baby': 0},
-    'stoutland': {'species_id': 508, 'species_name': 'stoutland', 'generation_id': 5, 'evolves_from_species_id': 507, 'evolution_chain_id': 260, 'is_baby': 0},
-    'purrloin': {'species_id': 509, 'species_name': 'purrloin', 'generation_id': 5, 'evolves_from_species_id': None, 'evolution_chain_id': 261, 'is_baby': 0},
-    'liepard': {'species_id': 510, 'species_name': 'liepard', 'generation_id': 5, 'evolves_from_species_id': 509, 'evolution_chain_id': 261, 'is_baby': 0},
-    'pansage': {'species_id': 511, 'species_name': 'pansage', 'generation_id': 5, 'evolves_from_species_id': None, 'evolution_chain_id': 262, 'is_baby': 0},
-    'simisage': {'species_id': 512, 'species_name': 'simisage', 'generation_id': 5, 'evolves_from_species_id': 511, 'evolution_chain_id': 262, 'is_baby': 0},
-    'pansear': {'species_id': 513, 'species_name': 'pansear', 'generation_id': 5, 'evolves_from_species_id': None, 'evolution_chain_id': 263, 'is_baby': 0},
-    'simisear': {'species_id': 514, 'species_name': 'simisear', 'generation_id': 5, 'evolves_from_species_id': 513, 'evolution_chain_id': 263, 'is_baby': 0},
-    'panpour': {'species_id': 515, 'species_name': 'panpour', 'generation_id': 5, 'evolves_from_species_id': None, 'evolution_chain_id': 264, 'is_baby': 0},
-    'simipour': {'species_id': 516, 'species_name': 'simipour', 'generation_id': 5, 'evolves_from_species_id': 515, 'evolution_chain_id': 264, 'is_baby': 0},
-    'munna': {'species_id': 517, 'species_name': 'munna', 'generation_id': 5, 'evolves_from_species_id': None, 'evolution_chain_id': 265, 'is_baby': 0},
-    'musharna': {'species_id': 518, 'species_name': 'musharna', 'generation_id': 5, 'evolves_from_species_id': 517, 'evolution_chain_id': 265, 'is_baby': 0},
-    'pidove': {'species_id': 519, 'species_name': 'pidove', 'generation_id': 5, 'evolves_from_species_id': None, 'evolution_chain_id': 266, 'is_baby': 0},
-    'tranquill': {'species_id': 520, 'species_name': 'tranquill', 'generation_id': 5, 'evolves_from_species_id': 519, 'evolution_chain_id': 266, 'is_baby': 0},
-    'unfezant': {'species_id': 521, 'species_name': 'unfezant', 'generation_id': 5, 'evolves_from_species_id': 520, 'evolution_chain_id': 266, 'is_baby': 0},
-    'blitzle': {'species_id': 522, 'species_name': 'blitzle', 'generation_id': 5, 'evolves_from_species_id': None, 'evolution_chain_id': 267, 'is_baby': 0},
-    'zebstrika': {'species_id': 523, 'species_name': 'zebstrika', 'generation_id': 5, 'evolves_from_species_id': 522, 'evolution_chain_id': 267, 'is_baby': 0},
-    'roggenrola': {'species_id': 524, 'species_name': 'roggenrola', 'generation_id': 5, 'evolves_from_species_id': None, 'evolution_chain_id': 268, 'is_baby': 0},
-    'boldore': {'species_id': 525, 'species_name': 'boldore', 'generation_id': 5, 'evolves_from_species_id': 524, 'evolution_chain_id': 268, 'is_baby': 0},
-    'gigalith': {'species_id': 526, 'species_name': 'gigalith', 'generation_id': 5, 'evolves_from_species_id': 525, 'evolution_chain_id': 268, 'is_baby': 0},
-    'woobat': {'species_id': 527, 'species_name': 'woobat', 'generation_id': 5, 'evolves_from_species_id': None, 'evolution_chain_id': 269, 'is_baby': 0},
-    'swoobat': {'species_id': 528, 'species_name': 'swoobat', 'generation_id': 5, 'evolves_from_species_id': 527, 'evolution_chain_id': 269, 'is_baby': 0},
-    'drilbur': {'species_id': 529, 'species_name': 'drilbur', 'generation_id': 5, 'evolves_from_species_id': None, 'evolution_chain_id': 270, 'is_baby': 0},
-    'excadrill': {'species_id': 530, 'species_name': 'excadrill', 'generation_id': 5, 'evolves_from_species_id': 529, 'evolution_chain_id': 270, 'is_baby': 0},
-    'audino': {'species_id': 531, 'species_name': 'audino', 'generation_id': 5, 'evolves_from_species_id': None, 'evolution_chain_id': 271, 'is_baby': 0},
-    'timburr': {'species_id': 532, 'species_name': 'timburr', 'generation_id': 5, 'evolves_from_species_id': None, 'evolution_chain_id': 272, 'is_baby': 0},
-    'gurdurr': {'species_id': 533, 'species_name': 'gurdurr', 'generation_id': 5, 'evolves_from_species_id': 532, 'evolution_chain_id': 272, 'is_baby': 0},
-    'conkeldurr': {'species_id': 534, 'species_name': 'conkeldurr', 'generation_id': 5, 'evolves_from_species_id': 533, 'evolution_chain_id': 272, 'is_baby': 0},
-    'tympole': {'species_id': 535, 'species_name': 'tympole', 'generation_id': 5, 'evolves_from_species_id': None, 'evolution_chain_id': 273, 'is_baby': 0},
-    'palpitoad': {'species_id': 536, 'species_name': 'palpitoad', 'generation_id': 5, 'evolves_from_species_id': 535, 'evolution_chain_id': 273, 'is_baby': 0},
-    'seismitoad': {'species_id': 537, 'species_name': 'seismitoad', 'generation_id': 5, 'evolves_from_species_id': 536, 'evolution_chain_id': 273, 'is_baby': 0},
-    'throh': {'species_id': 538, 'species_name': 'throh', 'generation_id': 5, 'evolves_from_species_id': None, 'evolution_chain_id': 274, 'is_baby': 0},
-    'sawk': {'species_id': 539, 'species_name': 'sawk', 'generation_id': 5, 'evolves_from_species_id': None, 'evolution_chain_id': 275, 'is_baby': 0},
-    'sewaddle': {'species_id': 540, 'species_name': 'sewaddle', 'generation_id': 5, 'evolves_from_species_id': None, 'evolution_chain_id': 276, 'is_baby': 0},
-    'swadloon': {'species_id': 541, 'species_name': 'swadloon', 'generation_id': 5, 'evolves_from_species_id': 540, 'evolution_chain_id': 276, 'is_baby': 0},
-    'leavanny': {'species_id': 542, 'species_name': 'leavanny', 'generation_id': 5, 'evolves_from_species_id': 541, 'evolution_chain_id': 276, 'is_baby': 0},
-    'venipede': {'species_id': 543, 'species_name': 'venipede', 'generation_id': 5, 'evolves_from_species_id': None, 'evolution_chain_id': 277, 'is_baby': 0},
-    'whirlipede': {'species_id': 544, 'species_name': 'whirlipede', 'generation_id': 5, 'evolves_from_species_id': 543, 'evolution_chain_id': 277, 'is_baby': 0},
-    'scolipede': {'species_id': 545, 'species_name': 'scolipede', 'generation_id': 5, 'evolves_from_species_id': 544, 'evolution_chain_id': 277, 'is_baby': 0},
-    'cottonee': {'species_id': 546, 'species_name': 'cottonee', 'generation_id': 5, 'evolves_from_species_id': None, 'evolution_chain_id': 278, 'is_baby': 0},
-    'whimsicott': {'species_id': 547, 'species_name': 'whimsicott', 'generation_id': 5, 'evolves_from_species_id': 546, 'evolution_chain_id': 278, 'is_baby': 0},
-    'petilil': {'species_id': 548, 'species_name': 'petilil', 'generation_id': 5, 'evolves_from_species_id': None, 'evolution_chain_id': 279, 'is_baby': 0},
-    'lilligant': {'species_id': 549, 'species_name': 'lilligant', 'generation_id': 5, 'evolves_from_species_id': 548, 'evolution_chain_id': 279, 'is_baby': 0},
-    'basculin': {'species_id': 550, 'species_name': 'basculin', 'generation_id': 5, 'evolves_from_species_id': None, 'evolution_chain_id': 280, 'is_baby': 0},
-    'sandile': {'species_id': 551, 'species_name': 'sandile', 'generation_id': 5, 'evolves_from_species_id': None, 'evolution_chain_id': 281, 'is_baby': 0},
-    'krokorok': {'species_id': 552, 'species_name': 'krokorok', 'generation_id': 5, 'evolves_from_species_id': 551, 'evolution_chain_id': 281, 'is_baby': 0},
-    'krookodile': {'species_id': 553, 'species_name': 'krookodile', 'generation_id': 5, 'evolves_from_species_id': 552, 'evolution_chain_id': 281, 'is_baby': 0},
-    'darumaka': {'species_id': 554, 'species_name': 'darumaka', 'generation_id': 5, 'evolves_from_species_id': None, 'evolution_chain_id': 282, 'is_baby': 0},
-    'darmanitan': {'species_id': 555, 'species_name': 'darmanitan', 'generation_id': 5, 'evolves_from_species_id': 554, 'evolution_chain_id': 282, 'is_baby': 0},
-    'maractus': {'species_id': 556, 'species_name': 'maractus', 'generation_id': 5, 'evolves_from_species_id': None, 'evolution_chain_id': 283, 'is_baby': 0},
-    'dwebble': {'species_id': 557, 'species_name': 'dwebble', 'generation_id': 5, 'evolves_from_species_id': None, 'evolution_chain_id': 284, 'is_baby': 0},
-    'crustle': {'species_id': 558, 'species_name': 'crustle', 'generation_id': 5, 'evolves_from_species_id': 557, 'evolution_chain_id': 284, 'is_baby': 0},
-    'scraggy': {'species_id': 559, 'species_name': 'scraggy', 'generation_id': 5, 'evolves_from_species_id': None, 'evolution_chain_id': 285, 'is_baby': 0},
-    'scrafty': {'species_id': 560, 'species_name': 'scrafty', 'generation_id': 5, 'evolves_from_species_id': 559, 'evolution_chain_id': 285, 'is_baby': 0},
-    'sigilyph': {'species_id': 561, 'species_name': 'sigilyph', 'generation_id': 5, 'evolves_from_species_id': None, 'evolution_chain_id': 286, 'is_baby': 0},
-    'yamask': {'species_id': 562, 'species_name': 'yamask', 'generation_id': 5, 'evolves_from_species_id': None, 'evolution_chain_id': 287, 'is_baby': 0},
-    'cofagrigus': {'species_id': 563, 'species_name': 'cofagrigus', 'generation_id': 5, 'evolves_from_species_id': 562, 'evolution_chain_id': 287, 'is_baby': 0},
-    'tirtouga': {'species_id': 564, 'species_name': 'tirtouga', 'generation_id': 5, 'evolves_from_species_id': None, 'evolution_chain_id': 288, 'is_baby': 0},
-    'carracosta': {'species_id': 565, 'species_name': 'carracosta', 'generation_id': 5, 'evolves_from_species_id': 564, 'evolution_chain_id': 288, 'is_baby': 0},
-    'archen': {'species_id': 566, 'species_name': 'archen', 'generation_id': 5, 'evolves_from_species_id': None, 'evolution_chain_id': 289, 'is_baby': 0},
-    'archeops': {'species_id': 567, 'species_name': 'archeops', 'generation_id': 5, 'evolves_from_species_id': 566, 'evolution_chain_id': 289, 'is_baby': 0},
-    'trubbish': {'species_id': 568, 'species_name': 'trubbish', 'generation_id': 5, 'evolves_from_species_id': None, 'evolution_chain_id': 290, 'is_baby': 0},
-    'garbodor': {'species_id': 569, 'species_name': 'garbodor', 'generation_id': 5, 'evolves_from_species_id': 568, 'evolution_chain_id': 290, 'is_baby': 0},
-    'zorua': {'species_id': 570, 'species_name': 'zorua', 'generation_id': 5, 'evolves_from_species_id': None, 'evolution_chain_id': 291, 'is_baby': 0},
-    'zoroark': {'species_id': 571, 'species_name': 'zoroark', 'generation_id': 5, 'evolves_from_species_id': 570, 'evolution_chain_id': 291, 'is_baby': 0},
-    'minccino': {'species_id': 572, 'species_name': 'minccino', 'generation_id': 5, 'evolves_from_species_id': None, 'evolution_chain_id': 292, 'is_baby': 0},
-    'cinccino': {'species_id': 573, 'species_name': 'cinccino', 'generation_id': 5, 'evolves_from_species_id': 572, 'evolution_chain_id': 292, 'is_baby': 0},
-    'gothita': {'species_id': 574, 'species_name': 'gothita', 'generation_id': 5, 'evolves_from_species_id': None, 'evolution_chain_id': 293, 'is_baby': 0},
-    'gothorita': {'species_id': 575, 'species_name': 'gothorita', 'generation_id': 5, 'evolves_from_species_id': 574, 'evolution_chain_id': 293, 'is_baby': 0},
-    'gothitelle': {'species_id': 576, 'species_name': 'gothitelle', 'generation_id': 5, 'evolves_from_species_id': 575, 'evolution_chain_id': 293, 'is_baby': 0},
-    'solosis': {'species_id': 577, 'species_name': 'solosis', 'generation_id': 5, 'evolves_from_species_id': None, 'evolution_chain_id': 294, 'is_baby': 0},
-    'duosion': {'species_id': 578, 'species_name': 'duosion', 'generation_id': 5, 'evolves_from_species_id': 577, 'evolution_chain_id': 294, 'is_baby': 0},
-    'reuniclus': {'species_id': 579, 'species_name': 'reuniclus', 'generation_id': 5, 'evolves_from_species_id': 578, 'evolution_chain_id': 294, 'is_baby': 0},
-    'ducklett': {'species_id': 580, 'species_name': 'ducklett', 'generation_id': 5, 'evolves_from_species_id': None, 'evolution_chain_id': 295, 'is_baby': 0},
-    'swanna': {'species_id': 581, 'species_name': 'swanna', 'generation_id': 5, 'evolves_from_species_id': 580, 'evolution_chain_id': 295, 'is_baby': 0},
-    'vanillite': {'species_id': 582, 'species_name': 'vanillite', 'generation_id': 5, 'evolves_from_species_id': None, 'evolution_chain_id': 296, 'is_baby': 0},
-    'vanillish': {'species_id': 583, 'species_name': 'vanillish', 'generation_id': 5, 'evolves_from_species_id': 582, 'evolution_chain_id': 296, 'is_baby': 0},
-    'vanilluxe': {'species_id': 584, 'species_name': 'vanilluxe', 'generation_id': 5, 'evolves_from_species_id': 583, 'evolution_chain_id': 296, 'is_baby': 0},
-    'deerling': {'species_id': 585, 'species_name': 'deerling', 'generation_id': 5, 'evolves_from_species_id': None, 'evolution_chain_id': 297, 'is_baby': 0},
-    'sawsbuck': {'species_id': 586, 'species_name': 'sawsbuck', 'generation_id': 5, 'evolves_from_species_id': 585, 'evolution_chain_id': 297, 'is_baby': 0},
-    'emolga': {'species_id': 587, 'species_name': 'emolga', 'generation_id': 5, 'evolves_from_species_id': None, 'evolution_chain_id': 298, 'is_baby': 0},
-    'karrablast': {'species_id': 588, 'species_name': 'karrablast', 'generation_id': 5, 'evolves_from_species_id': None, 'evolution_chain_id': 299, 'is_baby': 0},
-    'escavalier': {'species_id': 589, 'species_name': 'escavalier', 'generation_id': 5, 'evolves_from_species_id': 588, 'evolution_chain_id': 299, 'is_baby': 0},
-    'foongus': {'species_id': 590, 'species_name': 'foongus', 'generation_id': 5, 'evolves_from_species_id': None, 'evolution_chain_id': 300, 'is_baby': 0},
-    'amoonguss': {'species_id': 591, 'species_name': 'amoonguss', 'generation_id': 5, 'evolves_from_species_id': 590, 'evolution_chain_id': 300, 'is_baby': 0},
-    'frillish': {'species_id': 592, 'species_name': 'frillish', 'generation_id': 5, 'evolves_from_species_id': None, 'evolution_chain_id': 301, 'is_baby': 0},
-    'jellicent': {'species_id': 593, 'species_name': 'jellicent', 'generation_id': 5, 'evolves_from_species_id': 592, 'evolution_chain_id': 301, 'is_baby': 0},
-    'alomomola': {'species_id': 594, 'species_name': 'alomomola', 'generation_id': 5, 'evolves_from_species_id': None, 'evolution_chain_id': 302, 'is_baby': 0},
-    'joltik': {'species_id': 595, 'species_name': 'joltik', 'generation_id': 5, 'evolves_from_species_id': None, 'evolution_chain_id': 303, 'is_baby': 0},
-    'galvantula': {'species_id': 596, 'species_name': 'galvantula', 'generation_id': 5, 'evolves_from_species_id': 595, 'evolution_chain_id': 303, 'is_baby': 0},
-    'ferroseed': {'species_id': 597, 'species_name': 'ferroseed', 'generation_id': 5, 'evolves_from_species_id': None, 'evolution_chain_id': 304, 'is_baby': 0},
-    'ferrothorn': {'species_id': 598, 'species_name': 'ferrothorn', 'generation_id': 5, 'evolves_from_species_id': 597, 'evolution_chain_id': 304, 'is_baby': 0},
-    'klink': {'species_id': 599, 'species_name': 'klink', 'generation_id': 5, 'evolves_from_species_id': None, 'evolution_chain_id': 305, 'is_baby': 0},
-    'klang': {'species_id': 600, 'species_name': 'klang', 'generation_id': 5, 'evolves_from_species_id': 599, 'evolution_chain_id': 305, 'is_baby': 0},
-    'klinklang': {'species_id': 601, 'species_name': 'klinklang', 'generation_id': 5, 'evolves_from_species_id': 600, 'evolution_chain_id': 305, 'is_baby': 0},
-    'tynamo': {'species_id': 602, 'species_name': 'tynamo', 'generation_id': 5, 'evolves_from_species_id': None, 'evolution_chain_id': 306, 'is_baby': 0},
-    'eelektrik': {'species_id': 603, 'species_name': 'eelektrik', 'generation_id': 5, 'evolves_from_species_id': 602, 'evolution_chain_id': 306, 'is_baby': 0},
-    'eelektross': {'species_id': 604, 'species_name': 'eelektross', 'generation_id': 5, 'evolves_from_species_id': 603, 'evolution_chain_id': 306, 'is_baby': 0},
-    'elgyem': {'species_id': 605, 'species_name': 'elgyem', 'generation_id': 5, 'evolves_from_species_id': None, 'evolution_chain_id': 307, 'is_baby': 0},
-    'beheeyem': {'species_id': 606, 'species_name': 'beheeyem', 'generation_id': 5, 'evolves_from_species_id': 605, 'evolution_chain_id': 307, 'is_baby': 0},
-    'litwick': {'species_id': 607, 'species_name': 'litwick', 'generation_id': 5, 'evolves_from_species_id': None, 'evolution_chain_id': 308, 'is_baby': 0},
-    'lampent': {'species_id': 608, 'species_name': 'lampent', 'generation_id': 5, 'evolves_from_species_id': 607, 'evolution_chain_id': 308, 'is_baby': 0},
-    'chandelure': {'species_id': 609, 'species_name': 'chandelure', 'generation_id': 5, 'evolves_from_species_id': 608, 'evolution_chain_id': 308, 'is_baby': 0},
-    'axew': {'species_id': 610, 'species_name': 'axew', 'generation_id': 5, 'evolves_from_species_id': None, 'evolution_chain_id': 309, 'is_baby': 0},
-    'fraxure': {'species_id': 611, 'species_name': 'fraxure', 'generation_id': 5, 'evolves_from_species_id': 610, 'evolution_chain_id': 309, 'is_baby': 0},
-    'haxorus': {'species_id': 612, 'species_name': 'haxorus', 'generation_id': 5, 'evolves_from_species_id': 611, 'evolution_chain_id': 309, 'is_baby': 0},
-    'cubchoo': {'species_id': 613, 'species_name': 'cubchoo', 'generation_id': 5, 'evolves_from_species_id': None, 'evolution_chain_id': 310, 'is_baby': 0},
-    'beartic': {'species_id': 614, 'species_name': 'beartic', 'generation_id': 5, 'evolves_from_species_id': 613, 'evolution_chain_id': 310, 'is_baby': 0},
-    'cryogonal': {'species_id': 615, 'species_name': 'cryogonal', 'generation_id': 5, 'evolves_from_species_id': None, 'evolution_chain_id': 311, 'is_baby': 0},
-    'shelmet': {'species_id': 616, 'species_name': 'shelmet', 'generation_id': 5, 'evolves_from_species_id': None, 'evolution_chain_id': 312, 'is_baby': 0},
-    'accelgor': {'species_id': 617, 'species_name': 'accelgor', 'generation_id': 5, 'evolves_from_species_id': 616, 'evolution_chain_id': 312, 'is_baby': 0},
-    'stunfisk': {'species_id': 618, 'species_name': 'stunfisk', 'generation_id': 5, 'evolves_from_species_id': None, 'evolution_chain_id': 313, 'is_baby': 0},
-    'mienfoo': {'species_id': 619, 'species_name': 'mienfoo', 'generation_id': 5, 'evolves_from_species_id': None, 'evolution_chain_id': 314, 'is_baby': 0},
-    'mienshao': {'species_id': 620, 'species_name': 'mienshao', 'generation_id': 5, 'evolves_from_species_id': 619, 'evolution_chain_id': 314, 'is_baby': 0},
-    'druddigon': {'species_id': 621, 'species_name': 'druddigon', 'generation_id': 5, 'evolves_from_species_id': None, 'evolution_chain_id': 315, 'is_baby': 0},
-    'golett': {'species_id': 622, 'species_name': 'golett', 'generation_id': 5, 'evolves_from_species_id': None, 'evolution_chain_id': 316, 'is_baby': 0},
-    'golurk': {'species_id': 623, 'species_name': 'golurk', 'generation_id': 5, 'evolves_from_species_id': 622, 'evolution_chain_id': 316, 'is_baby': 0},
-    'pawniard': {'species_id': 624, 'species_name': 'pawniard', 'generation_id': 5, 'evolves_from_species_id': None, 'evolution_chain_id': 317, 'is_baby': 0},
-    'bisharp': {'species_id': 625, 'species_name': 'bisharp', 'generation_id': 5, 'evolves_from_species_id': 624, 'evolution_chain_id': 317, 'is_baby': 0},
-    'bouffalant': {'species_id': 626, 'species_name': 'bouffalant', 'generation_id': 5, 'evolves_from_species_id': None, 'evolution_chain_id': 318, 'is_baby': 0},
-    'rufflet': {'species_id': 627, 'species_name': 'rufflet', 'generation_id': 5, 'evolves_from_species_id': None, 'evolution_chain_id': 319, 'is_baby': 0},
-    'braviary': {'species_id': 628, 'species_name': 'braviary', 'generation_id': 5, 'evolves_from_species_id': 627, 'evolution_chain_id': 319, 'is_baby': 0},
-    'vullaby': {'species_id': 629, 'species_name': 'vullaby', 'generation_id': 5, 'evolves_from_species_id': None, 'evolution_chain_id': 320, 'is_baby': 0},
-    'mandibuzz': {'species_id': 630, 'species_name': 'mandibuzz', 'generation_id': 5, 'evolves_from_species_id': 629, 'evolution_chain_id': 320, 'is_baby': 0},
-    'heatmor': {'species_id': 631, 'species_name': 'heatmor', 'generation_id': 5, 'evolves_from_species_id': None, 'evolution_chain_id': 321, 'is_baby': 0},
-    'durant': {'species_id': 632, 'species_name': 'durant', 'generation_id': 5, 'evolves_from_species_id': None, 'evolution_chain_id': 322, 'is_baby': 0},
-    'deino': {'species_id': 633, 'species_name': 'deino', 'generation_id': 5, 'evolves_from_species_id': None, 'evolution_chain_id': 323, 'is_baby': 0},
-    'zweilous': {'species_id': 634, 'species_name': 'zweilous', 'generation_id': 5, 'evolves_from_species_id': 633, 'evolution_chain_id': 323, 'is_baby': 0},
-    'hydreigon': {'species_id': 635, 'species_name': 'hydreigon', 'generation_id': 5, 'evolves_from_species_id': 634, 'evolution_chain_id': 323, 'is_baby': 0},
-    'larvesta': {'species_id': 636, 'species_name': 'larvesta', 'generation_id': 5, 'evolves_from_species_id': None, 'evolution_chain_id': 324, 'is_baby': 0},
-    'volcarona': {'species_id': 637, 'species_name': 'volcarona', 'generation_id': 5, 'evolves_from_species_id': 636, 'evolution_chain_id': 324, 'is_baby': 0},
-    'cobalion': {'species_id': 638, 'species_name': 'cobalion', 'generation_id': 5, 'evolves_from_species_id': None, 'evolution_chain_id': 325, 'is_baby': 0},
-    'terrakion': {'species_id': 639, 'species_name': 'terrakion', 'generation_id': 5, 'evolves_from_species_id': None, 'evolution_chain_id': 326, 'is_baby': 0},
-    'virizion': {'species_id': 640, 'species_name': 'virizion', 'generation_id': 5, 'evolves_from_species_id': None, 'evolution_chain_id': 327, 'is_baby': 0},
-    'tornadus': {'species_id': 641, 'species_name': 'tornadus', 'generation_id': 5, 'evolves_from_species_id': None, 'evolution_chain_id': 328, 'is_baby': 0},
-    'thundurus': {'species_id': 642, 'species_name': 'thundurus', 'generation_id': 5, 'evolves_from_species_id': None, 'evolution_chain_id': 329, 'is_baby': 0},
-    'reshiram': {'species_id': 643, 'species_name': 'reshiram', 'generation_id': 5, 'evolves_from_species_id': None, 'evolution_chain_id': 330, 'is_baby': 0},
-    'zekrom': {'species_id': 644, 'species_name': 'zekrom', 'generation_id': 5, 'evolves_from_species_id': None, 'evolution_chain_id': 331, 'is_baby': 0},
-    'landorus': {'species_id': 645, 'species_name': 'landorus', 'generation_id': 5, 'evolves_from_species_id': None, 'evolution_chain_id': 332, 'is_baby': 0},
-    'kyurem': {'species_id': 646, 'species_name': 'kyurem', 'generation_id': 5, 'evolves_from_species_id': None, 'evolution_chain_id': 333, 'is_baby': 0},
-    'keldeo': {'species_id': 647, 'species_name': 'keldeo', 'generation_id': 5, 'evolves_from_species_id': None, 'evolution_chain_id': 334, 'is_baby': 0},
-    'meloetta': {'species_id': 648, 'species_name': 'meloetta', 'generation_id': 5, 'evolves_from_species_id': None, 'evolution_chain_id': 335, 'is_baby': 0},
-    'genesect': {'species_id': 649, 'species_name': 'genesect', 'generation_id': 5, 'evolves_from_species_id': None, 'evolution_chain_id': 336, 'is_baby': 0},
-    }
+# The species names come from the SpeciesStore, so they're only loaded once
+# somebody needs a Pokemon card name.
+canonical.register_loader('pokemon', _register_names)
@@ -24,7 +24,7 @@ class RFTGCard(Card):
     """card"""
     def __init__(self, name, count, **hints):
         # Later we'll use the **hints dict to help disambiguate cards.
-        super(RFTGCard, self).__init__(name, count)
+        super(RFTGCard, self).__init__(name, count, **hints)
 
 
 class RFTGQuestion(Question):
@@ -0,0 +1,59 @@
+""" A small thread-safe LRU cache. Python 2 has no functools.lru_cache, and
+    we want caches that are shared between threads and that can be sized and
+    inspected, so here's one.
+"""
+
+import collections
+import threading
+
+class LRUCache(object):
+    """ Holds at most `max_entries` values; when it's full, adding another
+        drops the one that was least recently used. Counts hits and misses so
+        that we can tell whether it's earning its keep.
+    """
+
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self.entries = collections.OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    def get(self, key, compute=None):
+        """ The value for `key`, computing (with `compute()`) and storing it
+            if it isn't there. Without `compute`, a missing key gives None.
+            compute() runs outside the lock, so two threads can occasionally
+            both compute the same value; the results are the same, so the
+            second one just wins."""
+        with self.lock:
+            try:
+                value = self.entries.pop(key)
+            except KeyError:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self.entries[key] = value
+                return value
+        if compute is None:
+            return None
+        value = compute()
+        self.put(key, value)
+        return value
+
+    def put(self, key, value):
+        with self.lock:
+            self.entries.pop(key, None)
+            self.entries[key] = value
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.hits = self.misses = 0
@@ -0,0 +1,262 @@
+# -*- coding: utf-8 -*-
+""" Card names as the game knows them, rather than as people type them.
+    "Moutain", "jace tms", "Mewtwo-EX" and "Latias delta" all have names
+    they're trying to be, and everything downstream - the deck fingerprint,
+    the game-specific questions, the Pokemon data - wants those names.
+
+    Each game has a NameIndex: its card names, an alias table for nicknames
+    and abbreviations, and a trigram index for everything else. Game modules
+    register their names and aliases when they're imported, with
+    register_names(); a card catalog can add more the same way.
+
+    Only exact (case- and spacing-insensitive) and alias matches change a
+    name by themselves. A name that's a typo or two from one we know is just
+    as likely to be a real card we don't know yet - Wiglett isn't Diglett -
+    so those only ever come back as suggestions, for the user to confirm.
+"""
+
+import collections
+import numpy
+
+# How alike (by the Dice coefficient of their trigrams) a typed name and a
+# card name have to be for the card name to be worth suggesting.
+SUGGEST_THRESHOLD = 0.4
+
+Resolution = collections.namedtuple('Resolution', ['name', 'canonical', 'suggestions'])
+
+def _key(name):
+    return u" ".join(name.split()).lower()
+
+def _typos(key):
+    # How many typos we'll suggest corrections for in a name this long.
+    return 1 if len(key) < 8 else 2
+
+def _within_distance(a, b, limit):
+    """ Whether a and b are at most `limit` single-character insertions,
+        deletions and substitutions apart. Only fills in the band of the edit
+        distance table that could still be within the limit."""
+    if abs(len(a) - len(b)) > limit:
+        return False
+    over = limit + 1
+    previous = [ j if j <= limit else over for j in xrange(len(b) + 1) ]
+    for i in xrange(1, len(a) + 1):
+        current = [ over ] * (len(b) + 1)
+        if i <= limit:
+            current[0] = i
+        low, high = max(1, i - limit), min(len(b), i + limit)
+        for j in xrange(low, high + 1):
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (a[i - 1] != b[j - 1]))
+        if min(current[low - 1:high + 1]) > limit:
+            return False
+        previous = current
+    return previous[-1] <= limit
+
+def _trigrams(key):
+    # Padded, so that short names (and the starts and ends of names) get
+    # trigrams of their own.
+    padded = u"  {} ".format(key)
+    return set(padded[i:i + 3] for i in xrange(len(padded) - 2))
+
+
+class NameIndex(object):
+    """ One game's card names. resolve() tries the alias table and then an
+        exact (case- and spacing-insensitive) match. corrections() offers the
+        few names most like it by trigram similarity that are only a typo or
+        two away, for the user to pick from. (Trigram similarity alone can't
+        tell "Moutain" - a typo - from "Forest Bear" - a different card that
+        we just don't have in the index.)
+
+        `normalize`, if given, splits a typed name into the card's base name
+        and a suffix that isn't part of the name we look up (Pokemon's "EX",
+        "δ" and so on), already in its canonical form; the suffix goes back on
+        the end of whatever the base name resolves to.
+
+        Lookups are a handful of dictionary hits plus, for fuzzy matches, one
+        NumPy bincount over the postings of the typed name's trigrams - well
+        under a millisecond with tens of thousands of names loaded.
+    """
+
+    def __init__(self, names=(), aliases=None, normalize=None):
+        self.normalize = normalize
+        self.names = []
+        self.by_key = {}
+        self.aliases = {}
+        self.postings = collections.defaultdict(list)
+        self._frozen = None
+        self.add(names)
+        self.add_aliases(aliases or {})
+
+    def __len__(self):
+        return len(self.names)
+
+    def add(self, names):
+        for name in names:
+            key = _key(name)
+            if key in self.by_key:
+                continue
+            self.by_key[key] = name
+            for gram in _trigrams(key):
+                self.postings[gram].append(len(self.names))
+            self.names.append(name)
+        self._frozen = None
+
+    def add_aliases(self, aliases):
+        """ `aliases` maps what people type to card names. Aliases don't have
+            to be in the index's names."""
+        for alias, name in aliases.items():
+            self.aliases[_key(alias)] = name
+        self.add(aliases.values())
+
+    def _freeze(self):
+        # Postings as arrays, for _similar(). Rebuilt only after names have
+        # been added.
+        if self._frozen is None:
+            self._frozen = dict((gram, numpy.array(ids, dtype=numpy.int32)) for gram, ids in self.postings.items())
+        return self._frozen
+
+    def _similar(self, key, limit, threshold):
+        """ Up to `limit` (name, similarity) pairs for the names most like
+            `key`, best first, leaving out anything below `threshold`.
+
+            Counting shared trigrams for every name would mean walking the
+            postings of trigrams that half the names have (" of", "the"), so
+            the counting only uses the rarer trigrams, to pick a shortlist;
+            the shortlist then gets its exact similarities.
+        """
+        if not self.names:
+            return []
+        postings = self._freeze()
+        grams = _trigrams(key)
+        hits = sorted([ postings[gram] for gram in grams if gram in postings ], key=len)
+        if not hits:
+            return []
+        common = max(len(self.names) // 20, 100)
+        rare = [ ids for ids in hits if len(ids) <= common ] or hits[:1]
+        shared = numpy.bincount(numpy.concatenate(rare), minlength=len(self.names))
+        shortlist = max(limit * 10, 30)
+        if shortlist < len(shared):
+            candidates = numpy.argpartition(-shared, shortlist)[:shortlist]
+        else:
+            candidates = numpy.arange(len(shared))
+        similar = []
+        for i in candidates[shared[candidates] > 0]:
+            name_grams = _trigrams(_key(self.names[i]))
+            similarity = 2.0 * len(grams & name_grams) / (len(grams) + len(name_grams))
+            if similarity >= threshold:
+                similar.append((similarity, -i, self.names[i]))
+        similar.sort(reverse=True)
+        return [ (name, similarity) for similarity, _, name in similar[:limit] ]
+
+    def _split(self, name):
+        if self.normalize:
+            return self.normalize(name)
+        return name, u''
+
+    def resolve(self, name):
+        """ The canonical name for `name`, or None if it isn't an alias or one
+            of our names."""
+        key = _key(name)
+        if key in self.aliases:
+            return self.aliases[key]
+        base, suffix = self._split(name)
+        key = _key(base)
+        canonical = self.aliases.get(key) or self.by_key.get(key)
+        if canonical is None:
+            return None
+        return u"{} {}".format(canonical, suffix) if suffix else canonical
+
+    def corrections(self, name, limit=3):
+        """ The names that `name` might be a typo of - the ones most like it
+            that are only a typo or two away - best first."""
+        base, suffix = self._split(name)
+        key = _key(base)
+        typos = _typos(key)
+        return [ u"{} {}".format(similar, suffix) if suffix else similar
+                 for similar, _ in self._similar(key, limit, SUGGEST_THRESHOLD)
+                 if _within_distance(key, _key(similar), typos) ]
+
+    def suggest(self, text, limit=3):
+        """ "Did you mean" candidates for `text`, best first. `text` can be a
+            whole decklist line that we couldn't read - a leading count goes."""
+        words = text.split()
+        if words and words[0].rstrip(u'x').isdigit():
+            words = words[1:]
+        base, suffix = self._split(u" ".join(words))
+        similar = self._similar(_key(base), limit, SUGGEST_THRESHOLD)
+        return [ u"{} {}".format(name, suffix) if suffix else name for name, _ in similar ]
+
+    def resolve_all(self, names):
+        """ resolve() for a whole decklist at once: a Resolution for each
+            name, with corrections() for the ones that didn't resolve. A name
+            that's listed more than once is only looked up once."""
+        results = {}
+        for name in names:
+            if name not in results:
+                canonical = self.resolve(name)
+                results[name] = Resolution(name, canonical, [] if canonical else self.corrections(name))
+        return [ results[name] for name in names ]
+
+
+# Game name (as in identifier.register_game()) -> NameIndex.
+indexes = {}
+
+# Game name -> functions that will call register_names() when the game's
+# names are first needed - for names that are expensive to load.
+loaders = {}
+
+def register_loader(game, loader):
+    loaders.setdefault(game, []).append(loader)
+
+def _index(game):
+    while loaders.get(game):
+        loaders[game].pop(0)()
+    return indexes.get(game)
+
+def register_names(game, names=(), aliases=None, normalize=None):
+    """ Adds card names and aliases to `game`'s index, creating it if it
+        doesn't exist yet."""
+    if game not in indexes:
+        indexes[game] = NameIndex(normalize=normalize)
+    index = indexes[game]
+    if normalize:
+        index.normalize = normalize
+    index.add(names)
+    index.add_aliases(aliases or {})
+    return index
+
+def resolve(game, name):
+    """ `name` as `game` knows it - or, if we don't know the game or can't
+        resolve the name, as it was typed."""
+    index = _index(game)
+    return (index and index.resolve(name)) or name
+
+def resolve_all(game, names):
+    """ NameIndex.resolve_all() for `game`; with no index for the game, every
+        name resolves to itself."""
+    index = _index(game)
+    if index is None:
+        return [ Resolution(name, name, []) for name in names ]
+    return index.resolve_all(names)
+
+def suggest(game, text, limit=3):
+    index = _index(game)
+    return index.suggest(text, limit) if index else []
+
+def resolve_decklist(game, cards, resolutions=None):
+    """ Takes find_cards()-style (count, name, hints) tuples and returns them
+        with canonical names - merging any that turn out to be the same card
+        ("MOUNTAIN" and "Mountain", "jace tms" and "Jace, the Mind Sculptor"),
+        keeping the first one's hints. Names that don't resolve stay as they
+        were typed; see resolve_all() for what they might have meant. Callers
+        that already have resolve_all()'s results for these cards can pass
+        them in as `resolutions` rather than have them looked up again."""
+    merged = collections.OrderedDict()
+    if resolutions is None:
+        resolutions = resolve_all(game, [ name for _, name, _ in cards ])
+    for (count, _, hints), resolution in zip(cards, resolutions):
+        name = resolution.canonical or resolution.name
+        if name in merged:
+            count += merged[name][0]
+            hints = merged[name][2]
+        merged[name] = (count, name, hints)
+    return merged.values()
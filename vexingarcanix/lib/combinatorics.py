@@ -0,0 +1,117 @@
+""" A small floating-point combinatorics kernel: the hypergeometric pmf, cdf
+    and sf, plus mode and median, on nothing but NumPy. These are the only bits
+    of SciPy that games/base.py ever used, and importing scipy.stats to get
+    them made up most of a worker's start-up time and memory. (Anything that
+    needs more of SciPy - see simulation._z_score() - imports it lazily,
+    where it's needed.)
+
+    Unlike lib/probability, which does exact integer arithmetic one case at a
+    time, everything here is vectorized: the arguments can be NumPy arrays of
+    any shapes that broadcast together, in SciPy's order (k, population,
+    successes, draws), and the results agree with scipy.stats.hypergeom to
+    around 1e-12. Like SciPy, impossible parameters give nan.
+"""
+
+import collections
+import numpy
+
+# log(n!) for n = 0 .. len - 1, grown whenever somebody needs a bigger n.
+_log_factorials = numpy.zeros(1)
+
+def log_factorial(n):
+    """ log(n!), looked up in a table. n can be an array."""
+    global _log_factorials
+    n = numpy.asarray(n)
+    top = int(n.max()) if n.size else 0
+    table = _log_factorials
+    if top >= len(table):
+        size = max(top + 1, 2 * len(table))
+        table = numpy.concatenate(([0.0], numpy.cumsum(numpy.log(numpy.arange(1, size)))))
+        # Swapping in a whole new table means other threads never see a
+        # half-built one.
+        _log_factorials = table
+    return table[n]
+
+def log_choose(n, k):
+    """ log(n choose k). Only meaningful where 0 <= k <= n; callers mask out
+        everything else."""
+    n, k = numpy.broadcast_arrays(n, k)
+    k = numpy.clip(k, 0, n)
+    return log_factorial(n) - log_factorial(k) - log_factorial(n - k)
+
+def _result(value, *args):
+    # Plain floats in, plain float out.
+    if all(numpy.ndim(arg) == 0 for arg in args):
+        return float(value)
+    return value
+
+def _pmf(k, population, successes, draws):
+    k, population, successes, draws = numpy.broadcast_arrays(
+        *[ numpy.asarray(arg, dtype=int) for arg in (k, population, successes, draws) ])
+    valid = ((population >= 0) & (successes >= 0) & (successes <= population)
+             & (draws >= 0) & (draws <= population))
+    population, successes, draws = [ numpy.where(valid, arg, 0) for arg in (population, successes, draws) ]
+    failures = population - successes
+    possible = (k >= 0) & (k <= successes) & (k <= draws) & (draws - k <= failures)
+    log_pmf = (log_choose(successes, k) + log_choose(failures, numpy.clip(draws - k, 0, failures))
+               - log_choose(population, draws))
+    pmf = numpy.where(possible, numpy.exp(log_pmf), 0.0)
+    return numpy.where(valid, pmf, numpy.nan)
+
+def _tail(k, population, successes, draws, upper):
+    k = numpy.asarray(k, dtype=int)
+    population, successes, draws = numpy.broadcast_arrays(
+        *[ numpy.asarray(arg, dtype=int)[..., None] for arg in (population, successes, draws) ])
+    # The pmf over the whole support, along a new last axis - once per
+    # (population, successes, draws), not once per k as well - turned into
+    # running sums: sums[..., i] is the pmf summed over x >= i for the upper
+    # tail, or over x < i for the lower one. Then each k just picks out its
+    # entry. Summing the tail we want (rather than taking 1 - the other tail)
+    # keeps small tails accurate, and dividing by the sum over the whole
+    # support makes "everything" come out as exactly 1.0 rather than
+    # 0.9999999999999998.
+    top = int(numpy.clip(numpy.minimum(successes, draws), 0, None).max()) if successes.size else 0
+    pmf = _pmf(numpy.arange(top + 1), population, successes, draws)
+    zeros = numpy.zeros(pmf.shape[:-1] + (1,))
+    if upper:
+        sums = numpy.concatenate((numpy.cumsum(pmf[..., ::-1], axis=-1)[..., ::-1], zeros), axis=-1)
+        total = sums[..., :1]
+    else:
+        sums = numpy.concatenate((zeros, numpy.cumsum(pmf, axis=-1)), axis=-1)
+        total = sums[..., -1:]
+    # P(X > k) is sums[k + 1] either way round.
+    index = numpy.clip(k + 1, 0, top + 1)
+    shape = numpy.broadcast(index, sums[..., 0]).shape
+    picked = numpy.take_along_axis(numpy.broadcast_to(sums, shape + sums.shape[-1:]),
+                                   numpy.broadcast_to(index, shape)[..., None], axis=-1)
+    return (picked / numpy.broadcast_to(total, shape + (1,)))[..., 0]
+
+def hypergeometric_pmf(k, population, successes, draws):
+    """ The chance of exactly k successes when drawing `draws` cards from
+        `population` cards, `successes` of which count as successes."""
+    return _result(_pmf(k, population, successes, draws), k, population, successes, draws)
+
+def hypergeometric_cdf(k, population, successes, draws):
+    """ The chance of at most k successes - see hypergeometric_pmf()."""
+    return _result(_tail(k, population, successes, draws, False), k, population, successes, draws)
+
+def hypergeometric_sf(k, population, successes, draws):
+    """ The chance of more than k successes - so "at least k" is
+        hypergeometric_sf(k - 1, ...), just like SciPy."""
+    return _result(_tail(k, population, successes, draws, True), k, population, successes, draws)
+
+def mode(values):
+    """ The most common of `values`; in a tie, the smallest of the most common
+        - which is what scipy.stats.mode() does."""
+    counts = collections.Counter(values)
+    most = max(counts.values())
+    return min(value for value, count in counts.items() if count == most)
+
+def median(values):
+    """ The middle of `values` once they're sorted, or the average of the
+        middle two if there's an even number of them - like numpy.median()."""
+    values = sorted(values)
+    middle = len(values) // 2
+    if len(values) % 2:
+        return float(values[middle])
+    return (values[middle - 1] + values[middle]) / 2.0
@@ -0,0 +1,254 @@
+# -*- coding: utf-8 -*-
+""" Decklist formats. People paste whatever their client exported: MTGO's
+    .dek XML, MTG Arena's "4 Lightning Bolt (M10) 146", the Pokemon TCG
+    Online/Live "* 4 Professor Juniper BLW 98", or just "4 Lightning Bolt".
+    Each of those gets a DecklistFormat here, registered with
+    @register_format. parse_decklist() shows the first few lines to each
+    format in turn and picks the first one that recognizes them, then runs
+    every line through that format's parser alone - so a big import doesn't
+    try every format on every line.
+
+    Parsers turn a line into (count, name, hints), where hints is a dict of
+    whatever else the line said about the card - set code, collector number,
+    catalog ID - for Card constructors to use when telling printings apart.
+"""
+
+import re
+import xml.etree.ElementTree as ElementTree
+
+from vexingarcanix.lib.identifier import parse_line
+
+# How many non-blank lines the formats get to look at when sniffing.
+SNIFF_LINES = 10
+
+# What a parser returns for a line that's part of the format but isn't a card
+# (a section header, a card-type subtotal), as opposed to None for a line it
+# doesn't understand.
+SKIP = object()
+
+registered_formats = []
+
+def register_format(format_class):
+    registered_formats.append(format_class())
+    return format_class
+
+
+class DecklistFormat(object):
+    """ A way of writing down a decklist. Subclasses recognize their format
+        in sniff() and read it in parse() - which, by default, hands each
+        non-blank line to parse_line()."""
+
+    name = None
+
+    def sniff(self, head):
+        """ Whether the first few non-blank lines, `head`, look like this
+            format."""
+        return False
+
+    def parse(self, text):
+        """ Yields (line, card) for each line of `text` that isn't blank or
+            SKIPped, where card is (count, name, hints), or None if the line
+            wasn't understood."""
+        for line in text.splitlines():
+            if line.strip():
+                card = self.parse_line(line)
+                if card is not SKIP:
+                    yield line, card
+
+    def parse_line(self, line):
+        raise NotImplementedError
+
+
+def _plain_card(line):
+    """ identifier.parse_line(), with the hint (if any) in a dict."""
+    card = parse_line(line)
+    if card is None:
+        return None
+    count, name, hint = card
+    return count, name, {'hint': hint} if hint else {}
+
+def _count_and_rest(line):
+    """ Splits "4 Some Card ..." into (4, "Some Card ..."), or returns None."""
+    parts = line.split(None, 1)
+    if len(parts) != 2 or not parts[0].isdigit():
+        return None
+    return int(parts[0]), parts[1]
+
+
+@register_format
+class MTGOFormat(DecklistFormat):
+    """ Magic Online's .dek files:
+
+        <?xml version="1.0" encoding="utf-8"?>
+        <Deck xmlns:xsd=... >
+          <Cards CatID="31505" Quantity="4" Sideboard="false" Name="Lightning Bolt" />
+        </Deck>
+
+        It's XML, so there's no reading it line by line; the whole thing goes
+        to ElementTree at once.
+    """
+
+    name = 'mtgo'
+
+    def sniff(self, head):
+        return head[0].lstrip().startswith((u'<?xml', u'<Deck'))
+
+    def parse(self, text):
+        # A DOCTYPE is the only way to get entity definitions - and with them,
+        # a few hundred bytes that expand into gigabytes. Real .dek files
+        # don't have one.
+        if u'<!DOCTYPE' in text or u'<!ENTITY' in text:
+            yield text, None
+            return
+        if isinstance(text, unicode):
+            # ElementTree wants bytes when there's an encoding declaration.
+            text = text.encode('utf-8')
+        try:
+            deck = ElementTree.fromstring(text)
+        except ElementTree.ParseError:
+            yield text.decode('utf-8'), None
+            return
+        for element in deck.iter('Cards'):
+            line = ElementTree.tostring(element).decode('utf-8').strip()
+            quantity, name = element.get('Quantity', u''), element.get('Name')
+            if not quantity.isdigit() or not name:
+                yield line, None
+                continue
+            hints = {'sideboard': element.get('Sideboard', u'false').lower() == u'true'}
+            if element.get('CatID'):
+                hints['catalog_id'] = element.get('CatID')
+            yield line, (int(quantity), name, hints)
+
+
+@register_format
+class ArenaFormat(DecklistFormat):
+    """ MTG Arena exports: "4 Lightning Bolt (M10) 146", in sections headed
+        "Deck", "Sideboard", "Commander" and so on. Only the Deck section is
+        the deck; everything else is marked as sideboard in the hints."""
+
+    name = 'arena'
+
+    sections = (u'deck', u'sideboard', u'commander', u'companion', u'maybeboard', u'about')
+
+    def sniff(self, head):
+        return any(self._card(line) is not None for line in head)
+
+    def _card(self, line):
+        # Count, name, "(SET)", collector number. Done with splits rather
+        # than a regex, which for this shape would have to backtrack.
+        split = _count_and_rest(line)
+        if split is None:
+            return None
+        count, rest = split
+        rest, _, number = rest.rstrip().rpartition(u' ')
+        rest = rest.rstrip()
+        if not number or not rest.endswith(u')'):
+            return None
+        name, _, set_code = rest[:-1].rpartition(u'(')
+        name = name.strip()
+        if not name or not set_code.isalnum():
+            return None
+        return count, name, {'set': set_code.upper(), 'number': number}
+
+    def parse(self, text):
+        sideboard = False
+        for line in text.splitlines():
+            stripped = line.strip()
+            if not stripped:
+                continue
+            if stripped.lower() in self.sections:
+                sideboard = stripped.lower() != u'deck'
+                continue
+            if stripped.lower().startswith(u'name '):
+                # The deck's name, under "About".
+                continue
+            card = self._card(line)
+            if card is None:
+                # Arena accepts plain lines too, e.g. hand-edited ones.
+                card = _plain_card(line)
+            if card is not None:
+                card[2]['sideboard'] = sideboard
+            yield line, card
+
+
+@register_format
+class PTCGFormat(DecklistFormat):
+    """ Pokemon TCG Online and Live exports. Online's look like
+
+        ****** Pokémon Trading Card Game Deck List ******
+        ##Pokémon - 12
+        * 4 Professor Juniper BLW 98
+
+        and Live's like
+
+        Pokémon: 12
+        4 Professor's Research SVI 189
+        Total Cards: 60
+
+        - either way, a count, a name, a set code and a collector number, plus
+        headers and subtotals that we skip.
+    """
+
+    name = 'ptcg'
+
+    _header = re.compile(u'^(#+|\\*{3,})|^(Pok[eé]mon|Trainer|Energy|Total Cards)\\s*[:-]\\s*\\d+\\s*$',
+                         re.IGNORECASE | re.UNICODE)
+
+    def sniff(self, head):
+        return any(line.lstrip().startswith(u'* ') or self._header.match(line.strip()) for line in head)
+
+    def parse_line(self, line):
+        line = line.strip()
+        if self._header.match(line):
+            return SKIP
+        if line.startswith(u'* '):
+            line = line[2:]
+        split = _count_and_rest(line)
+        if split is None:
+            return None
+        count, rest = split
+        words = rest.split()
+        # Set codes are letters and digits, with a dash for promos
+        # ("PR-SW"); collector numbers are mostly digits, but not always
+        # ("TG12", "SV49").
+        if (len(words) >= 3 and words[-1].isalnum() and words[-2].replace(u'-', u'').isalnum()
+                and words[-2].upper() == words[-2]):
+            return count, u" ".join(words[:-2]), {'set': words[-2], 'number': words[-1]}
+        return _plain_card(line)
+
+
+@register_format
+class PlainFormat(DecklistFormat):
+    """ "4 Lightning Bolt", "4x Lightning Bolt (M10)" and the like - see
+        identifier.parse_line(). Anything goes here, so it's registered last
+        and used when nothing else recognizes the list."""
+
+    name = 'plain'
+
+    def sniff(self, head):
+        return True
+
+    def parse_line(self, line):
+        return _plain_card(line)
+
+
+def sniff(text):
+    """ The registered format that recognizes the start of `text`."""
+    head = []
+    for line in text.splitlines():
+        if line.strip():
+            head.append(line)
+            if len(head) == SNIFF_LINES:
+                break
+    if not head:
+        return registered_formats[-1]
+    for decklist_format in registered_formats:
+        if decklist_format.sniff(head):
+            return decklist_format
+
+def parse_decklist(text):
+    """ Reads a pasted decklist in whatever format it's in. Returns the
+        format, plus an iterator over (line, card) pairs - see
+        DecklistFormat.parse()."""
+    decklist_format = sniff(text)
+    return decklist_format, decklist_format.parse(text)
@@ -2,100 +2,192 @@
     a site visitor, turning it into a list of cards, and identifying what game
     these cards are from.
 """
+import collections
 import re
 
+# The tokens of a decklist line. Each is a single run of one character class,
+# and none of them can overlap with what's allowed to follow it, so matching
+# one never backtracks: the whole line is read in one left-to-right pass.
+_SPACE = re.compile(r'\s*', re.UNICODE)
+_COUNT = re.compile(r'\s*(\d+)', re.UNICODE)
+# Card names can have apostrophes (Ertai's Meddling), dots (Pokegear 3.0),
+# hyphens (Snow-Covered Forest) and spaces in them.
+_NAME = re.compile(r"[\w\s'.-]*", re.UNICODE)
+_HINT = re.compile(r'[\w\s-]*', re.UNICODE)
+_OPENING = re.compile(r'[\s(]*', re.UNICODE)
+_QUOTES = u'\'"'
+
+def _is_word(c):
+    return c.isalnum() or c == u'_'
+
+def parse_line(line):
+    """ Reads one line of a decklist: a count, optionally followed by an 'x'
+        ("4x Foo"), then a card name, optionally in quotes, then optionally a
+        hint in parentheses ("4 Foo (M10)"). Names can be a single letter (N
+        from Pokemon) too. Returns (count, name, hint) - hint being None if
+        there isn't one - or None if the line isn't a card.
+
+        This used to be one big regular expression, but with nested
+        quantifiers it could backtrack for a very long time on a long enough
+        line. This reads the line token by token instead, in linear time.
+    """
+    count = _COUNT.match(line)
+    if not count:
+        return None
+    i = count.end()
+    # Then at least one of: spaces, or an 'x' for "times".
+    separator = i
+    i = _SPACE.match(line, i).end()
+    if line[i:i + 1] == u'x' and (i == separator or line[i + 1:i + 2].isspace()):
+        i = _SPACE.match(line, i + 1).end()
+    if i == separator:
+        return None
+    if line[i:i + 1] and line[i] in _QUOTES:
+        i += 1
+    if not _is_word(line[i:i + 1] or u' '):
+        return None
+    name = _NAME.match(line, i)
+    i = name.end()
+    # Names end with a letter or digit; anything after that (a closing single
+    # quote, trailing spaces) is not part of the name.
+    name = name.group()
+    name_end = len(name)
+    while not _is_word(name[name_end - 1]):
+        name_end -= 1
+    name = name[:name_end]
+    if line[i:i + 1] and line[i] in _QUOTES:
+        i += 1
+    hint = _HINT.match(line, _OPENING.match(line, i).end())
+    i = hint.end()
+    hint = hint.group().strip() or None
+    if line[i:i + 1] == u')':
+        i += 1
+    if line[i:].strip():
+        return None
+    return int(count.group(1)), name, hint
+
 def find_cards(text_blob):
     """ Takes a blob of text as an argument and tries to turn it into a list of
-        (cardname, count) tuples. This card name is only an approximation: Card
+        (count, cardname, hints) tuples, where hints is a dict of anything
+        else the list said about the card (set code, collector number...).
+        The blob can be in any of the formats in lib/formats; for plain lists,
+        see parse_line() for what's understood. This card name is only an
+        approximation: Card
         objects for individual games know how to find their canonical names
         (e.g. to turn 'Mewtwo EX' into "Mewtwo" with the EX flag set, or to
         turn 'Jace TMS' into "Jace, the Mind Sculptor").
-    """
 
-    regex = r'^\s*([0-9]+)[\sx]+?[\'"]?(\w[\w\s\'\.-]+\w|\w+)[\'"]?[\s(]*([\w\s-]+)?\)?$'
-
-    # Attempts to match a number followed by a number followed by a card
-    # name. This should give us the card name in \2, and the number of copies
-    # in \1. Part of why this is so thorny is that it tries to be
-    # user-compassionate - it'll allow a parenthetical 'hints' at the end, and
-    # allows quoting in various ways, "5 Foo" as well as "5x Foo". Also it has
-    # to handle card names with apostrophes (e.g. Ertai's Meddling), with dots
-    # (e.g. Pokegear 3.0), and with one-letter length (e.g. N from
-    # Pokemon). Eventually it'll also have to handle delta cards from Pokemone
-    # because completionist.
+        A card that's listed more than once (ignoring case and spacing) gets
+        one entry, with the counts added up, under the first spelling and the
+        first hints given for it. Sideboard cards aren't in the deck, so they
+        aren't in the list. Lines that aren't cards come back as the second
+        item of the result, so that we can show them to the user.
+    """
+    from vexingarcanix.lib import formats
 
-    found_cards = []
+    found_cards = collections.OrderedDict()
     unknown_cards = []
 
-    for s in text_blob.splitlines():
-        # TODO: Add ability to detect duplicates.
-        if re.search(r'^[\s\n]*$', s):
-            print "Found a blank line."
+    decklist_format, lines = formats.parse_decklist(text_blob)
+    for line, card in lines:
+        if card is None:
+            unknown_cards.append(line)
+            continue
+        count, name, hints = card
+        if hints.pop('sideboard', False):
             continue
-        r = re.search(regex, s)
-        if r:
-            found_cards.append(r.groups())
-            print "Found card: {}".format(r.groups()[0:2])
-            try:
-                hint = r.groups()[2]
-                print "Found a hint: {}".format(hint)
-            except IndexError:
-                hint = None
-                print "Found no hint."
-        else:
-            print "Couldn't identify: {}".format(s)
-            unknown_cards.append(s)
-    return found_cards, unknown_cards
-
-registered_games = []
-
-def register_game(game):
-    registered_games.append(game)
-    return game
-
-def find_game(cards):
-    """ Takes a list of cards and tries to figure out which game they could be a
-        deck for, then returns the appropriate Deck, Card, and Question classes so
-        that the caller can instantiate them later.
+        key = _key(name)
+        if key in found_cards:
+            total, name, first_hints = found_cards[key]
+            count = total + count
+            hints.update(first_hints)
+        found_cards[key] = (count, name, hints)
+    return found_cards.values(), unknown_cards
+
+# Game name -> function that imports that game's module and returns its
+# Deck, Card and Question classes. The imports happen only once a deck turns
+# out to be for that game.
+registered_games = collections.OrderedDict()
+
+# The inverted index find_game() classifies with: canonical card name ->
+# {game name: weight}, for every game that card marks.
+marker_index = {}
+
+def _key(name):
+    return u" ".join(name.split()).lower()
+
+def add_markers(game, names, weight=1.0):
+    """ Adds cards that mark a deck as being for `game` to the index. A card
+        can mark several games (some names are shared); see rank_games() for
+        what happens then. register_game() adds each game's hand-picked
+        markers, and anything that knows more cards - a card catalog, say -
+        can add more."""
+    for name in names:
+        marker_index.setdefault(_key(name), {})[game] = weight
+
+def register_game(game, markers):
+    """ Registers the decorated function as the way to get `game`'s classes,
+        and `markers` as cards that only (or almost only) turn up in that
+        game's decks."""
+    def register(loader):
+        registered_games[game] = loader
+        add_markers(game, markers)
+        return loader
+    return register
+
+GameCandidate = collections.namedtuple('GameCandidate', ['game', 'score', 'confidence'])
+
+def rank_games(cards):
+    """ Scores every registered game against a deck in one pass over the
+        deck's (name, count) pairs: each copy of a marker card adds the
+        marker's weight to its game's score, split evenly between the games
+        if it marks more than one. Returns GameCandidates, best first, with
+        `confidence` being each game's share of the total score; games with
+        no markers in the deck aren't candidates.
+
+        Scoring by copies is what keeps a stray "Marketplace" in a deck with
+        twenty Mountains from making it a Legend of the Five Rings deck. It's
+        linear in the length of the deck, however many games there are.
+    """
+    scores = collections.Counter()
+    for name, count in cards:
+        games = marker_index.get(_key(name))
+        if games:
+            for game, weight in games.items():
+                scores[game] += weight * count / float(len(games))
+    total = sum(scores.values())
+    return [ GameCandidate(game, score, score / total) for game, score in scores.most_common() ]
+
+def find_game(cards, counts=None):
+    """ Takes a list of card names (and, optionally, a matching list of how
+        many copies of each there are) and tries to figure out which game they
+        could be a deck for, then returns the appropriate Deck, Card, and
+        Question classes so that the caller can instantiate them later. See
+        rank_games() for how.
     """
     # FUTURE: Query database for the cards to fingerprint a game.
-    is_game = None
     if not registered_games:
         print "No games registered to check against."
 
-    for game in registered_games:
-        is_game = game(cards)
-        if is_game:
-            Deck, Card, Question = is_game
-            return Deck, Card, Question
-    if not is_game:
-        from vexingarcanix.games import base
-        Deck, Card, Question = base.Deck, base.Card, base.Question
-        return Deck, Card, Question
-
-@register_game
-def _is_pokemon_deck(cards):
-    pokemon_unique = ['darkness energy', 'fighting energy', 'fire energy', 'grass energy', 'lightning energy', 'metal energy', 'psychic energy', 'water energy', 'arceus']
-    for card in cards:
-        if card.lower() in pokemon_unique:
-            from vexingarcanix.games import pokemon as pk
-            return pk.PokemonDeck, pk.PokemonCard, pk.PokemonQuestion
-    return False
-
-@register_game
-def _is_magic_deck(cards):
-    magic_unique = ['plains', 'island', 'swamp', 'mountain', 'forest', 'snow-covered plains', 'snow-covered island', 'snow-covered swamp', 'snow-covered mountain', 'snow-covered forest', 'relentless rats']
-    for card in cards:
-        if card.lower() in magic_unique:
-            from vexingarcanix.games import magicthegathering as mtg
-            return mtg.MTGDeck, mtg.MTGCard, mtg.MTGQuestion
-    return False
-
-@register_game
-def _is_l5r_deck(cards):
-    l5r_unique = ['gifts and favors', 'a favor returned', 'copper mine', 'iron mine', 'gold mine', 'obsidian mine', 'kobune port', 'geisha house', 'marketplace', 'silver mine', 'silk works', 'stables', 'treasure hoard']
-    for card in cards:
-        if card.lower() in l5r_unique:
-            from vexingarcanix.games import l5r
-            return l5r.L5RDeck, l5r.L5RCard, l5r.L5RQuestion
-    return False
+    candidates = rank_games(zip(cards, counts or [1] * len(cards)))
+    if candidates:
+        print "Game candidates: {}".format(", ".join("{} ({:.0%})".format(c.game, c.confidence) for c in candidates))
+        return registered_games[candidates[0].game]()
+    from vexingarcanix.games import base
+    Deck, Card, Question = base.Deck, base.Card, base.Question
+    return Deck, Card, Question
+
+@register_game('pokemon', ['darkness energy', 'fighting energy', 'fire energy', 'grass energy', 'lightning energy', 'metal energy', 'psychic energy', 'water energy', 'arceus'])
+def _pokemon_classes():
+    from vexingarcanix.games import pokemon as pk
+    return pk.PokemonDeck, pk.PokemonCard, pk.PokemonQuestion
+
+@register_game('magicthegathering', ['plains', 'island', 'swamp', 'mountain', 'forest', 'snow-covered plains', 'snow-covered island', 'snow-covered swamp', 'snow-covered mountain', 'snow-covered forest', 'relentless rats'])
+def _magic_classes():
+    from vexingarcanix.games import magicthegathering as mtg
+    return mtg.MTGDeck, mtg.MTGCard, mtg.MTGQuestion
+
+@register_game('l5r', ['gifts and favors', 'a favor returned', 'copper mine', 'iron mine', 'gold mine', 'obsidian mine', 'kobune port', 'geisha house', 'marketplace', 'silver mine', 'silk works', 'stables', 'treasure hoard'])
+def _l5r_classes():
+    from vexingarcanix.games import l5r
+    return l5r.L5RDeck, l5r.L5RCard, l5r.L5RQuestion
@@ -0,0 +1,224 @@
+""" Exact combinatorics for questions about drawing cards. Everything in here
+    works in exact integer arithmetic and converts to a float only at the end,
+    and everything is memoized: a server asking questions about 60-card decks
+    sees the same few thousand (population, successes, draws) combinations
+    over and over, so after warming up these are dictionary lookups. The memos
+    are LRU caches, so the odd 250-card deck doesn't stay in them for the
+    life of the process.
+"""
+
+import numpy
+from vexingarcanix.lib import cache
+
+_binomials = cache.LRUCache(50000)
+_pmfs = cache.LRUCache(20000)
+_all_categories = cache.LRUCache(20000)
+
+def choose(n, k):
+    """ n choose k, as an exact integer. Zero when k is out of range, which
+        saves callers a lot of bounds-checking."""
+    if k < 0 or k > n:
+        return 0
+    return _binomials.get((n, k), lambda: _choose(n, k))
+
+def _choose(n, k):
+    result = 1
+    for i in xrange(min(k, n - k)):
+        result = result * (n - i) // (i + 1)
+    return result
+
+def hypergeometric_pmf(population, successes, draws):
+    """ Returns a tuple whose xth entry is the chance of getting exactly x
+        successes when drawing `draws` cards from `population` cards,
+        `successes` of which count as successes. The tuple runs from x = 0 to
+        x = min(successes, draws).
+    """
+    if not 0 <= successes <= population or not 0 <= draws <= population:
+        raise ValueError("Can't draw {} cards with {} successes from {} cards.".format(draws, successes, population))
+    def compute():
+        total = choose(population, draws)
+        failures = population - successes
+        return tuple(float(choose(successes, x) * choose(failures, draws - x)) / total
+                     for x in xrange(min(successes, draws) + 1))
+    return _pmfs.get((population, successes, draws), compute)
+
+def hypergeometric_range(population, successes, draws, at_least=0, at_most=None):
+    """ The chance of getting between `at_least` and `at_most` successes
+        (inclusive) - see hypergeometric_pmf(). Leaving off at_most means "no
+        upper limit"."""
+    pmf = hypergeometric_pmf(population, successes, draws)
+    if at_most is None:
+        at_most = len(pmf) - 1
+    return sum(pmf[max(at_least, 0):at_most + 1])
+
+def all_categories_chance(category_sizes, population, draws, required_sizes=None, other_required=0, hand_size=0):
+    """ The chance that `draws` cards drawn from `population` cards include
+        at least one card from every one of several disjoint categories. By
+        inclusion-exclusion: every hand, minus the hands that miss some
+        category, plus the ones that miss two, and so on - one binomial per
+        subset of the categories, which is nothing for the handful of
+        categories a question has.
+
+        With `required_sizes`, it's the chance given that the first
+        `hand_size` of those cards include at least one required card
+        (Pokemon's Basics - you redraw the opening hand until it does):
+        `required_sizes[i]` of category i's cards are required, and so are
+        `other_required` cards outside the categories. That's the draws that
+        hit every category, less the ones that do it with no required card
+        in the hand - the same inclusion-exclusion, with the hand also
+        missing the required cards that weren't already left out - over the
+        draws with a required card in the hand.
+    """
+    if sum(category_sizes) > population or not 0 <= draws <= population:
+        raise ValueError("Categories don't fit in a {}-card deck.".format(population))
+    if required_sizes is not None and not 0 <= hand_size <= draws:
+        raise ValueError("Can't look at {} cards for a {}-card hand.".format(draws, hand_size))
+    def compute():
+        if required_sizes is None:
+            total, with_hand = choose(population, draws), 1
+        else:
+            # Counting (hand, rest of the draws) pairs rather than sets of
+            # draws; there are C(draws, hand_size) of them for each set.
+            total, with_hand = choose(population, draws), choose(draws, hand_size)
+            required = sum(required_sizes) + other_required
+            if required == 0:
+                raise ValueError("A hand can't have one of the required cards when the deck has none.")
+            rest = choose(population - hand_size, draws - hand_size)
+            total = total * with_hand - choose(population - required, hand_size) * rest
+        hands = 0
+        for missed in xrange(1 << len(category_sizes)):
+            chosen = [ i for i in xrange(len(category_sizes)) if missed >> i & 1 ]
+            left_out = sum(category_sizes[i] for i in chosen)
+            sign = -1 if len(chosen) % 2 else 1
+            hands += sign * choose(population - left_out, draws) * with_hand
+            if required_sizes is not None:
+                required_left = required - sum(required_sizes[i] for i in chosen)
+                hands -= sign * (choose(population - left_out - required_left, hand_size)
+                                 * choose(population - hand_size - left_out, draws - hand_size))
+        return float(hands) / total
+    key = (tuple(category_sizes), population, draws,
+           tuple(required_sizes) if required_sizes is not None else None, other_required, hand_size)
+    return _all_categories.get(key, compute)
+
+def _binomial_row(n, top):
+    """ C(n, 0) through C(n, top) as a NumPy float array - the coefficients
+        of (1 + t)^n, i.e. the generating function for picking cards out of a
+        pile of n, truncated at degree `top`."""
+    return numpy.array([ float(choose(n, k)) for k in xrange(top + 1) ])
+
+def joint_distribution(category_sizes, population, draws):
+    """ The joint distribution of how many cards from each of several
+        disjoint categories end up in a hand of `draws` cards drawn from
+        `population` cards. Each category of size K is the polynomial
+        sum(C(K, x) t^x), in its own variable; multiplying them together (an
+        outer product, since the variables differ) and then by the polynomial
+        for every card that isn't in a category gives, in one vectorized pass,
+        the number of hands with each combination of counts. Returns an array
+        P where P[x1, x2, ...] is the chance of exactly x1 cards from the first
+        category, x2 from the second, and so on.
+    """
+    rest = population - sum(category_sizes)
+    if rest < 0 or draws > population:
+        raise ValueError("Categories don't fit in a {}-card deck.".format(population))
+    joint = numpy.ones(())
+    for size in category_sizes:
+        joint = numpy.multiply.outer(joint, _binomial_row(size, min(size, draws)))
+    # Cards from outside the categories fill out the rest of the hand.
+    in_categories = numpy.indices(joint.shape).sum(axis=0) if joint.ndim else numpy.zeros((), dtype=int)
+    from_rest = draws - in_categories
+    rest_row = _binomial_row(rest, draws)
+    joint = joint * numpy.where(from_rest >= 0, rest_row[numpy.clip(from_rest, 0, draws)], 0.0)
+    return joint / float(choose(population, draws))
+
+
+def _choose_array(n, k):
+    """ choose() over NumPy arrays of n and k, as floats - zero wherever k is
+        out of range. Reads from a Pascal's triangle built for the occasion,
+        rather than filling the choose() memo with every pair."""
+    n, k = numpy.broadcast_arrays(numpy.asarray(n, dtype=int), numpy.asarray(k, dtype=int))
+    top = max(int(n.max()), 0) if n.size else 0
+    table = numpy.zeros((top + 1, top + 1))
+    table[:, 0] = 1.0
+    for a in xrange(1, top + 1):
+        table[a, 1:] = table[a - 1, 1:] + table[a - 1, :-1]
+    possible = (n >= 0) & (k >= 0) & (k <= n)
+    return numpy.where(possible, table[numpy.clip(n, 0, top), numpy.clip(k, 0, top)], 0.0)
+
+def hand_and_prize_tables(copies, required, population, hand_size=7, prizes=6):
+    """ For every card in a deck at once: the joint distribution of how many
+        of its copies are in the opening hand and how many are set aside
+        afterwards, given that the hand has at least one of the `required`
+        cards (Pokemon's Basics - you redraw until it does, which is the same
+        as only counting the hands that do).
+
+        `copies` is the number of copies of each card and `required` a
+        boolean array, lined up with it, saying which cards count. Returns an
+        array T where T[i, h, p] is the chance of exactly h copies of card i
+        in the hand and p of them set aside.
+
+        For card i with K copies, there are C(K, h) ways to pick its copies in
+        the hand, times the ways to fill the rest of the hand from the other
+        N - K cards - less the ways that leave out every required card, when
+        this card can't be the one (it isn't required, or h is 0). Whatever
+        the hand was, the cards set aside are a plain hypergeometric draw of
+        the N - H cards left, K - h of which are copies.
+    """
+    copies = numpy.asarray(copies, dtype=int)[:, None, None]
+    required = numpy.asarray(required, dtype=bool)[:, None, None]
+    h = numpy.arange(hand_size + 1)[None, :, None]
+    p = numpy.arange(prizes + 1)[None, None, :]
+    total_required = int((copies * required).sum())
+    if total_required == 0:
+        raise ValueError("A hand can't have one of the required cards when the deck has none.")
+    if copies.sum() != population or hand_size + prizes > population:
+        raise ValueError("Can't set aside {} and {} cards from a {}-card deck.".format(hand_size, prizes, population))
+    others_required = total_required - copies * required
+    missing = numpy.where(~required | (h == 0), _choose_array(population - copies - others_required, hand_size - h), 0.0)
+    hands = _choose_array(copies, h) * (_choose_array(population - copies, hand_size - h) - missing)
+    hands = hands / (choose(population, hand_size) - choose(population - total_required, hand_size))
+    set_aside = (_choose_array(copies - h, p) * _choose_array(population - hand_size - copies + h, prizes - p)
+                 / choose(population - hand_size, prizes))
+    return hands * set_aside
+
+
+class JointDistribution(object):
+    """ A joint_distribution() array with the names of its categories
+        attached, so that callers can ask for "2 to 4 lands and at least one
+        2-drop" without counting axes."""
+
+    def __init__(self, labels, table):
+        self.labels = tuple(labels)
+        self.table = table
+
+    def chance(self, ranges):
+        """ `ranges` maps category labels to (at_least, at_most) pairs, or to
+            a bare number meaning "at least this many". at_most can be None for
+            "no limit", and categories that aren't mentioned can be anything.
+        """
+        selection = [ slice(None) ] * len(self.labels)
+        for label, bounds in ranges.items():
+            if not isinstance(bounds, tuple):
+                bounds = (bounds, None)
+            at_least, at_most = bounds
+            selection[self.labels.index(label)] = slice(at_least, None if at_most is None else at_most + 1)
+        return float(self.table[tuple(selection)].sum())
+
+    def given_some(self, labels):
+        """ This distribution, given that at least one card from the
+            categories in `labels` was drawn: the hands with none of them
+            thrown out, and the rest scaled back up to add up to 1."""
+        selection = [ slice(None) ] * len(self.labels)
+        for label in labels:
+            selection[self.labels.index(label)] = 0
+        table = self.table.copy()
+        table[tuple(selection)] = 0.0
+        total = table.sum()
+        if total == 0:
+            raise ValueError("No hand has any of {}.".format(", ".join(labels)))
+        return JointDistribution(self.labels, table / total)
+
+    def expected(self, label):
+        """ The average number of cards from one category."""
+        axis = self.labels.index(label)
+        marginal = self.table.sum(axis=tuple(i for i in xrange(len(self.labels)) if i != axis))
+        return float((numpy.arange(len(marginal)) * marginal).sum())
@@ -0,0 +1,117 @@
+""" Generates questions in the background, off the request thread. When a
+    deck is confirmed, parse_deck hands it to the service, which starts
+    generating a batch of questions for it in a thread pool and stores them
+    keyed by the deck's fingerprint (and the kind of Question that generated
+    them); /ask takes questions from the store and only generates questions
+    inline when the store has nothing for it. Since
+    the store is keyed by fingerprint rather than by session, everyone who
+    uploads the same deck shares it.
+
+    That also means stored questions don't come from the session's own
+    Question instance: each batch starts from a fresh random seed, so the
+    session seed can't reproduce them, and the session's mix of questions
+    only learns about them when they're taken. Instead every stored question
+    is kept with the (name, seed) it was asked with - enough for
+    Question.replay() to rebuild it - and /ask logs that pair and counts it
+    towards the session's mix.
+
+    It's a thread pool rather than a process pool so that the store can live
+    in this process next to the Pyramid app. The expensive parts of question
+    generation are NumPy calls, which release the GIL.
+"""
+
+import collections
+import copy
+import threading
+from multiprocessing.pool import ThreadPool
+
+class QuestionService(object):
+    """ A pool of worker threads plus a store of generated questions. The
+        store holds at most `max_stored` questions for each of at most
+        `max_decks` decks; the deck that was least recently asked about gets
+        dropped first.
+    """
+
+    def __init__(self, workers=2, batch_size=10, max_stored=50, max_decks=200):
+        self.pool = ThreadPool(workers)
+        self.batch_size = batch_size
+        self.max_stored = max_stored
+        self.max_decks = max_decks
+        self.store = collections.OrderedDict()
+        self.pending = set()
+        # Decks whose last batch failed, which we don't keep retrying.
+        self.failed = collections.OrderedDict()
+        self.lock = threading.Lock()
+
+    def start(self, deck, question_class):
+        """ Starts generating a batch of questions for `deck` in the
+            background, unless there's already a batch on the way or the store
+            is already full for this deck."""
+        fingerprint = (deck.fingerprint(), question_class.__name__)
+        with self.lock:
+            if (fingerprint in self.pending or fingerprint in self.failed
+                    or len(self.store.get(fingerprint, ())) >= self.max_stored):
+                return
+            self.pending.add(fingerprint)
+        # The workers get their own copy of the deck and their own Question
+        # instance, so that nothing they do can trip up the request thread
+        # (e.g. by filling in a deck cache while the session is pickling it).
+        self.pool.apply_async(self._generate, (fingerprint, copy.deepcopy(deck), question_class))
+
+    def _generate(self, fingerprint, deck, question_class):
+        questions = []
+        try:
+            questions = question_class().ask_many(deck, self.batch_size, with_origins=True)
+        except Exception as e:
+            print "Background question generation failed for {}: {!r}".format(fingerprint, e)
+            with self.lock:
+                self.failed[fingerprint] = True
+                while len(self.failed) > self.max_decks:
+                    self.failed.popitem(last=False)
+        finally:
+            with self.lock:
+                self.pending.discard(fingerprint)
+                if questions:
+                    stored = self.store.pop(fingerprint, None) or collections.deque(maxlen=self.max_stored)
+                    stored.extend(questions)
+                    self._keep(fingerprint, stored)
+
+    def take(self, deck, count, question_class):
+        """ Up to `count` stored questions about `deck` from `question_class`
+            - possibly none - each as a ((name, seed), question) pair, like
+            ask_many(with_origins=True). Also starts a new batch whenever the
+            store for this deck is running low."""
+        fingerprint = (deck.fingerprint(), question_class.__name__)
+        with self.lock:
+            stored = self.store.pop(fingerprint, None)
+            taken = []
+            if stored is not None:
+                taken = [ stored.popleft() for _ in xrange(min(count, len(stored))) ]
+                # Put it back at the most-recently-used end.
+                self._keep(fingerprint, stored)
+            running_low = stored is None or len(stored) < self.batch_size
+        if running_low:
+            self.start(deck, question_class)
+        return taken
+
+    def _keep(self, fingerprint, stored):
+        # Stores a deck's questions as the most recently used, dropping the
+        # least recently used decks past max_decks. Call with the lock held.
+        self.store[fingerprint] = stored
+        while len(self.store) > self.max_decks:
+            self.store.popitem(last=False)
+
+    def close(self):
+        self.pool.close()
+        self.pool.join()
+
+
+# The application's service, if it has one - see configure().
+service = None
+
+def configure(workers):
+    """ Called from main(). With no workers, there's no service, and /ask
+        generates every question inline."""
+    global service
+    service = QuestionService(workers) if workers > 0 else None
+    return service
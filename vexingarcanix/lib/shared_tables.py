@@ -0,0 +1,144 @@
+""" Probability tables shared between server processes. We run several
+    workers behind the proxy, and without this each of them builds its own
+    copy of every table. Instead, the first worker to build a table publishes
+    it here, and every other worker maps the same bytes.
+
+    Tables are keyed by what they're a function of - a hypergeometric table
+    only depends on the deck size and the number of copies - rather than by
+    deck, so every deck of the same size shares the same handful of tables.
+
+    The store is two files in one directory: an arena file of fixed size that
+    every process memory-maps, and an index of one JSON line per table giving
+    its key, offset, shape and dtype in the arena. Both are append-only.
+    Writers take an exclusive lock on a lock file, write the table's bytes,
+    and only then append its index line; readers keep the index in memory
+    and only read the lines they haven't seen yet, when a lookup misses. Once
+    the arena is full, new tables stop being shared - each process just keeps
+    its own - until the store is reset by deleting the directory while the
+    server is stopped.
+
+    Because nothing in the arena is ever overwritten, get() can hand out
+    read-only views straight into it: no copying, and the memory is the same
+    pages in every process.
+
+    Unix-only, because of fcntl; so is our deployment.
+"""
+
+import contextlib
+import fcntl
+import json
+import mmap
+import os
+import threading
+import numpy
+
+# Entries start on cache-line boundaries.
+_ALIGNMENT = 64
+
+def _align(offset):
+    return -(-offset // _ALIGNMENT) * _ALIGNMENT
+
+class SharedTableStore(object):
+    """ One process's handle on the shared store in directory `path`. Every
+        process should use the same `capacity` (in bytes)."""
+
+    def __init__(self, path, capacity=64 * 1024 * 1024):
+        if not os.path.isdir(path):
+            os.makedirs(path)
+        self.capacity = capacity
+        self.index_path = os.path.join(path, 'index.jsonl')
+        self.lock_path = os.path.join(path, 'lock')
+        # The file lock keeps other processes out; this keeps this process's
+        # threads from reading the index into self.entries at the same time.
+        self._index_lock = threading.Lock()
+        with self._locked():
+            fd = os.open(os.path.join(path, 'tables.dat'), os.O_RDWR | os.O_CREAT, 0644)
+            try:
+                if os.fstat(fd).st_size < capacity:
+                    os.ftruncate(fd, capacity)
+                self.arena = mmap.mmap(fd, capacity)
+            finally:
+                os.close(fd)
+            open(self.index_path, 'a').close()
+        # key -> read-only view, for every index line read so far.
+        self.entries = {}
+        # How far into the index file we've read, and where the next table
+        # goes in the arena.
+        self._read_to = 0
+        self.head = 0
+
+    @contextlib.contextmanager
+    def _locked(self):
+        with open(self.lock_path, 'a') as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def _read_index(self):
+        # Picks up the index lines other processes have appended since we last
+        # looked. Called with _index_lock held.
+        with open(self.index_path, 'rb') as f:
+            f.seek(self._read_to)
+            new = f.read()
+        # A line still being appended has no newline yet; leave it for later.
+        complete = new[:new.rfind('\n') + 1]
+        self._read_to += len(complete)
+        for line in complete.splitlines():
+            key, offset, shape, dtype = json.loads(line)
+            view = numpy.ndarray(tuple(shape), dtype=numpy.dtype(str(dtype)), buffer=self.arena, offset=offset)
+            view.flags.writeable = False
+            self.entries[key] = view
+            self.head = max(self.head, _align(offset + view.nbytes))
+
+    def get(self, key):
+        """ A read-only view of the table published as `key`, or None if
+            there isn't one."""
+        view = self.entries.get(key)
+        if view is None:
+            with self._index_lock:
+                self._read_index()
+                view = self.entries.get(key)
+        return view
+
+    def publish(self, key, array):
+        """ Copies `array` into the arena and returns the shared view of it -
+            or, if somebody beat us to it, theirs. Once the arena is full,
+            arrays are handed straight back, unshared."""
+        array = numpy.ascontiguousarray(array)
+        with self._index_lock:
+            with self._locked():
+                self._read_index()
+                if key in self.entries:
+                    return self.entries[key]
+                head = self.head
+                if head + array.nbytes > self.capacity:
+                    array.flags.writeable = False
+                    return array
+                self.arena[head:head + array.nbytes] = array.tobytes()
+                with open(self.index_path, 'ab') as f:
+                    f.write(json.dumps([key, head, array.shape, array.dtype.str]) + '\n')
+                self._read_index()
+        return self.entries[key]
+
+
+# This process's store, if the application has one - see configure().
+store = None
+
+def configure(path, capacity):
+    """ Called from main(). With no path there's no store, and every process
+        computes its own tables."""
+    global store
+    store = SharedTableStore(path, capacity) if path else None
+    return store
+
+def fetch_or_publish(key, compute):
+    """ The shared table `key`, computing (with `compute()`) and publishing it
+        if nobody has yet."""
+    if store is None:
+        return compute()
+    array = store.get(key)
+    if array is None:
+        array = store.publish(key, compute())
+    return array
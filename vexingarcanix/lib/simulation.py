@@ -0,0 +1,138 @@
+""" Monte Carlo estimates for questions that don't have a practical closed
+    form - mulligans, prize cards plus an opening hand, "draw until you find
+    a copy" with replacement effects, and so on. Rather than each question
+    writing its own shuffle-and-count loop, questions register a predicate
+    here and ask simulate() to run it.
+
+    A predicate is a function that takes a batch of shuffled decks (a 2D NumPy
+    array with one shuffled deck per row, each entry being the position of a
+    card in the CompactDeck's names) and the CompactDeck itself, plus whatever
+    keyword arguments the question passes along, and returns a boolean array
+    saying which of the shuffled decks satisfied it. Predicates work on the
+    whole batch at once: no Python loop over individual shuffles. If the
+    question passes a `depth`, the rows only hold the top `depth` cards of
+    each shuffle - nothing below that gets dealt at all.
+
+    Everything runs in the calling thread. A batch is a handful of NumPy
+    calls, which release the GIL, so the question service's threads can
+    simulate side by side without a process pool.
+"""
+
+import collections
+import math
+import numpy
+
+registered_predicates = {}
+
+def register_predicate(predicate):
+    """ Predicates are looked up by name, so questions can say which one they
+        want without importing it."""
+    registered_predicates[predicate.__name__] = predicate
+    return predicate
+
+Estimate = collections.namedtuple('Estimate', ['probability', 'low', 'high', 'trials'])
+
+# Two-sided z-scores for the confidence levels anyone actually asks for.
+_z_scores = {0.9: 1.6448536269514722, 0.95: 1.959963984540054, 0.99: 2.5758293035489004}
+
+def _z_score(confidence):
+    try:
+        return _z_scores[confidence]
+    except KeyError:
+        from scipy.stats import norm
+        return norm.ppf(0.5 + confidence / 2.0)
+
+def wilson_interval(successes, trials, confidence=0.95):
+    """ The Wilson score interval for a binomial proportion - unlike the
+        textbook p +/- z*sqrt(p(1-p)/n) it behaves itself near 0 and 1, which
+        is exactly where a lot of our questions live."""
+    z = _z_score(confidence)
+    p = successes / float(trials)
+    denominator = 1 + z * z / trials
+    centre = (p + z * z / (2 * trials)) / denominator
+    spread = z * math.sqrt(p * (1 - p) / trials + z * z / (4 * trials * trials)) / denominator
+    return max(0.0, centre - spread), min(1.0, centre + spread)
+
+def shuffle_batch(deck, batch_size, rng, depth=None):
+    """ Shuffles `batch_size` copies of the deck at once: argsorting a matrix
+        of uniform random numbers gives one random permutation per row.
+
+        With `depth`, only the top `depth` cards of each shuffle get dealt,
+        which for a deep deck and a shallow question is much less work (and
+        memory) than shuffling the whole thing. Floyd's algorithm picks which
+        `depth` of the deck's cards end up on top, one column at a time for
+        every row at once, and then argsorting a much smaller matrix puts
+        them in a random order.
+    """
+    cards = numpy.repeat(numpy.arange(len(deck.counts), dtype=numpy.int16), deck.counts)
+    size = len(cards)
+    if depth is None or 2 * depth >= size:
+        order = numpy.argsort(rng.random_sample((batch_size, size)), axis=1)
+        return cards[order[:, :depth]]
+    chosen = numpy.empty((batch_size, depth), dtype=numpy.intp)
+    for column, top in enumerate(xrange(size - depth, size)):
+        pick = rng.randint(0, top + 1, size=batch_size)
+        taken = (chosen[:, :column] == pick[:, None]).any(axis=1)
+        chosen[:, column] = numpy.where(taken, top, pick)
+    order = numpy.argsort(rng.random_sample((batch_size, depth)), axis=1)
+    return cards[numpy.take_along_axis(chosen, order, axis=1)]
+
+def _run_batch(deck, predicate_name, params, batch_size, rng):
+    """ One batch worth of trials."""
+    shuffles = shuffle_batch(deck, batch_size, rng, params.get('depth'))
+    hits = registered_predicates[predicate_name](shuffles, deck, **params)
+    return int(numpy.count_nonzero(hits))
+
+def simulate(deck, predicate, precision=0.005, confidence=0.95, batch_size=20000,
+             max_trials=2000000, seed=None, between_batches=None, **params):
+    """ Estimates how likely a registered predicate is to hold for a shuffled
+        CompactDeck. Runs batches of `batch_size` shuffles until the
+        confidence interval is within `precision` of the estimate on either
+        side, or until `max_trials` shuffles have been done, whichever comes
+        first. Returns an Estimate.
+
+        `between_batches`, if given, gets called before each batch - questions
+        pass their check_deadline(), so that a simulation that's taking too
+        long gets abandoned.
+    """
+    predicate_name = getattr(predicate, '__name__', predicate)
+    if predicate_name not in registered_predicates:
+        raise KeyError("Unregistered predicate: {}".format(predicate_name))
+    rng = numpy.random.RandomState(seed)
+    successes = trials = 0
+    while trials < max_trials:
+        if between_batches is not None:
+            between_batches()
+        successes += _run_batch(deck, predicate_name, params, batch_size, rng)
+        trials += batch_size
+        low, high = wilson_interval(successes, trials, confidence)
+        if (high - low) / 2.0 <= precision:
+            break
+    return Estimate(successes / float(trials), low, high, trials)
+
+@register_predicate
+def copies_in_top(shuffles, deck, cards, depth, at_least=1, at_most=None):
+    """ Between at_least and at_most copies of any of `cards` (a list of
+        names) in the top `depth` cards. Mostly useful for checking the exact
+        engines against."""
+    wanted = numpy.zeros(len(deck.names), dtype=bool)
+    wanted[[ deck.index[name] for name in cards ]] = True
+    found = wanted[shuffles[:, :depth]].sum(axis=1)
+    hits = found >= at_least
+    if at_most is not None:
+        hits &= found <= at_most
+    return hits
+
+@register_predicate
+def gap_of_at_least(shuffles, deck, cards, depth, gap):
+    """ A run of at least `gap` cards in a row, somewhere in the top `depth`,
+        without any of `cards` (a list of names) - a land drought, say. That
+        depends on the order the cards come in, not just on how many of them
+        are near the top, which is why it's simulated."""
+    wanted = numpy.zeros(len(deck.names), dtype=bool)
+    wanted[[ deck.index[name] for name in cards ]] = True
+    position = numpy.arange(depth)
+    # Where the most recent wanted card so far was (-1 for none yet), and so
+    # how long the run without one is at each position.
+    last = numpy.maximum.accumulate(numpy.where(wanted[shuffles[:, :depth]], position, -1), axis=1)
+    return ((position - last) >= gap).any(axis=1)
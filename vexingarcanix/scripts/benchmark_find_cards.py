@@ -0,0 +1,73 @@
+""" Times identifier.find_cards() against the regular expression it replaced,
+    on a large pasted decklist and on a handful of hostile lines - long runs
+    of words with something unparseable at the end, which is what made the old
+    regex backtrack. Also checks that the two agree on the ordinary lines.
+"""
+import os
+import re
+import sys
+import time
+
+from ..lib import identifier
+
+# find_cards() as it was, minus the printing.
+LEGACY_REGEX = r'^\s*([0-9]+)[\sx]+?[\'"]?(\w[\w\s\'\.-]+\w|\w+)[\'"]?[\s(]*([\w\s-]+)?\)?$'
+
+def legacy_find_cards(text_blob):
+    found_cards = []
+    unknown_cards = []
+    for s in text_blob.splitlines():
+        if re.search(r'^[\s\n]*$', s):
+            continue
+        r = re.search(LEGACY_REGEX, s)
+        if r:
+            found_cards.append(r.groups())
+        else:
+            unknown_cards.append(s)
+    return found_cards, unknown_cards
+
+SAMPLE_LINES = [ u"4 Lightning Bolt", u"4x Ertai's Meddling", u'2 "Pokegear 3.0"',
+                 u"1 N", u"12 Snow-Covered Forest (CSP)", u"3 Professor Juniper (BLW)",
+                 u"Sideboard:", u"" ]
+
+def decklist(lines):
+    """ A `lines`-line decklist, with every card a different one so that
+        merging duplicates doesn't shrink the work."""
+    return u"\n".join(SAMPLE_LINES[i % len(SAMPLE_LINES)].replace(u"4 ", u"4 Card{} ".format(i), 1)
+                      for i in xrange(lines))
+
+def hostile(words):
+    return u"4 " + u"a " * words + u"!"
+
+def timed(function, *args):
+    started = time.time()
+    function(*args)
+    return time.time() - started
+
+def usage(argv):
+    cmd = os.path.basename(argv[0])
+    print 'usage: {} [lines] [hostile words]'.format(cmd)
+    print '(example: "{} 20000 2000")'.format(cmd)
+    sys.exit(1)
+
+def main(argv=sys.argv):
+    if len(argv) > 3:
+        usage(argv)
+    lines = int(argv[1]) if len(argv) > 1 else 20000
+    words = int(argv[2]) if len(argv) > 2 else 2000
+
+    for line in SAMPLE_LINES:
+        old = legacy_find_cards(line)[0]
+        new = filter(None, [ identifier.parse_line(line) ])
+        old = [ (int(count), name, hint.strip() or None if hint else None) for count, name, hint in old ]
+        if old != new:
+            print "Disagreement on {!r}: {} vs {}".format(line, old, new)
+
+    text = decklist(lines)
+    print "{} lines:".format(lines)
+    print "    regex:     {:.3f}s".format(timed(legacy_find_cards, text))
+    print "    tokenizer: {:.3f}s".format(timed(identifier.find_cards, text))
+    for n in (words // 4, words // 2, words):
+        print "One hostile line of {} words:".format(n)
+        print "    regex:     {:.3f}s".format(timed(legacy_find_cards, hostile(n)))
+        print "    tokenizer: {:.3f}s".format(timed(identifier.find_cards, hostile(n)))
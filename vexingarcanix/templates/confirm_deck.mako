@@ -8,14 +8,29 @@
     <p>We think that this is a ${game_guess} deck with the following cards: <br>
         <ul id="parsed_cards_list">
             % for card in deck.decklist:
-            <li>${card.count} copies of ${card.name}</li>
+            <li>${card.count} copies of ${card.name}
+            % if corrections.get(card.name):
+                - did you mean
+                % for correction in corrections[card.name]:
+                <form action="/rename" method="post" style="display: inline;">
+                    <input type="hidden" name="card" value="${card.name | h}">
+                    <button type="submit" name="name" value="${correction | h}">${correction}</button>
+                </form>
+                % endfor
+                ?
+            % endif
+            </li>
             % endfor
         </ul>
     % if unknown_cards:
     <p class="unknown_cards">But we couldn't identify the following:
         <ul id="unknown_cards_list">
             % for card in unknown_cards:
-            <li>${card}</li>
+            <li>${card}
+            % if suggestions.get(card):
+                - did you mean ${" or ".join(suggestions[card])}?
+            % endif
+            </li>
             % endfor
         </ul>
     </p>
@@ -1,6 +1,9 @@
 <%inherit file="shell.mako" />
 
 <%block name="main_content">
+    % if error_flash:
+    <div><h2>${error_flash}</h2></div>
+    % endif
     ${self.deck_upload()}
 </%block>
 
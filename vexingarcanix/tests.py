@@ -5,6 +5,16 @@ from pyramid import testing
 
 from .models import DBSession
 
+def sample_deck():
+    """ The 60-card deck the probability tests share: a few cards we ask
+        about, with 4, 3, 2 and 3 copies, and 48 cards of filler."""
+    from .games import base
+    filler = [ base.Card('Filler {}'.format(i), 4) for i in range(12) ]
+    return base.Deck([ base.Card('Foo', 4),
+                       base.Card('Bar', 3),
+                       base.Card('Baz', 2),
+                       base.Card('Quux', 3), ] + filler)
+
 class TestGenericQuestion(unittest.TestCase):
     """ A class for testing the functions in the Question class in
         games/base.py that do their own work, as opposed to the ones that get
@@ -19,13 +29,930 @@ class TestGenericQuestion(unittest.TestCase):
     def tearDown(self):
         testing.tearDown()
 
-    def test_validate_wrong_percent(self):
-        self.assertIsNone(self.my_question._validate_wrong_percent(50.0, 50.0))
-        self.assertIsNone(self.my_question._validate_wrong_percent(49.1, 50.0))
-        self.assertIsNone(self.my_question._validate_wrong_percent(50.9, 50.0))
-        self.assertIsNone(self.my_question._validate_wrong_percent(100.01, 50.0))
-        self.assertEqual(self.my_question._validate_wrong_percent(45.0, 50.0), 45.0)
+    def test_gen_wrong_percent(self):
+        for correct in (0.0, 0.5, 42.0, 99.9, 100.0):
+            wrongs = self.my_question.gen_wrong(correct, 'percent', 4)
+            self.assertEqual(len(set(wrongs)), 4)
+            for wrong in wrongs:
+                # Two decimal places, a real percentage, and not so close to
+                # the right answer that the question's unfair.
+                self.assertEqual("{:.2f}".format(float(wrong)), wrong)
+                self.assertTrue(0.01 <= float(wrong) <= 100.0, wrong)
+                self.assertTrue(abs(float(wrong) - correct) >= 1.0, wrong)
+
+    def test_gen_wrong_int(self):
+        wrongs = self.my_question.gen_wrong(3, 'int', 4, answer_ceiling=60)
+        self.assertEqual(len(set(wrongs)), 4)
+        for wrong in wrongs:
+            self.assertNotEqual(wrong, 3)
+            self.assertTrue(1 <= wrong <= 60, wrong)
+        self.assertNotIn(12, self.my_question.gen_wrong(4, 'int', 4, answer_ceiling=5))
+        # Used to spin forever: nothing in range(1, 2) is wrong.
+        self.assertEqual(len(set(self.my_question.gen_wrong(1, 'int', 4))), 4)
+        # Only three wrong answers exist, so that's what you get.
+        self.assertEqual(sorted(self.my_question.gen_wrong(2, 'int', 4, answer_ceiling=4)), [1, 3, 4])
+
+
+class TestDeckProbabilities(unittest.TestCase):
+    """ Tests for the probability machinery that Deck objects carry around
+        with them.
+    """
+
+    def setUp(self):
+        self.deck = sample_deck()
+
+    def test_probability_table_matches_scipy(self):
+        from scipy.stats import hypergeom
+        table = self.deck.probability_table(4)
+        self.assertEqual(table.shape, (5, 61))
+        self.assertAlmostEqual(table[1, 7], hypergeom.sf(0, 60, 4, 7))
+        self.assertAlmostEqual(self.deck.probability_table(3)[2, 10], hypergeom.sf(1, 60, 3, 10))
+        self.assertEqual(table[0, 0], 1.0)
+        self.assertEqual(table[1, 0], 0.0)
+
+    def test_oversized_decks(self):
+        from .games import base
+        self.assertEqual(base.hypergeometric_table(60, 100).shape, (61, 61))
+        self.assertRaises(ValueError, base.hypergeometric_table, base.MAX_DECK_SIZE + 1, 4)
+
+    def test_probability_table_is_cached(self):
+        self.assertIs(self.deck.probability_table(4), self.deck.probability_table(4))
+        self.assertIsNot(self.deck.probability_table(4), self.deck.probability_table(4, 53))
+
+    def test_caches_stay_out_of_the_session(self):
+        import pickle
+        from .games import base
+        size = len(pickle.dumps(self.deck))
+        self.deck.chance_at_least(4, 7)
+        self.deck.joint_distribution([('foo', ['Foo'])], 7)
+        self.assertEqual(len(pickle.dumps(self.deck)), size)
+        # Another Deck object with the same cards gets the same tables.
+        same = base.Deck([ base.Card(card.name, card.count) for card in self.deck.decklist ])
+        self.assertIs(same.probability_table(4), self.deck.probability_table(4))
+
+    def test_chance_at_least(self):
+        self.assertAlmostEqual(self.deck.chance_at_least(4, 7), 0.3994996257)
+        self.assertAlmostEqual(self.deck.chance_at_least(3, 5, population=53),
+                               1 - (50 * 49 * 48 * 47 * 46) / (53.0 * 52 * 51 * 50 * 49))
+
+
+class TestCompactDeck(unittest.TestCase):
+
+    def setUp(self):
+        from .games import base
+        self.deck = base.Deck([ base.Card('Foo', 4),
+                                base.Card('Bar', 3),
+                                base.Card('Baz', 2), ])
+
+    def test_compact_matches_decklist(self):
+        compact = self.deck.compact()
+        self.assertIs(compact, self.deck.compact())
+        self.assertEqual(compact.names, ('Foo', 'Bar', 'Baz'))
+        self.assertEqual(compact.count('Bar'), 3)
+        self.assertEqual(self.deck.size(), 9)
+
+    def test_copy_and_remove(self):
+        reduced = self.deck.compact().copy()
+        reduced.remove('Foo', 2)
+        reduced.remove_counts([0, 3, 1])
+        self.assertEqual(reduced.size(), 3)
+        self.assertEqual([ (c.name, c.count) for c in reduced.cards() ], [('Foo', 2), ('Baz', 1)])
+        self.assertEqual(self.deck.compact().size(), 9)
+        self.assertRaises(ValueError, reduced.remove, 'Bar')
+
+    def test_remove_random(self):
+        removed, reduced = self.deck.remove_random(5, keep=1)
+        self.assertEqual(removed.sum(), 5)
+        self.assertEqual(reduced.size(), 4)
+        self.assertTrue((reduced.counts >= 1).all())
+        removed, reduced = self.deck.remove_random(6, keep=1)
+        self.assertEqual(list(removed), [3, 2, 1])
+        self.assertEqual(list(reduced.counts), [1, 1, 1])
+        self.assertEqual(self.deck.size(), 9)
+        self.assertRaises(ValueError, self.deck.remove_random, 7, keep=1)
+
+
+class TestProbabilityMemos(unittest.TestCase):
+
+    def test_memos_are_bounded(self):
+        from .lib import probability
+        memo = probability._binomials
+        max_entries, memo.max_entries = memo.max_entries, 10
+        try:
+            for n in range(100):
+                probability.choose(n + 100, 3)
+            self.assertEqual(len(memo), 10)
+        finally:
+            memo.max_entries = max_entries
+        self.assertEqual(probability.choose(60, 7), 386206920)
+
+
+class TestConditionalProbability(unittest.TestCase):
+
+    def setUp(self):
+        self.deck = sample_deck()
+
+    def test_unconditional_matches_scipy(self):
+        from scipy.stats import hypergeom
+        state = self.deck.given()
+        self.assertAlmostEqual(state.chance('Foo', 7), hypergeom.sf(0, 60, 4, 7))
+        self.assertAlmostEqual(state.chance('Foo', 7, exactly=2), hypergeom.pmf(2, 60, 4, 7))
+        self.assertAlmostEqual(state.chance(['Foo', 'Bar'], 7, at_most=1), hypergeom.cdf(1, 60, 7, 7))
+
+    def test_known_cards(self):
+        from scipy.stats import hypergeom
+        state = self.deck.given(hand={'Foo': 1, 'Bar': 2}, played=['Baz'], others=4)
+        self.assertEqual(state.remaining, 52)
+        self.assertEqual(state.copies_left('Foo'), 3)
+        self.assertEqual(state.copies_left(['Bar', 'Baz']), 2)
+        self.assertAlmostEqual(state.chance('Foo', 5, at_least=2), hypergeom.sf(1, 52, 3, 5))
+        self.assertAlmostEqual(state.chance('Foo', 5), self.deck.chance_at_least(3, 5, population=52))
+
+    def test_impossible_state(self):
+        self.assertRaises(ValueError, self.deck.given, hand={'Baz': 3})
+        self.assertRaises(ValueError, self.deck.given, others=61)
+
+    def test_joint_distribution(self):
+        from scipy.stats import hypergeom
+        hands = self.deck.joint_distribution([ ('foo', ['Foo']),
+                                               ('bar or baz', ['Bar', 'Baz']), ], 7)
+        self.assertAlmostEqual(hands.table.sum(), 1.0)
+        self.assertAlmostEqual(hands.chance({'foo': 1}), hypergeom.sf(0, 60, 4, 7))
+        self.assertAlmostEqual(hands.chance({'bar or baz': (1, 2)}),
+                               hypergeom.pmf(1, 60, 5, 7) + hypergeom.pmf(2, 60, 5, 7))
+        # Brute force: sum over exact hands with x Foo and y Bar/Baz.
+        from .lib.probability import choose
+        expected = sum(choose(4, x) * choose(5, y) * choose(51, 7 - x - y)
+                       for x in range(1, 5) for y in range(2, 6) if x + y <= 7) / float(choose(60, 7))
+        self.assertAlmostEqual(hands.chance({'foo': 1, 'bar or baz': 2}), expected)
+        self.assertIs(hands, self.deck.joint_distribution([ ('foo', ['Foo']),
+                                                            ('bar or baz', ['Bar', 'Baz']), ], 7))
+        self.assertRaises(ValueError, self.deck.joint_distribution,
+                          [ ('a', ['Foo']), ('b', lambda card: card.count == 4) ], 7)
+
+
+class TestSimulation(unittest.TestCase):
+
+    def setUp(self):
+        self.deck = sample_deck()
+
+    def test_shuffle_batch_is_a_permutation(self):
+        import numpy
+        from .lib import simulation
+        shuffles = simulation.shuffle_batch(self.deck.compact(), 50, numpy.random.RandomState(1))
+        self.assertEqual(shuffles.shape, (50, 60))
+        for row in shuffles:
+            self.assertEqual(list(numpy.bincount(row)), list(self.deck.compact().counts))
+
+    def test_shuffle_batch_deals_only_the_top(self):
+        import numpy
+        from .games import base
+        from .lib import simulation
+        deck = base.Deck([ base.Card('Card {}'.format(i), 1) for i in range(1000) ]).compact()
+        shuffles = simulation.shuffle_batch(deck, 20000, numpy.random.RandomState(1), depth=20)
+        self.assertEqual(shuffles.shape, (20000, 20))
+        # No card dealt twice...
+        ordered = numpy.sort(shuffles, axis=1)
+        self.assertFalse((ordered[:, 1:] == ordered[:, :-1]).any())
+        # ...and every card as likely as any other in every position - in
+        # particular, the ones Floyd's algorithm reaches last.
+        for column in (0, 19):
+            counts = numpy.bincount(shuffles[:, column], minlength=1000)
+            self.assertLess(abs(counts[-20:].sum() - 400), 100)
+            self.assertLess(abs(counts[:500].sum() - 10000), 400)
+
+    def test_simulation_agrees_with_exact(self):
+        exact = self.deck.given().chance(['Foo', 'Baz'], 7, at_least=2)
+        estimate = self.deck.simulate('copies_in_top', cards=['Foo', 'Baz'], depth=7,
+                                      at_least=2, precision=0.01, seed=5)
+        self.assertTrue(estimate.low - 0.01 <= exact <= estimate.high + 0.01)
+        self.assertTrue((estimate.high - estimate.low) / 2.0 <= 0.01)
+
+    def test_simulation_in_batches(self):
+        estimate = self.deck.simulate('copies_in_top', cards=['Foo'], depth=60,
+                                      precision=0.01, batch_size=1000, seed=2)
+        self.assertEqual(estimate.probability, 1.0)
+        self.assertEqual(estimate.trials % 1000, 0)
+
+    def test_gap_of_at_least(self):
+        # A gap as long as the whole depth means none at all up there.
+        exact = 1 - self.deck.chance_at_least(4, 10)
+        estimate = self.deck.simulate('gap_of_at_least', cards=['Foo'], depth=10, gap=10, precision=0.01, seed=3)
+        self.assertTrue(estimate.low - 0.01 <= exact <= estimate.high + 0.01)
+        # With only four Foos, the top 5 always has something else in it.
+        estimate = self.deck.simulate('gap_of_at_least', cards=['Foo'], depth=5, gap=1, precision=0.01, seed=3)
+        self.assertEqual(estimate.probability, 1.0)
+        # A gap of 8 in the top 9 means none there, or just one - at either
+        # end.
+        state = self.deck.given()
+        exact = state.chance(['Foo', 'Baz'], 9, exactly=0) + state.chance(['Foo', 'Baz'], 9, exactly=1) * 2 / 9.0
+        estimate = self.deck.simulate('gap_of_at_least', cards=['Foo', 'Baz'], depth=9, gap=8, precision=0.005, seed=4)
+        self.assertTrue(estimate.low - 0.005 <= exact <= estimate.high + 0.005, (estimate, exact))
+
+    def test_drought_question(self):
+        from .games import magicthegathering as mtg
+        deck = mtg.MTGDeck([ mtg.MTGCard('Mountain', 20) ] + [ mtg.MTGCard('Spell {}'.format(i), 4) for i in range(10) ])
+        question = mtg.MTGQuestion(seed=1)
+        self.assertIn('basic_land_drought', question.feasible_questions(deck))
+        text, correct, possible, _, _ = question.basic_land_drought(deck)
+        self.assertIn(correct, possible)
+        self.assertEqual(question.replay(deck, 'basic_land_drought', question.question_seed)[1], correct)
+
+    def test_unregistered_predicate(self):
+        self.assertRaises(KeyError, self.deck.simulate, 'no_such_predicate')
+
+    def test_draws_for_chance(self):
+        # With 4 copies left in 53 cards: 21 draws gets you to 87.7%, 22 to
+        # 89.3% and 23 to 90.6%.
+        self.assertEqual(self.deck.draws_for_chance(4, 0.9, drawn=7), 23)
+        self.assertEqual(self.deck.draws_for_chance(4, 0.88, drawn=7), 22)
+        state = self.deck.given(others=7)
+        self.assertTrue(state.chance('Foo', 23) >= 0.9 > state.chance('Foo', 22))
+        # Two copies in 53 cards: only the last card can be left behind.
+        self.assertEqual(self.deck.draws_for_chance(2, 1.0, drawn=7), 52)
+
+
+class TestAsk(unittest.TestCase):
+
+    def setUp(self):
+        from .games import base
+        self.base = base
+        self.question = base.Question()
+        # Only two distinct copy counts: no good for most_likely_top_card.
+        self.deck = base.Deck([ base.Card('Card {}'.format(i), 1) for i in range(58) ] +
+                              [ base.Card('Doubled', 2) ])
+
+    def test_feasibility(self):
+        feasible = self.question.feasible_questions(self.deck)
+        self.assertIn('copies_in_full_deck', feasible)
+        self.assertIn('copies_in_top_five', feasible)
+        self.assertNotIn('most_likely_top_card', feasible)
+
+    def test_ask_skips_infeasible_questions(self):
+        info = self.base.Question.registry['most_likely_top_card']
+        before = info.outcomes['infeasible']
+        for i in range(10):
+            self.question.ask(self.deck)
+        self.assertEqual(info.outcomes['infeasible'], before + 10)
+        self.assertEqual(self.question.asked['most_likely_top_card'], 0)
+        self.assertEqual(sum(self.question.asked.values()), 10)
+
+    def test_ask_falls_back_on_timeout(self):
+        base = self.base
+
+        @base.register_questions
+        class SlowQuestion(base.Question):
+            @base.question(weight=1e12)
+            def slow_question(self, deck):
+                while True:
+                    self.check_deadline()
+
+        question = SlowQuestion()
+        question.ask(self.deck, budget=0.01)
+        self.assertIsNone(question.deadline)
+        self.assertEqual(SlowQuestion.registry['slow_question'].outcomes['timeout'], 1)
+        self.assertNotIn('slow_question', base.Question.registry)
+
+    def test_ask_gives_up_eventually(self):
+        self.question.registry = { 'most_likely_top_card': self.base.Question.registry['most_likely_top_card'] }
+        self.assertRaises(self.base.QuestionInfeasible, self.question.ask, self.deck)
+
+
+class TestQuestionRegistry(unittest.TestCase):
+
+    def test_subclasses_extend_without_mutating(self):
+        from .games import base, magicthegathering, pokemon
+        self.assertIn('basics_count', magicthegathering.MTGQuestion.question_list)
+        self.assertNotIn('basics_count', base.Question.question_list)
+        self.assertNotIn('evolution_line_by_turn', base.Question.question_list)
+        self.assertEqual(pokemon.PokemonQuestion.question_list,
+                         tuple(sorted(base.Question.question_list + ('all_copies_prized', 'basic_energy_in_opening',
+                                                                     'evolution_line_by_turn', 'this_basic_alone'))))
+        info = magicthegathering.MTGQuestion.registry['basics_count']
+        self.assertEqual((info.game, info.difficulty), ('magicthegathering', 'easy'))
+
+    def test_expensive_questions_are_skipped(self):
+        from .games import base
+
+        @base.register_questions
+        class TwoQuestions(base.Question):
+            @base.question()
+            def cheap(self, deck):
+                pass
+            @base.question()
+            def expensive(self, deck):
+                pass
+
+        TwoQuestions.registry = dict((name, TwoQuestions.registry[name]) for name in ('cheap', 'expensive'))
+        for i in range(3):
+            TwoQuestions.registry['expensive'].record('over_budget', 10.0)
+        question = TwoQuestions(seed=1)
+        question.slow_retry_chance = 0
+        for i in range(20):
+            self.assertEqual(question.choose_question().__name__, 'cheap')
+        question.slow_retry_chance = 1
+        chosen = set([ question.choose_question().__name__ for i in range(20) ])
+        self.assertEqual(chosen, set(['cheap', 'expensive']))
+        # A tighter budget than the default rules out questions that only fit
+        # the default.
+        question.slow_retry_chance = 0
+        for i in range(30):
+            TwoQuestions.registry['expensive'].record('ok', 0.2)
+        self.assertEqual(set([ question.choose_question().__name__ for i in range(20) ]), set(['cheap', 'expensive']))
+        for i in range(20):
+            self.assertEqual(question.choose_question(budget=0.05).__name__, 'cheap')
+
+    def test_slow_questions_come_back(self):
+        from .games import base
+        info = base.QuestionInfo('flaky')
+        for i in range(3):
+            info.record('over_budget', 10.0)
+        for i in range(30):
+            info.record('ok', 0.01)
+        self.assertLess(info.average_cost, base.Question.time_budget)
+
+    def test_small_decks(self):
+        from .games import base, magicthegathering as mtg, pokemon
+        for question, deck in [
+                (base.Question(seed=1), base.Deck([ base.Card('Card {}'.format(i), 1 + i % 3) for i in range(6) ])),
+                (mtg.MTGQuestion(seed=1), mtg.MTGDeck([ mtg.MTGCard('Mountain', 6), mtg.MTGCard('Bolt', 4) ])),
+                (pokemon.PokemonQuestion(seed=1), pokemon.PokemonDeck([ pokemon.PokemonCard(name, count) for name, count in
+                    [(u"Charmander", 2), (u"Charmeleon", 2), (u"Charizard", 2), (u"Fire Energy", 4)] ]))]:
+            for i in range(10):
+                self.assertEqual(len(question.ask_many(deck, 3)), 3)
+        self.assertRaises(base.QuestionInfeasible, base.Question().ask, base.Deck([]))
+        # Every other card in the hand has to be something else.
+        forests = base.Deck([ base.Card('Forest', 60) ])
+        self.assertNotIn('copies_in_top_five', base.Question().feasible_questions(forests))
+        self.assertRaises(base.QuestionInfeasible, base.Question(seed=1).copies_in_top_five, forests)
+        self.assertEqual(len(base.Question(seed=1).ask_many(forests, 10)), 10)
+        # With one Plains in hand, the other six can't all be Goblin Guides.
+        goblins = base.Deck([ base.Card('Plains', 30), base.Card('Goblin Guide', 5) ])
+        for seed in range(10):
+            self.assertEqual(base.Question(seed=seed).copies_in_top_five(goblins)[4].name, 'Goblin Guide')
+
+    def test_simulated_questions_time_out(self):
+        from .games import base, magicthegathering as mtg
+        deck = mtg.MTGDeck([ mtg.MTGCard('Forest', 20) ] + [ mtg.MTGCard('Spell {}'.format(i), 4) for i in range(10) ])
+        question = mtg.MTGQuestion(seed=1)
+        question.result_cache.clear()
+        question.deadline = 0
+        self.assertRaises(base.QuestionTimeout, question.basic_land_drought, deck)
+
+    def test_ask_many(self):
+        from .games import base
+        deck = base.Deck([ base.Card('Card {}'.format(i), 1 + i % 4) for i in range(24) ])
+        question = base.Question()
+        questions = question.ask_many(deck, 8)
+        self.assertEqual(len(questions), 8)
+        self.assertEqual(sum(question.asked.values()), 8)
+        # Only the probability tables that the questions asked for got built.
+        base.Deck.tables.clear()
+        question.ask_many(deck, 8)
+        self.assertTrue(set(base.Deck.tables.entries) < set((population, copies)
+                                                            for population in (53, 60) for copies in range(5)))
+
+
+class TestQuestionService(unittest.TestCase):
+
+    def setUp(self):
+        from .games import base
+        from .lib import question_service
+        self.base = base
+        self.service = question_service.QuestionService(workers=1, batch_size=4)
+        self.deck = base.Deck([ base.Card('Card {}'.format(i), 1 + i % 4) for i in range(24) ])
+
+    def tearDown(self):
+        self.service.close()
+
+    def test_fingerprint(self):
+        base = self.base
+        shuffled = base.Deck(list(reversed([ base.Card(c.name, c.count) for c in self.deck.decklist ])))
+        self.assertEqual(self.deck.fingerprint(), shuffled.fingerprint())
+        shuffled.decklist[0].count += 1
+        del shuffled._fingerprint
+        self.assertNotEqual(self.deck.fingerprint(), shuffled.fingerprint())
+        # Case, spacing and listing a card twice don't matter.
+        # (Card 5 has two copies.)
+        split = base.Deck([ base.Card('card  0', 1) ] +
+                          [ base.Card(c.name.upper(), c.count) for c in self.deck.decklist[1:] if c.name != 'Card 5' ] +
+                          [ base.Card('CARD 5', 1), base.Card('card 5', 1) ])
+        self.assertEqual(self.deck.fingerprint(), split.fingerprint())
+
+    def wait_for_batch(self):
+        import time
+        for i in range(100):
+            if not self.service.pending:
+                break
+            time.sleep(0.05)
+
+    def test_background_generation(self):
+        self.service.start(self.deck, self.base.Question)
+        self.wait_for_batch()
+        self.assertEqual(len(self.service.take(self.deck, 6, self.base.Question)), 4)
+        # Emptying the store started another batch.
+        self.wait_for_batch()
+        taken = self.service.take(self.deck, 3, self.base.Question)
+        self.assertEqual(len(taken), 3)
+        # Each one can be rebuilt from its name and seed.
+        for (name, seed), asked in taken:
+            self.assertEqual(self.base.Question().replay(self.deck, name, seed)[:4], asked[:4])
+
+    def test_store_limits(self):
+        from .lib import question_service
+        self.service.close()
+        self.service = question_service.QuestionService(workers=1, batch_size=4, max_stored=6, max_decks=1)
+        # A miss starts a batch, which fills a properly bounded store.
+        self.assertEqual(self.service.take(self.deck, 3, self.base.Question), [])
+        self.wait_for_batch()
+        self.service.start(self.deck, self.base.Question)
+        self.wait_for_batch()
+        fingerprint = (self.deck.fingerprint(), 'Question')
+        self.assertEqual(len(self.service.store[fingerprint]), 6)
+        other = self.base.Deck([ self.base.Card('Other {}'.format(i), 4) for i in range(15) ])
+        self.service.take(other, 3, self.base.Question)
+        self.wait_for_batch()
+        self.assertEqual(self.service.store.keys(), [(other.fingerprint(), 'Question')])
+
+
+
+class TestResultCache(unittest.TestCase):
+
+    def test_lru_cache(self):
+        from .lib.cache import LRUCache
+        cache = LRUCache(2)
+        self.assertEqual(cache.get('a', lambda: 1), 1)
+        self.assertEqual(cache.get('a', lambda: 2), 1)
+        cache.put('b', 2)
+        cache.get('a')
+        cache.put('c', 3)
+        self.assertNotIn('b', cache)
+        self.assertEqual(len(cache), 2)
+        self.assertEqual((cache.hits, cache.misses), (2, 1))
+
+    def test_questions_share_results(self):
+        from .games import base
+        deck = base.Deck([ base.Card('Card {}'.format(i), 1 + i % 4) for i in range(24) ])
+        same_deck = base.Deck([ base.Card(c.name.lower(), c.count) for c in reversed(deck.decklist) ])
+        calls = []
+        question = base.Question()
+        question.result_cache.clear()
+        for d in (deck, same_deck):
+            question.cached(d, 'test_question', 'Card 3', (7,), lambda: calls.append(1))
+        self.assertEqual(len(calls), 1)
+
+
+class TestSharedTables(unittest.TestCase):
+
+    def setUp(self):
+        import tempfile
+        from .lib import shared_tables
+        self.shared_tables = shared_tables
+        self.path = tempfile.mkdtemp()
+
+    def tearDown(self):
+        import shutil
+        self.shared_tables.configure(None, 0)
+        shutil.rmtree(self.path)
+
+    def test_publish_and_read_from_another_store(self):
+        import numpy
+        writer = self.shared_tables.SharedTableStore(self.path, 4096)
+        reader = self.shared_tables.SharedTableStore(self.path, 4096)
+        self.assertIsNone(reader.get('table'))
+        table = numpy.arange(12, dtype=float).reshape(3, 4)
+        writer.publish('table', table)
+        shared = reader.get('table')
+        self.assertTrue((shared == table).all())
+        self.assertFalse(shared.flags.writeable)
+        # A view into the arena, not a copy.
+        self.assertFalse(shared.flags.owndata)
+        # Publishing it again gets the one that's already there.
+        self.assertIs(reader.publish('table', table * 2), shared)
+
+    def test_full_arena_stops_sharing(self):
+        import numpy
+        store = self.shared_tables.SharedTableStore(self.path, 2048)
+        tables = [ store.publish('table{}'.format(i), numpy.full(100, i, dtype=float)) for i in range(3) ]
+        self.assertIsNone(store.get('table2'))
+        # Nothing that was shared got overwritten.
+        for i, table in enumerate(tables):
+            self.assertTrue((table == i).all())
+        self.assertEqual(store.get('table1')[0], 1.0)
+
+    def test_decks_share_probability_tables(self):
+        from .games import base
+        self.shared_tables.configure(self.path, 1024 * 1024)
+        first = base.Deck([ base.Card('Card {}'.format(i), 1 + i % 4) for i in range(24) ])
+        second = base.Deck([ base.Card('Other {}'.format(i), 4) for i in range(15) ])
+        base.Deck.tables.clear()
+        table = first.probability_table(3)
+        self.assertIs(self.shared_tables.store.get('hypergeometric/60/3'), table)
+        base.Deck.tables.clear()
+        # A different deck of the same size reads the same bytes.
+        self.assertIs(second.probability_table(3), table)
+
+
+class TestCombinatorics(unittest.TestCase):
+
+    def test_matches_scipy(self):
+        import numpy
+        from scipy.stats import hypergeom
+        from .lib import combinatorics
+        k, successes, draws = numpy.broadcast_arrays(numpy.arange(-1, 6)[:, None, None],
+                                                     numpy.array([0, 1, 2, 4, 9, 24])[None, :, None],
+                                                     numpy.arange(0, 61, 3)[None, None, :])
+        for ours, theirs in [ (combinatorics.hypergeometric_pmf, hypergeom.pmf),
+                              (combinatorics.hypergeometric_cdf, hypergeom.cdf),
+                              (combinatorics.hypergeometric_sf, hypergeom.sf) ]:
+            # SciPy's own vectorization trips over some of these, so ask it
+            # one at a time.
+            expected = [ theirs(*args) for args in zip(k.flat, [60] * k.size, successes.flat, draws.flat) ]
+            self.assertTrue(numpy.allclose(ours(k, 60, successes, draws).ravel(), expected,
+                                           rtol=1e-9, atol=1e-12))
+        self.assertAlmostEqual(combinatorics.hypergeometric_sf(0, 60, 4, 7), hypergeom.sf(0, 60, 4, 7), places=12)
+        self.assertIsInstance(combinatorics.hypergeometric_pmf(1, 60, 4, 7), float)
+        self.assertEqual(combinatorics.hypergeometric_cdf(numpy.arange(-2, 8), 60, 4, 7).shape, (10,))
+        self.assertEqual(combinatorics.hypergeometric_sf(-1, 60, 4, 7), 1.0)
+        self.assertTrue(numpy.isnan(combinatorics.hypergeometric_pmf(1, 60, 61, 7)))
+
+    def test_mode_and_median(self):
+        from .lib import combinatorics
+        self.assertEqual(combinatorics.mode([4, 4, 1, 1, 2]), 1)
+        self.assertEqual(combinatorics.mode([3, 4, 4]), 4)
+        self.assertEqual(combinatorics.median([4, 1, 3]), 3.0)
+        self.assertEqual(combinatorics.median([4, 1, 3, 2]), 2.5)
+
+
+class TestQuestionSeeds(unittest.TestCase):
+
+    def setUp(self):
+        from .games import base
+        self.base = base
+        self.deck = base.Deck([ base.Card('Card {}'.format(i), 1 + i % 4) for i in range(24) ])
+
+    def presented(self, questions):
+        # Everything but the Card object, which doesn't compare by value.
+        return [ question[:4] for question in questions ]
+
+    def test_same_seed_same_questions(self):
+        first = self.base.Question(seed=1234).ask_many(self.deck, 6)
+        second = self.base.Question().ask_many(self.deck, 6, seed=1234)
+        self.assertEqual(self.presented(first), self.presented(second))
+        other = self.base.Question(seed=4321).ask_many(self.deck, 6)
+        self.assertNotEqual(self.presented(first), self.presented(other))
+
+    def test_replay(self):
+        question = self.base.Question()
+        asked = question.ask(self.deck)
+        name, seed = question.last_asked
+        self.assertEqual(self.base.Question().replay(self.deck, name, seed)[:4], asked[:4])
+        self.assertEqual(self.base.Question().replay(self.deck, 'most_likely_top_card', 99)[:4],
+                         self.base.Question().replay(self.deck, 'most_likely_top_card', 99)[:4])
+
+
+class TestFindCards(unittest.TestCase):
+
+    def test_parse_line(self):
+        from .lib.identifier import parse_line
+        self.assertEqual(parse_line(u"4 Lightning Bolt"), (4, u"Lightning Bolt", None))
+        self.assertEqual(parse_line(u"  4x Lightning Bolt (M10)"), (4, u"Lightning Bolt", u"M10"))
+        self.assertEqual(parse_line(u"4 x Lightning Bolt"), (4, u"Lightning Bolt", None))
+        self.assertEqual(parse_line(u"2 \"Ertai's Meddling\""), (2, u"Ertai's Meddling", None))
+        self.assertEqual(parse_line(u"1 'Pokegear 3.0'"), (1, u"Pokegear 3.0", None))
+        self.assertEqual(parse_line(u"12 Snow-Covered Forest(CSP)"), (12, u"Snow-Covered Forest", u"CSP"))
+        self.assertEqual(parse_line(u"1 N"), (1, u"N", None))
+        self.assertEqual(parse_line(u"4 xylophone"), (4, u"xylophone", None))
+        for line in [u"Sideboard:", u"4", u"4x", u"4Foo", u"4 Foo!", u"4 (Foo)"]:
+            self.assertIsNone(parse_line(line))
+
+    def test_long_hostile_line(self):
+        import time
+        from .lib.identifier import parse_line
+        started = time.time()
+        self.assertIsNone(parse_line(u"4 " + u"a " * 100000 + u"!"))
+        self.assertLess(time.time() - started, 1.0)
+
+    def test_find_cards_merges_duplicates(self):
+        from .lib.identifier import find_cards
+        found, unknown = find_cards(u"4 Foo (A)\n\n2 Bar\nSideboard:\n1 foo\n3x  FOO (B)\n")
+        self.assertEqual(found, [(8, u"Foo", {'hint': u"A"}), (2, u"Bar", {})])
+        self.assertEqual(unknown, [u"Sideboard:"])
+
+
+class TestDecklistFormats(unittest.TestCase):
+
+    def parse(self, text):
+        from .lib import formats
+        decklist_format, lines = formats.parse_decklist(text)
+        return decklist_format.name, list(lines)
+
+    def test_mtgo(self):
+        from .lib.identifier import find_cards
+        text = (u'<?xml version="1.0" encoding="utf-8"?>\n'
+                u'<Deck xmlns:xsd="http://www.w3.org/2001/XMLSchema">\n'
+                u'  <Cards CatID="31505" Quantity="4" Sideboard="false" Name="Lightning Bolt" />\n'
+                u'  <Cards CatID="1" Quantity="20" Sideboard="false" Name="Mountain" />\n'
+                u'  <Cards CatID="2" Quantity="3" Sideboard="true" Name="Smash to Smithereens" />\n'
+                u'</Deck>\n')
+        self.assertEqual(self.parse(text)[0], 'mtgo')
+        found, unknown = find_cards(text)
+        self.assertEqual(found, [(4, u"Lightning Bolt", {'catalog_id': u"31505"}),
+                                 (20, u"Mountain", {'catalog_id': u"1"})])
+        self.assertEqual(unknown, [])
+        self.assertEqual(find_cards(u'<?xml version="1.0"?><!DOCTYPE x [<!ENTITY a "a">]><Deck/>')[0], [])
+
+    def test_arena(self):
+        from .lib.identifier import find_cards
+        text = u"Deck\n4 Lightning Bolt (M10) 146\n20 Mountain (M21) 271\n\nSideboard\n2 Abrade (DOM) 139\n"
+        self.assertEqual(self.parse(text)[0], 'arena')
+        found, unknown = find_cards(text)
+        self.assertEqual(found, [(4, u"Lightning Bolt", {'set': u"M10", 'number': u"146"}),
+                                 (20, u"Mountain", {'set': u"M21", 'number': u"271"})])
+
+    def test_ptcg(self):
+        from .lib.identifier import find_cards
+        online = (u"****** Pok\xe9mon Trading Card Game Deck List ******\n\n##Pok\xe9mon - 4\n\n"
+                  u"* 4 Mewtwo EX NXD 54\n\n##Trainer Cards - 4\n\n* 4 Professor Juniper BLW 98\n")
+        live = u"Pok\xe9mon: 4\n4 Mewtwo EX NXD 54\nTrainer: 4\n4 Professor Juniper BLW 98\n\nTotal Cards: 8\n"
+        for text in (online, live):
+            self.assertEqual(self.parse(text)[0], 'ptcg')
+            found, unknown = find_cards(text)
+            self.assertEqual(found, [(4, u"Mewtwo EX", {'set': u"NXD", 'number': u"54"}),
+                                     (4, u"Professor Juniper", {'set': u"BLW", 'number': u"98"})])
+            self.assertEqual(unknown, [])
+
+    def test_plain_and_hints_reach_cards(self):
+        from .games import base
+        self.assertEqual(self.parse(u"4 Foo\n2 Bar (XY)\n")[0], 'plain')
+        card = base.Card(u"Bar", 2, hint=u"XY")
+        self.assertEqual(card.hints, {'hint': u"XY"})
+
+
+class TestFindGame(unittest.TestCase):
+
+    def test_rank_games(self):
+        from .lib import identifier
+        ranked = identifier.rank_games([(u"Mountain", 20), (u"Marketplace", 1), (u"Lightning Bolt", 4)])
+        self.assertEqual([ candidate.game for candidate in ranked ], ['magicthegathering', 'l5r'])
+        self.assertAlmostEqual(ranked[0].confidence, 20 / 21.0)
+        self.assertEqual(identifier.rank_games([(u"Lightning Bolt", 4)]), [])
+
+    def test_find_game(self):
+        from .lib import identifier
+        from .games import base, magicthegathering, pokemon
+        self.assertEqual(identifier.find_game([u"Mountain", u"Arceus"], [20, 1])[0], magicthegathering.MTGDeck)
+        self.assertEqual(identifier.find_game([u"FIRE  energy", u"Island"], [12, 1])[0], pokemon.PokemonDeck)
+        self.assertEqual(identifier.find_game([u"Foo"])[0], base.Deck)
+
+    def test_shared_markers_split(self):
+        from .lib import identifier
+        try:
+            identifier.add_markers('pokemon', [u"Test Shared Card"])
+            identifier.add_markers('l5r', [u"Test Shared Card"])
+            ranked = identifier.rank_games([(u"Test Shared Card", 2)])
+            self.assertEqual(sorted(c.score for c in ranked), [1.0, 1.0])
+        finally:
+            del identifier.marker_index[u"test shared card"]
+
+
+class TestCanonicalNames(unittest.TestCase):
+
+    def setUp(self):
+        from .lib import canonical
+        self.canonical = canonical
+        self.index = canonical.NameIndex([u"Mountain", u"Island", u"Forest", u"Relentless Rats"],
+                                         {u"Jace TMS": u"Jace, the Mind Sculptor"})
+
+    def test_resolve(self):
+        index = self.index
+        self.assertEqual(index.resolve(u"MOUNTAIN"), u"Mountain")
+        self.assertEqual(index.resolve(u"jace  tms"), u"Jace, the Mind Sculptor")
+        # Typos only get suggested, never corrected by themselves.
+        self.assertIsNone(index.resolve(u"Moutain"))
+        self.assertEqual(index.corrections(u"Moutain"), [u"Mountain"])
+        self.assertEqual(index.corrections(u"Jace, the Mind Sculpter"), [u"Jace, the Mind Sculptor"])
+        # Close, but not a typo: a card we just don't know.
+        self.assertIsNone(index.resolve(u"Forest Bear"))
+        self.assertEqual(index.corrections(u"Forest Bear"), [])
+
+    def test_resolve_all_and_suggest(self):
+        resolved = self.index.resolve_all([u"Islnd", u"Lightning Bolt", u"Islnd", u"island"])
+        self.assertEqual([ r.canonical for r in resolved ], [None, None, None, u"Island"])
+        self.assertEqual([ r.suggestions for r in resolved ], [[u"Island"], [], [u"Island"], []])
+        self.assertEqual(self.index.suggest(u"4 Relentless Rats!"), [u"Relentless Rats"])
+
+    def test_pokemon_suffixes(self):
+        from .games import pokemon
+        resolve = self.canonical.resolve
+        self.assertEqual(resolve('pokemon', u"mewtwo-EX"), u"Mewtwo EX")
+        self.assertEqual(resolve('pokemon', u"Latias (Delta Species)"), u"Latias \u03b4")
+        self.assertEqual(resolve('pokemon', u"Mr Mime"), u"Mr. Mime")
+        self.assertEqual(pokemon.PokemonCard(u"charmander", 2).canonical_name(), u"Charmander")
+        self.assertEqual(pokemon.PokemonCard(u"charmender", 2).canonical_name(), u"charmender")
+
+    def test_resolve_decklist_merges(self):
+        from .games import magicthegathering
+        cards = [(4, u"MOUNTAIN", {}), (16, u"Mountain", {}), (4, u"Moutain", {}), (4, u"Lightning Bolt", {})]
+        self.assertEqual(self.canonical.resolve_decklist('magicthegathering', cards),
+                         [(20, u"Mountain", {}), (4, u"Moutain", {}), (4, u"Lightning Bolt", {})])
+        resolutions = self.canonical.resolve_all('magicthegathering', [ name for _, name, _ in cards ])
+        self.assertEqual(self.canonical.resolve_decklist('magicthegathering', cards, resolutions),
+                         self.canonical.resolve_decklist('magicthegathering', cards))
+
+    def test_real_cards_keep_their_names(self):
+        from .games import pokemon
+        for name in [u"Wiglett", u"Wugtrio", u"Dudunsparce", u"Fairy Energy"]:
+            self.assertEqual(self.canonical.resolve('pokemon', name), name)
+
+
+class TestPokemonSpecies(unittest.TestCase):
+
+    def test_lookups(self):
+        from .games import pokemon
+        store = pokemon.species()
+        self.assertEqual(len(store), 649)
+        row = store.row(u"Charmeleon")
+        self.assertEqual(store.species_id[row], 5)
+        self.assertEqual(store.name(store.parent[row]), u"Charmander")
+        self.assertEqual([ store.name(child) for child in store.children(row) ], [u"Charizard"])
+        self.assertEqual(store.row(u"mr-mime"), store.row(u"Mr. Mime"))
+        self.assertEqual(store.row(u"Mewtwo-EX"), store.row(u"mewtwo"))
+        self.assertIsNone(store.row(u"Professor Juniper"))
+
+    def test_stages(self):
+        from .games import pokemon
+        card = pokemon.PokemonCard(u"Pikachu", 1)
+        for name, basic, stage_one in [(u"Pichu", True, False), (u"Pikachu", True, False),
+                                       (u"Raichu", False, True), (u"Charizard", False, False),
+                                       (u"Professor Juniper", False, False)]:
+            self.assertEqual(card._is_basic_pokemon(name), basic, name)
+            self.assertEqual(card._is_stage_one(name), stage_one, name)
+
+
+class TestEvolutionLines(unittest.TestCase):
+
+    def setUp(self):
+        from .games import pokemon
+        self.pokemon = pokemon
+        self.deck = pokemon.PokemonDeck([ pokemon.PokemonCard(name, count) for name, count in [
+            (u"Charmander", 4), (u"Charmeleon", 2), (u"Charizard", 3), (u"Eevee", 3), (u"Vaporeon", 1),
+            (u"Jolteon", 1), (u"Pidgeotto", 2), (u"Mewtwo EX", 2), (u"Fire Energy", 42)] ])
+
+    def test_lines(self):
+        lines = self.deck.evolution_lines()
+        self.assertEqual([ line.names for line in lines ],
+                         [((u"Charmander",), (u"Charmeleon",), (u"Charizard",)),
+                          ((u"Eevee",), (u"Vaporeon",)), ((u"Eevee",), (u"Jolteon",))])
+        self.assertEqual(lines[0].copies, (4, 2, 3))
+
+    def test_chance_matches_joint_distribution(self):
+        from .lib import probability
+        line = self.deck.evolution_lines()[0]
+        joint = self.deck.joint_distribution([ (stage, names) for stage, names in zip('abc', line.names) ], 10)
+        self.assertAlmostEqual(probability.all_categories_chance(line.copies, 60, 10),
+                               joint.chance({'a': 1, 'b': 1, 'c': 1}))
+        self.assertAlmostEqual(self.deck.evolution_line_chance(line, 60), 1.0)
+
+    def test_chance_after_mulligans(self):
+        import numpy
+        from .lib import probability, simulation
+        deck = self.pokemon.PokemonDeck([ self.pokemon.PokemonCard(name, count) for name, count in [
+            (u"Charmander", 4), (u"Charmeleon", 2), (u"Charizard", 3), (u"Pikachu", 2), (u"Fire Energy", 49)] ])
+        line = deck.evolution_lines()[0]
+        # Redrawing hands without a Basic makes a Charmander in hand likelier.
+        self.assertGreater(deck.evolution_line_chance(line, 8), probability.all_categories_chance(line.copies, 60, 8))
+        # Shuffle, throw away the shuffles whose first 7 cards have no Basic,
+        # and count the rest.
+        compact = deck.compact()
+        shuffles = simulation.shuffle_batch(compact, 200000, numpy.random.RandomState(7), depth=11)
+        shuffles = shuffles[deck.basic_pokemon()[shuffles[:, :7]].any(axis=1)]
+        for cards_seen in (8, 11):
+            seen = shuffles[:, :cards_seen]
+            hits = numpy.ones(len(shuffles), dtype=bool)
+            for stage in line.names:
+                hits &= numpy.in1d(seen, [ compact.index[name] for name in stage ]).reshape(seen.shape).any(axis=1)
+            self.assertAlmostEqual(deck.evolution_line_chance(line, cards_seen), hits.mean(), delta=0.003)
+
+    def test_question(self):
+        question = self.pokemon.PokemonQuestion(seed=3)
+        self.assertIn('evolution_line_by_turn', question.feasible_questions(self.deck))
+        text, correct, possible, _, _ = question.evolution_line_by_turn(self.deck)
+        self.assertIn(correct, possible)
+        self.assertNotIn('evolution_line_by_turn', question.feasible_questions(
+            self.pokemon.PokemonDeck([ self.pokemon.PokemonCard(u"Pikachu", 4) ])))
+
+
+class TestPrizes(unittest.TestCase):
+
+    def setUp(self):
+        from .games import pokemon
+        self.pokemon = pokemon
+        self.deck = pokemon.PokemonDeck([ pokemon.PokemonCard(name, count) for name, count in [
+            (u"Charmander", 4), (u"Charmeleon", 2), (u"Charizard", 2), (u"Fire Energy", 52)] ])
+
+    def test_prize_table(self):
+        from .lib import probability
+        table = self.deck.prize_table()
+        self.assertEqual(table.shape, (4, 8, 7))
+        for total in table.sum(axis=(1, 2)):
+            self.assertAlmostEqual(total, 1.0)
+        # Every hand has a Charmander.
+        self.assertEqual(table[0, 0].sum(), 0.0)
+        # Both Charizards prized means neither was in the hand, and then both
+        # are among the six cards set aside from the other 53.
+        no_charizard = table[2, 0].sum()
+        # A Charmander takes up a slot in every hand, so that's likelier than
+        # it would be without the mulligans.
+        self.assertGreater(no_charizard, probability.hypergeometric_range(60, 2, 7, 0, 0))
+        self.assertAlmostEqual(self.deck.chance_prized(u"Charizard", 2),
+                               no_charizard * probability.hypergeometric_range(53, 2, 6, 2))
+
+    def test_listing_order(self):
+        pokemon = self.pokemon
+        cards = [ (u"Pikachu", 4), (u"Ultra Ball", 2), (u"Fire Energy", 12), (u"Professor Juniper", 42) ]
+        decks = [ pokemon.PokemonDeck([ pokemon.PokemonCard(name, count) for name, count in listing ])
+                  for listing in (cards, list(reversed(cards))) ]
+        self.assertEqual(decks[0].fingerprint(), decks[1].fingerprint())
+        for deck in decks:
+            self.assertAlmostEqual(deck.chance_prized(u"Ultra Ball", 2), decks[0].chance_prized(u"Ultra Ball", 2))
+            self.assertAlmostEqual(deck.opening_hand_distribution().expected('basic energy'),
+                                   decks[0].opening_hand_distribution().expected('basic energy'))
+        self.assertLess(decks[1].chance_prized(u"Ultra Ball", 2), 0.02)
+
+    def test_question(self):
+        question = self.pokemon.PokemonQuestion(seed=5)
+        self.assertIn('all_copies_prized', question.feasible_questions(self.deck))
+        text, correct, possible, _, card = question.all_copies_prized(self.deck)
+        self.assertIn(card.name, (u"Charmeleon", u"Charizard", u"Charmander"))
+        self.assertIn(correct, possible)
+
+
+class TestOpeningHand(unittest.TestCase):
+
+    def setUp(self):
+        from .games import pokemon
+        self.pokemon = pokemon
+        self.deck = pokemon.PokemonDeck([ pokemon.PokemonCard(name, count) for name, count in [
+            (u"Pikachu", 4), (u"Charmander", 2), (u"Charizard", 2), (u"Fire Energy", 12), (u"Water Energy", 4),
+            (u"Double Colorless Energy", 4), (u"Professor Juniper", 32)] ])
+
+    def test_basic_energy(self):
+        hand = self.deck.opening_hand_distribution()
+        self.assertAlmostEqual(hand.chance({'basic pokemon': (0, 0)}), 0.0)
+        # Hands with no Basics tend to have more of everything else.
+        self.assertLess(hand.expected('basic energy'), 7 * 16 / 60.0)
+        # All hands, less the ones without Basics (whose 7 cards come from
+        # the 54 that aren't Basics), over the hands that are left.
+        from .lib.probability import choose
+        no_basics = float(choose(54, 7)) / choose(60, 7)
+        expected = (7 * 16 / 60.0 - no_basics * 7 * 16 / 54.0) / (1 - no_basics)
+        self.assertAlmostEqual(hand.expected('basic energy'), expected)
+
+    def test_this_basic_alone(self):
+        hand = self.deck.opening_hand_distribution(u"Pikachu")
+        alone = hand.chance({'other basics': (0, 0)})
+        # At least one Pikachu and no Charmander, over at least one of either.
+        from .lib.probability import choose
+        self.assertAlmostEqual(alone, float(choose(58, 7) - choose(54, 7)) / (choose(60, 7) - choose(54, 7)))
+
+    def test_questions(self):
+        question = self.pokemon.PokemonQuestion(seed=2)
+        self.assertIn('this_basic_alone', question.feasible_questions(self.deck))
+        for name in ('basic_energy_in_opening', 'this_basic_alone'):
+            text, correct, possible, _, _ = getattr(question, name)(self.deck)
+            self.assertIn(correct, possible)
+            self.assertEqual(len(set(possible)), 5)
+
+
+class TestEnergyClassifier(unittest.TestCase):
+
+    def setUp(self):
+        from .games import pokemon
+        self.pokemon = pokemon
+
+    def test_classes(self):
+        pokemon = self.pokemon
+        for name, classes in [(u"Fire Energy", pokemon.BASIC_ENERGY), (u"WATER  energy", pokemon.BASIC_ENERGY),
+                              (u"Double Colorless Energy", pokemon.SPECIAL_ENERGY),
+                              (u"Holon Energy FF", pokemon.SPECIAL_ENERGY | pokemon.HOLON_ENERGY),
+                              (u"\u03b4 Rainbow Energy", pokemon.SPECIAL_ENERGY | pokemon.DELTA_ENERGY),
+                              (u"Rainbow Energy (Delta Species)", pokemon.SPECIAL_ENERGY | pokemon.DELTA_ENERGY),
+                              (u"Energy Switch", 0), (u"Charizard", 0)]:
+            self.assertEqual(pokemon.classify_energy(name), classes, name)
+
+    def test_cached_per_canonical_name(self):
+        pokemon = self.pokemon
+        pokemon.energy_cache.clear()
+        card = pokemon.PokemonCard(u"fire energy", 10)
+        self.assertTrue(card._is_basic_energy(card.name))
+        self.assertTrue(card._is_basic_energy(u"Fire  Energy"))
+        self.assertFalse(card._is_special_energy(card.name))
+        self.assertEqual((pokemon.energy_cache.misses, pokemon.energy_cache.hits), (1, 2))
 
-    def test_validate_wrong_int(self):
-        self.assertIsNone(self.my_question._validate_wrong_int(4, 4))
-        self.assertIsNone(self.my_question._validate_wrong_int(12, 4, answer_ceiling=5))
+    def test_decklist(self):
+        pokemon = self.pokemon
+        deck = pokemon.PokemonDeck([ pokemon.PokemonCard(name, count) for name, count in [
+            (u"Pikachu", 4), (u"Lightning Energy", 10), (u"Double Colorless Energy", 4)] ])
+        self.assertEqual(list(deck.energy_classes()), [0, pokemon.BASIC_ENERGY, pokemon.SPECIAL_ENERGY])
+        self.assertIs(deck.energy_classes(), deck.energy_classes())
@@ -5,16 +5,27 @@ from .models import (
     DBSession,
     )
 
-from vexingarcanix.lib import identifier
+from vexingarcanix.lib import canonical, identifier, question_service
 from vexingarcanix.games import base
+import collections
 import random
 
+# How many questions /ask generates at a time. Most requests then just take
+# the next question off the session's queue, and the occasional expensive
+# question gets paid for alongside cheap ones instead of on its own.
+QUESTION_PREFETCH = 5
+
+def _game_deck(deck, game_classes):
+    # Rebuild a generic Deck as a Deck for the game we think it's from.
+    CardClass = game_classes['card']
+    return game_classes['deck']([ CardClass(card.name, card.count, **card.hints) for card in deck.decklist ])
+
 @view_config(route_name='give_deck', renderer='frontpage.mako')
 def deck_ingest(request):
     # Send the user a page that asks them for a deck, start up a session for them.
-    for key in ['current_deck_object', 'last_given_answer', 'game_confirmed', 'question_generator']:
+    for key in ['current_deck_object', 'last_given_answer', 'game_confirmed', 'question_generator', 'question_queue']:
         request.session[key] = None
-    return {"foo": "bar"}
+    return {'error_flash': request.session.pop('error_flash', None)}
 
 @view_config(route_name='check_deck', renderer='confirm_deck.mako', request_method='POST')
 def parse_deck(request):
@@ -22,7 +33,8 @@ def parse_deck(request):
     raw_card_list = request.POST.get('deck_list_area')
     identified_cards, unknown_cards = identifier.find_cards(raw_card_list)
 
-    DeckClass, CardClass, QuestionClass = identifier.find_game([card[1] for card in identified_cards])
+    DeckClass, CardClass, QuestionClass = identifier.find_game([ name for _, name, _ in identified_cards ],
+                                                                [ count for count, _, _ in identified_cards ])
     if DeckClass.game_name:
         request.session['game_guess'] = getattr(DeckClass, 'game_name')
         print u"Our guess: a {} deck".format(getattr(DeckClass, 'game_name'))
@@ -33,15 +45,72 @@ def parse_deck(request):
                                         'question' : QuestionClass,
                                         }
 
-    card_object_list = [ base.Card(card[1], card[0]) for card in identified_cards ]
+    # Card names as the game knows them, with "did you mean"s for the lines
+    # we couldn't read at all, and for names that are a typo or two from one
+    # we know. Those stay as they were typed unless the user picks one of the
+    # corrections - see rename_card().
+    game = CardClass.short_game_name
+    resolutions = canonical.resolve_all(game, [ name for _, name, _ in identified_cards ])
+    corrections = dict((resolution.name, resolution.suggestions) for resolution in resolutions
+                       if resolution.suggestions)
+    identified_cards = canonical.resolve_decklist(game, identified_cards, resolutions)
+    request.session['unknown_cards'] = unknown_cards
+    request.session['suggestions'] = dict((line, canonical.suggest(game, line)) for line in unknown_cards)
+    request.session['corrections'] = corrections
+    card_object_list = [ base.Card(name, count, **hints) for count, name, hints in identified_cards ]
     deck_object = base.Deck(card_object_list)
+    if deck_object.size() > base.MAX_DECK_SIZE:
+        request.session['error_flash'] = "That's {} cards - we can only handle decks of up to {}.".format(
+            deck_object.size(), base.MAX_DECK_SIZE)
+        return HTTPFound('/')
+    return _confirm_deck(request, deck_object)
+
+def _confirm_deck(request, deck_object):
+    # Make this the session's deck and show it to the user to confirm.
     request.session['current_deck_object'] = deck_object
+    request.session['question_queue'] = None
+
+    # Get a head start on questions while the user reads the confirmation
+    # page. /ask builds the same game-specific deck, so the fingerprints match.
+    service = question_service.service
+    if service:
+        game_classes = request.session['game_classes']
+        if game_classes['deck'].game_name:
+            service.start(_game_deck(deck_object, game_classes), game_classes['question'])
+        else:
+            service.start(deck_object, base.Question)
 
     return {'deck': deck_object,
             'game_guess': request.session['game_guess'],
-            'unknown_cards': unknown_cards,
+            'unknown_cards': request.session['unknown_cards'],
+            'suggestions': request.session['suggestions'],
+            'corrections': request.session['corrections'],
             }
 
+@view_config(route_name='rename_card', renderer='confirm_deck.mako', request_method='POST')
+def rename_card(request):
+    # The user picked one of the corrections we offered for a card name on
+    # the confirmation page: rename the card (merging it with any copies
+    # already under that name) and show the deck again.
+    deck_object = request.session.get('current_deck_object', None)
+    if deck_object is None:
+        return HTTPFound('/')
+    old_name, new_name = request.POST.get('card'), request.POST.get('name')
+    corrections = request.session.get('corrections', None) or {}
+    if new_name not in corrections.get(old_name, ()):
+        return _confirm_deck(request, deck_object)
+    merged = collections.OrderedDict()
+    for card in deck_object.decklist:
+        name = new_name if card.name == old_name else card.name
+        if name in merged:
+            merged[name].count += card.count
+        else:
+            merged[name] = base.Card(name, card.count, **card.hints)
+    corrections = dict(corrections)
+    del corrections[old_name]
+    request.session['corrections'] = corrections
+    return _confirm_deck(request, base.Deck(merged.values()))
+
 @view_config(route_name='show_question', renderer='questions.mako')
 def generate_question(request):
     # Generate a question and answer, display the question, store the answer to
@@ -63,13 +132,10 @@ def generate_question(request):
             CardClass = request.session['game_classes']['card']
             QuestionClass = request.session['game_classes']['question']
         except KeyError:
-            requestion.session['error_flash'] = "Something broke while trying to get our game-specific classes!"
+            request.session['error_flash'] = "Something broke while trying to get our game-specific classes!"
             return HTTPFound('/')
-        new_decklist = []
         print u"Constructing a {} deck ...".format(DeckClass.game_name)
-        for card in current_deck.decklist:
-            new_decklist.append(CardClass(card.name, card.count))
-        new_deck = DeckClass(new_decklist)
+        new_deck = _game_deck(current_deck, request.session['game_classes'])
         current_deck = request.session['current_deck_object'] = new_deck
 
     # Set up a Question instance.
@@ -80,6 +146,10 @@ def generate_question(request):
         else:
             print u"Instantiating a {} question generator...".format(DeckClass.game_name)
             question_generator = QuestionClass()
+        # Logged so that the questions this session generates itself can be
+        # reproduced later. (Questions from the background service aren't;
+        # their own seeds get logged as they're asked, below.)
+        print "Question seed: {}".format(question_generator.seed)
         request.session['question_generator'] = question_generator
 
     # Record information about the last question.
@@ -87,9 +157,32 @@ def generate_question(request):
     last_correct_answer = request.session.get('last_correct_answer', None)
     last_was_correct = request.session.get('last_was_correct', None)
 
-    # Generate a new question.
-    current_question = request.session['question_generator'].choose_question()
-    question_string, correct, possible_answers, answer_suffix, chosen_card = current_question(current_deck)
+    # Take the next question off the queue, refilling it if it's empty -
+    # from the background question service if it has anything for this deck,
+    # otherwise right here. ask_many() keeps one bad question from tying up
+    # this thread: see Question.ask().
+    question_queue = request.session.get('question_queue', None)
+    if not question_queue:
+        question_generator = request.session['question_generator']
+        service = question_service.service
+        question_queue = []
+        if service:
+            question_queue = service.take(current_deck, QUESTION_PREFETCH, type(question_generator))
+            # Asking them ourselves would have counted them towards the mix.
+            for (name, seed), _ in question_queue:
+                question_generator.asked[name] += 1
+        if not question_queue:
+            try:
+                question_queue = question_generator.ask_many(current_deck, QUESTION_PREFETCH, with_origins=True)
+            except base.QuestionInfeasible:
+                request.session['error_flash'] = ("We couldn't come up with any questions about that deck. "
+                                                  "Is the whole decklist there?")
+                return HTTPFound('/')
+    (name, seed), (question_string, correct, possible_answers, answer_suffix, chosen_card) = question_queue.pop(0)
+    request.session['question_queue'] = question_queue
+    # Enough to rebuild this question with Question.replay().
+    request.session['question_origin'] = (name, seed)
+    print "Question: {} (seed {})".format(name, seed)
 
     # Temporary hack to work around the fact that chosen_card might be a Card
     # object or might be a string.